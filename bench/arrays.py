@@ -0,0 +1,117 @@
+"""Массивы `array integer of`: память и скорость доступа.
+
+Сравнивает IntArray (src/arrays.py) со списком Python, как было раньше:
+память после заполнения n различными числами (tracemalloc) и время
+n записей и чтений через Interpreter.store_index/load_index. Затем
+гоняет заполняющий цикл на самом языке и те же действия встроенными
+операциями над массивом целиком.
+
+    python bench/arrays.py [--size N] [--script-size M] [--engine E]
+"""
+import argparse
+import contextlib
+import gc
+import io
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.arrays import IntArray  # noqa: E402
+from src.interpreter import Interpreter, Robot  # noqa: E402
+from src.lexer import get_lexer  # noqa: E402
+from src.parser import get_parser  # noqa: E402
+
+SCRIPT = """
+array integer of counts ({size});
+i := 0;
+while (i < {size}) {{
+    counts[i] := i * 3;
+    i := i + 1;
+}}
+print(?counts);
+"""
+
+# То же заполнение и свёртка встроенными операциями над всем массивом
+BULK_SCRIPT = """
+array integer of counts ({size});
+counts[] := 3;
+doubled := counts * 2 + 1;
+counts[0:{half}] := doubled[{half}:{size}];
+print(sum(counts) + max(doubled));
+"""
+
+
+def declare(kind: str, size: int) -> Interpreter:
+    interp = Interpreter(Robot([[0]]))
+    if kind == "list":
+        interp.global_env["a"] = [0] * size
+    else:
+        interp.declare_array("a", size)
+    return interp
+
+
+def measure(kind: str, size: int):
+    gc.collect()
+    tracemalloc.start()
+    interp = declare(kind, size)
+    array = interp.global_env["a"]
+    for i in range(size):
+        array[i] = i * 3 + 1000
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del interp, array
+
+    interp = declare(kind, size)
+    store_index, load_index = interp.store_index, interp.load_index
+    t0 = time.perf_counter()
+    for i in range(size):
+        store_index("a", i, i * 3 + 1000)
+    t_store = time.perf_counter() - t0
+    array = interp.global_env["a"]
+    assert kind == "list" or type(array) is IntArray
+    t0 = time.perf_counter()
+    total = 0
+    for i in range(size):
+        total += load_index(array, i)
+    t_load = time.perf_counter() - t0
+    print(
+        f"{kind:<8} {memory / size:6.1f} bytes/elem"
+        f"  store {size / t_store / 1e6:6.2f} M/s"
+        f"  load {size / t_load / 1e6:6.2f} M/s"
+    )
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--size", type=int, default=10**7)
+    arg_parser.add_argument("--script-size", type=int, default=10**5)
+    arg_parser.add_argument("--engine", default="closure")
+    args = arg_parser.parse_args()
+
+    print(f"n = {args.size}")
+    for kind in ("list", "IntArray"):
+        measure(kind, args.size)
+
+    for name, script, size in (
+        ("loop", SCRIPT, args.script_size),
+        ("bulk", BULK_SCRIPT, args.size),
+    ):
+        code = script.format(size=size, half=size // 2)
+        tree = get_parser().parse(code, lexer=get_lexer())
+        interp = Interpreter(Robot([[0]]))
+        t0 = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            interp.interpret(tree, engine=args.engine)
+        elapsed = time.perf_counter() - t0
+        print(
+            f"{name:<8} {size} elements ({args.engine})"
+            f"  {size / elapsed / 1e6:6.2f} M/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
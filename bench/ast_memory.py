@@ -0,0 +1,76 @@
+"""Память, занимаемая AST: байт на узел.
+
+Разбирает сгенерированный скрипт и через tracemalloc меряет, сколько
+памяти удерживает готовое дерево (вместе со строками, числами и
+списками операторов), затем делит на число узлов.
+
+    python bench/ast_memory.py [--functions N] [--frontend ply|pratt]
+"""
+import argparse
+import gc
+import sys
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.lexer import get_lexer  # noqa: E402
+from src.logic import AST  # noqa: E402
+from src.parser import get_parser  # noqa: E402
+from src.visitor import NodeVisitor  # noqa: E402
+
+
+def generated_program(functions: int) -> str:
+    parts = []
+    for i in range(functions):
+        parts.append(
+            f"function f{i}(a, b) {{\n"
+            f"    x := a * {i} + b - (a / 2);\n"
+            f"    while (x < {i * 10}) {{ x := x + 1; }}\n"
+            f'    if (x > 5) {{ print(x); }} else {{ print("small"); }}\n'
+            f"    top;\n"
+            f"}}\n"
+            f"y := f{i}({i}, -2) * (3 + y);\n"
+        )
+    return "y := 0;\n" + "".join(parts)
+
+
+def count_nodes(node) -> int:
+    if isinstance(node, list):
+        return sum(count_nodes(n) for n in node)
+    if not isinstance(node, AST):
+        return 0
+    return 1 + sum(
+        count_nodes(child)
+        for child in NodeVisitor().node_to_dict(node).values()
+    )
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--functions", type=int, default=5000)
+    arg_parser.add_argument("--frontend", default="ply")
+    args = arg_parser.parse_args()
+
+    code = generated_program(args.functions)
+    parser = get_parser(args.frontend)
+    parser.parse("x := 1;", lexer=get_lexer())  # прогрев таблиц и кэшей
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    tree = parser.parse(code, lexer=get_lexer())
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    nodes = count_nodes(tree)
+    print(f"source      {len(code) / 1024:10.1f} KiB")
+    print(f"nodes       {nodes:10d}")
+    print(f"retained    {retained / 1024 / 1024:10.2f} MiB")
+    print(f"bytes/node  {retained / nodes:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Холодный старт: время от импорта интерпретатора до первого оператора.
+
+Каждый замер - отдельный процесс Python. Режим "cached" - обычный путь
+(get_parser/get_lexer), режим "legacy" - прежний: yacc.yacc() с проверкой
+сигнатуры и parse(debug=True).
+
+    python bench/cold_start.py [--runs N]
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+PROBE = r"""
+import io, sys, time
+t0 = time.perf_counter()
+from src.interpreter import Interpreter, Robot
+from src.lexer import get_lexer
+import src.lexer
+import src.parser
+code = "print(1);"
+if sys.argv[1] == "legacy":
+    import ply.lex as lex
+    import ply.yacc as yacc
+    parser = yacc.yacc(module=src.parser, write_tables=False)
+    sys.stderr = io.StringIO()
+    tree = parser.parse(code, lexer=lex.lex(module=src.lexer), debug=True)
+    sys.stderr = sys.__stderr__
+else:
+    tree = src.parser.get_parser().parse(code, lexer=get_lexer())
+sys.stdout = io.StringIO()
+Interpreter(Robot([[0]])).interpret(tree)
+sys.stdout = sys.__stdout__
+print(time.perf_counter() - t0)
+"""
+
+
+def measure(mode: str, runs: int) -> list[float]:
+    times = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", PROBE, mode],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        times.append(float(out.stdout.strip().splitlines()[-1]))
+    return times
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--runs", type=int, default=10)
+    args = arg_parser.parse_args()
+
+    for mode in ("legacy", "cached"):
+        times = measure(mode, args.runs)
+        print(
+            f"{mode:<8} median {statistics.median(times) * 1000:8.2f} ms"
+            f"  min {min(times) * 1000:8.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Сравнение фронтендов: PLY (src/parser.py) и Pratt (src/pratt.py).
+
+Сначала проверяет, что на всех test/*.test оба фронтенда строят
+одинаковые деревья или бросают одинаковые ошибки, затем меряет
+пропускную способность в токенах в секунду на большом сгенерированном
+скрипте.
+
+    python bench/frontend.py [--repeat N]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.lexer import get_lexer  # noqa: E402
+from src.logic import AST  # noqa: E402
+from src.parser import get_parser  # noqa: E402
+from src.pratt import tokenize  # noqa: E402
+from src.visitor import NodeVisitor  # noqa: E402
+
+
+def dump(node):
+    if isinstance(node, list):
+        return [dump(n) for n in node]
+    if isinstance(node, AST):
+        fields = NodeVisitor().node_to_dict(node)
+        return type(node).__name__, {k: dump(v) for k, v in fields.items()}
+    return node
+
+
+def parse(frontend: str, code: str):
+    try:
+        return dump(get_parser(frontend).parse(code, lexer=get_lexer()))
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+
+
+def check_parity() -> list[str]:
+    valid = []
+    for path in sorted((ROOT / "test").glob("*.test")):
+        code = path.read_text()
+        expected = parse("ply", code)
+        if parse("pratt", code) != expected:
+            raise SystemExit(f"frontends disagree on {path.name}")
+        print(f"parity ok: {path.name}")
+        if not isinstance(expected, str):
+            valid.append(code)
+    return valid
+
+
+def throughput(frontend: str, code: str, n_tokens: int) -> float:
+    parser = get_parser(frontend)
+    start = time.perf_counter()
+    parser.parse(code, lexer=get_lexer())
+    return n_tokens / (time.perf_counter() - start)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--repeat", type=int, default=300)
+    args = arg_parser.parse_args()
+
+    code = "\n".join(check_parity()) * args.repeat
+    n_tokens = len(tokenize(code)[0]) - 1
+    print(f"script: {len(code)} bytes, {n_tokens} tokens")
+    for frontend in ("ply", "pratt"):
+        rate = throughput(frontend, code, n_tokens)
+        print(f"{frontend:<6} {rate:12,.0f} tokens/s")
+
+
+if __name__ == "__main__":
+    main()
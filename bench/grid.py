@@ -0,0 +1,146 @@
+"""Карта робота: двумерный список против Grid и BitGrid (src/grid.py).
+
+Для квадратной карты size x size со стенами в каждом седьмом столбце
+(проход - в каждой седьмой строке) меряет время построения, память (tracemalloc), загрузку файла
+карты через mmap, скорость проверок Robot.move_right/move_bottom и
+Robot.goto: первый маршрут к доку (поиск в ширину) и повторные, и
+проезд до стены: шагами move_right против Robot.slide.
+
+    python bench/grid.py [--size N] [--moves M]
+"""
+import argparse
+import contextlib
+import gc
+import io
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.grid import BitGrid, Grid  # noqa: E402
+from src.interpreter import Robot  # noqa: E402
+
+
+def is_wall(x: int, y: int) -> bool:
+    return x % 7 == 3 and y % 7 != 6
+
+
+def build_rows(size: int):
+    return [[int(is_wall(x, y)) for x in range(size)] for y in range(size)]
+
+
+def build_grid(cls, size: int):
+    grid = cls(size, size)
+    for y in range(size):
+        for x in range(3, size, 7):
+            if is_wall(x, y):
+                grid.set(x, y, 1)
+    return grid
+
+
+def walk(robot: Robot, moves: int) -> float:
+    robot.position = (0, 0)
+    t0 = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(moves // 2):
+            if not robot.move_right():
+                robot.move_bottom()
+            if not robot.move_bottom():
+                robot.position = (0, 0)
+    return moves / (time.perf_counter() - t0)
+
+
+def route(robot: Robot, size: int, repeats: int = 1000):
+    docks = (0, 0), (size - 2, size - 1)
+    robot.position = docks[0]
+    t0 = time.perf_counter()
+    robot.goto(*docks[1])
+    robot.goto(*docks[0])
+    t_first = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for i in range(repeats):
+        robot.goto(*docks[i % 2])
+    t_repeat = (time.perf_counter() - t0) / repeats
+    print(
+        f"{'  goto':<8} first {t_first:7.2f} s"
+        f"  repeated {t_repeat * 1e6:7.2f} us"
+    )
+
+
+def sweep(robot: Robot, size: int, repeats: int = 1000):
+    """Проезды вдоль свободной строки (y % 7 == 6) туда и обратно."""
+    y = 6 if size > 6 else 0
+    with contextlib.redirect_stdout(io.StringIO()):
+        robot.position = (0, y)
+        t0 = time.perf_counter()
+        while robot.move_right():
+            pass
+        t_steps = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        for _ in range(repeats):
+            robot.slide("left")
+            robot.slide("right")
+        t_slide = (time.perf_counter() - t0) / (2 * repeats)
+    print(
+        f"{'  slide':<8} steps {t_steps * 1e3:7.2f} ms"
+        f"  slide {t_slide * 1e6:7.2f} us  ({size - 1} cells)"
+    )
+
+
+def measure(name: str, build, size: int, moves: int):
+    gc.collect()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    grid = build()
+    t_build = time.perf_counter() - t0
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    robot = Robot(grid)
+    speed = walk(robot, moves)
+    print(
+        f"{name:<8} build {t_build:7.2f} s  {memory / 2**20:9.1f} MiB"
+        f"  moves {speed / 1e6:5.2f} M/s"
+    )
+    route(robot, size)
+    sweep(robot, size)
+    return grid
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--size", type=int, default=4000)
+    arg_parser.add_argument("--moves", type=int, default=10**6)
+    args = arg_parser.parse_args()
+    size = args.size
+
+    print(f"{size}x{size} cells")
+    measure("list", lambda: build_rows(size), size, args.moves)
+    for cls in (Grid, BitGrid):
+        grid = measure(
+            cls.__name__, lambda: build_grid(cls, size), size, args.moves
+        )
+        fd, path = tempfile.mkstemp(suffix=".map")
+        os.close(fd)
+        try:
+            grid.save(path)
+            t0 = time.perf_counter()
+            mapped = Grid.load(path)
+            t_load = time.perf_counter() - t0
+            speed = walk(Robot(mapped), args.moves)
+            mapped.close()
+            print(
+                f"{'  mmap':<8} load  {t_load * 1000:7.2f} ms"
+                f"  {os.path.getsize(path) / 2**20:9.1f} MiB file"
+                f"  moves {speed / 1e6:5.2f} M/s"
+            )
+        finally:
+            os.unlink(path)
+
+
+if __name__ == "__main__":
+    main()
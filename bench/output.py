@@ -0,0 +1,63 @@
+"""Цена вывода: одна и та же долгая симуляция с разными приёмниками.
+
+Скрипт гоняет робота туда-обратно и печатает счётчик на каждом шаге.
+stdout идёт в файл (по умолчанию /dev/null), как при выводе в пайп;
+buffered пишет туда же пачками, collect копит в памяти, null
+отбрасывает всё (src/output.py).
+
+    python bench/output.py [--steps N] [--engine E] [--to PATH]
+"""
+import argparse
+import contextlib
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.interpreter import Interpreter, Robot  # noqa: E402
+from src.lexer import get_lexer  # noqa: E402
+from src.output import SINKS, BufferedSink  # noqa: E402
+from src.parser import get_parser  # noqa: E402
+
+SCRIPT = """
+i := 0;
+while (i < {steps}) {{
+    right;
+    left;
+    top;
+    print(i);
+    i := i + 1;
+}}
+"""
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--steps", type=int, default=50000)
+    arg_parser.add_argument("--engine", default="closure")
+    arg_parser.add_argument("--to", default=os.devnull)
+    args = arg_parser.parse_args()
+
+    tree = get_parser().parse(
+        SCRIPT.format(steps=args.steps), lexer=get_lexer()
+    )
+    lines = args.steps * 5  # 3 движения, упор в верхний край и print
+    with open(args.to, "w") as out, contextlib.redirect_stdout(out):
+        for name, sink_type in SINKS.items():
+            sink = BufferedSink(out) if name == "buffered" else sink_type()
+            interp = Interpreter(Robot([[0] * 5] * 5), output=sink)
+            t0 = time.perf_counter()
+            interp.interpret(tree, engine=args.engine)
+            elapsed = time.perf_counter() - t0
+            print(
+                f"{name:<9} {elapsed:6.2f} s  {lines / elapsed / 1e6:5.2f} M"
+                f" lines/s ({args.engine})",
+                file=sys.stderr,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Кэш разобранных программ (src/cache.py): разбор против загрузки.
+
+Для каждого test/*.test и большого сгенерированного скрипта меряет
+время get_parser().parse + Optimizer и время ProgramCache.load при
+попадании. Кэш создаётся во временном каталоге.
+
+    python bench/program_cache.py [--repeat N]
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.cache import ProgramCache  # noqa: E402
+from src.lexer import get_lexer  # noqa: E402
+from src.optimizer import Optimizer  # noqa: E402
+from src.parser import get_parser  # noqa: E402
+
+
+def generated_program(functions: int = 300) -> str:
+    parts = []
+    for i in range(functions):
+        parts.append(
+            f"function f{i}(a, b) {{\n"
+            f"    x := a * {i} + b - (a / 2);\n"
+            f"    while (x < {i * 10}) {{ x := x + 1; }}\n"
+            f"    if (x > 5) {{ print(x); }} else {{ print(b); }}\n"
+            f"}}\n"
+            f"f{i}({i}, 2);\n"
+        )
+    return "".join(parts)
+
+
+def best(fn, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--repeat", type=int, default=20)
+    args = arg_parser.parse_args()
+
+    programs = {
+        path.name: path.read_text()
+        for path in sorted((ROOT / "test").glob("*.test"))
+    }
+    programs["<generated>"] = generated_program()
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = ProgramCache(directory)
+        for name, code in programs.items():
+            try:
+                cache.load(code)  # прогрев: промах и запись
+            except Exception as e:
+                print(f"{name:<20} skipped: {e}")
+                continue
+
+            def parse():
+                tree = get_parser().parse(code, lexer=get_lexer())
+                Optimizer().optimize(tree)
+
+            t_parse = best(parse, args.repeat)
+            t_load = best(lambda: cache.load(code), args.repeat)
+            print(
+                f"{name:<20} parse {t_parse * 1000:8.3f} ms"
+                f"  cached {t_load * 1000:8.3f} ms"
+                f"  x{t_parse / t_load:6.1f}"
+            )
+        print(cache.stats())
+
+
+if __name__ == "__main__":
+    main()
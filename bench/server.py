@@ -0,0 +1,160 @@
+"""Нагрузочный тест сервиса исполнения (src/server.py).
+
+Запускает сервис на временном Unix-сокете и гоняет через него
+--requests коротких программ (test/*.test по кругу) с --clients
+соединений, в каждом до --pipeline запросов в полёте. Печатает
+пропускную способность, задержки p50/p99 и статистику сервиса.
+--slow добавляет столько же бесконечных циклов, которые сервис обрывает
+по --time: остальные запросы не должны из-за них стоять.
+Для сравнения --cold программ запускаются по одной как
+`python main.py FILE` (новый процесс с загрузкой таблиц на каждую).
+
+    python bench/server.py [--requests N] [--clients C] [--pipeline P]
+        [--workers W] [--engine E] [--slow K] [--cold K]
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.client import Client  # noqa: E402
+
+LOOP = "i := 0;\nwhile (1 < 2) {\n    i := i + 1;\n}\n"
+# Запуск одной программы в новом процессе, как main.py
+COLD = (
+    "import sys\n"
+    "from main import get_prog_from_file\n"
+    "from src.interpreter import test_interpreter\n"
+    "test_interpreter(get_prog_from_file(sys.argv[1]))\n"
+)
+
+
+def start_server(socket_path: str, args) -> subprocess.Popen:
+    command = [
+        sys.executable,
+        "-m",
+        "src.server",
+        "--unix",
+        socket_path,
+        "--engine",
+        args.engine,
+        "--time",
+        str(args.time),
+    ]
+    if args.workers:
+        command += ["--workers", str(args.workers)]
+    server = subprocess.Popen(command, cwd=ROOT, stdout=subprocess.PIPE)
+    server.stdout.readline()  # "serving on ...": пул уже прогрет
+    return server
+
+
+async def client(socket_path: str, codes: list, pipeline: int, latencies):
+    reader, writer = await asyncio.open_unix_connection(
+        socket_path, limit=16 << 20
+    )
+    sent = {}
+    slots = asyncio.Semaphore(pipeline)
+    errors = 0
+
+    async def read_responses():
+        nonlocal errors
+        for _ in codes:
+            response = json.loads(await reader.readline())
+            latencies.append(time.perf_counter() - sent.pop(response["id"]))
+            errors += not response["ok"]
+            slots.release()
+
+    reading = asyncio.create_task(read_responses())
+    for request_id, code in enumerate(codes):
+        await slots.acquire()
+        sent[request_id] = time.perf_counter()
+        writer.write(json.dumps({"id": request_id, "code": code}).encode())
+        writer.write(b"\n")
+        await writer.drain()
+    await reading
+    writer.close()
+    return errors
+
+
+async def load(socket_path: str, programs: list, args):
+    codes = list(itertools.islice(itertools.cycle(programs), args.requests))
+    shares = [codes[i :: args.clients] for i in range(args.clients)]
+    latencies = []
+    slow = [
+        client(socket_path, [LOOP], 1, []) for _ in range(args.slow)
+    ]
+    t0 = time.perf_counter()
+    errors = await asyncio.gather(
+        *slow,
+        *(
+            client(socket_path, share, args.pipeline, latencies)
+            for share in shares
+        ),
+    )
+    elapsed = time.perf_counter() - t0
+    latencies.sort()
+    print(
+        f"{len(codes)} requests, {args.clients} clients x pipeline"
+        f" {args.pipeline}: {elapsed:.2f} s,"
+        f" {len(codes) / elapsed:.0f} req/s,"
+        f" p50 {latencies[len(latencies) // 2] * 1e3:.2f} ms,"
+        f" p99 {latencies[int(len(latencies) * 0.99)] * 1e3:.2f} ms,"
+        f" {sum(errors[args.slow:])} with errors"
+        f" (+{args.slow} cut by --time)"
+    )
+
+
+def cold(paths: list, count: int):
+    t0 = time.perf_counter()
+    for path in itertools.islice(itertools.cycle(paths), count):
+        subprocess.run(
+            [sys.executable, "-c", COLD, str(path)],
+            cwd=ROOT,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+    elapsed = time.perf_counter() - t0
+    print(
+        f"cold start: {count} processes, {elapsed / count * 1e3:.1f} ms"
+        " per program"
+    )
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--requests", type=int, default=5000)
+    arg_parser.add_argument("--clients", type=int, default=8)
+    arg_parser.add_argument("--pipeline", type=int, default=16)
+    arg_parser.add_argument("--workers", type=int)
+    arg_parser.add_argument("--engine", default="tree")
+    arg_parser.add_argument("--time", type=float, default=1.0)
+    arg_parser.add_argument("--slow", type=int, default=0)
+    arg_parser.add_argument("--cold", type=int, default=20)
+    args = arg_parser.parse_args()
+
+    paths = sorted((ROOT / "test").glob("*.test"))
+    programs = [path.read_text() for path in paths]
+    socket_path = os.path.join(tempfile.mkdtemp(), "bench.sock")
+    server = start_server(socket_path, args)
+    try:
+        asyncio.run(load(socket_path, programs, args))
+        with Client(socket_path) as service:
+            print(json.dumps(service.stats()))
+    finally:
+        server.terminate()
+        server.wait()
+    if args.cold:
+        cold(paths, args.cold)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Ветвление после общего префикса: повторный прогон против fork.
+
+Префикс заполняет массив из --size элементов циклом, двигает робота и
+заводит --globals переменных. Затем --branches продолжений, каждое
+меняет один элемент массива и несколько переменных. Сравнивается:
+  rerun - новый Interpreter и префикс заново для каждой ветки,
+  fork  - префикс один раз, затем Interpreter.fork на ветку.
+Память веток (tracemalloc) меряется, пока все они живы: массив
+копируется только в тех ветках, которые в него пишут.
+
+    python bench/snapshot.py [--size N] [--branches B] [--engine E]
+"""
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.interpreter import Interpreter, Robot  # noqa: E402
+from src.lexer import get_lexer  # noqa: E402
+from src.output import NullSink  # noqa: E402
+from src.parser import get_parser  # noqa: E402
+
+
+def prefix(size: int, globals_count: int) -> str:
+    names = "\n".join(f"g{i} := {i};" for i in range(globals_count))
+    return f"""
+array integer of a ({size});
+i := 0;
+while (i < {size}) {{
+    a[i] := i * 2;
+    i := i + 1;
+}}
+right;
+bottom;
+{names}
+"""
+
+
+def branch(k: int, size: int, writes: bool) -> str:
+    store = f"a[{k % size}] := {k};\n" if writes else ""
+    read = f"sum(a[{k % size}:{k % size + 1}])"
+    return store + f"x := g0 + {k};\ny := {read} + x;\nright;\n"
+
+
+def new_interpreter() -> Interpreter:
+    return Interpreter(Robot([[0] * 8 for _ in range(8)]), output=NullSink())
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--size", type=int, default=20000)
+    arg_parser.add_argument("--globals", type=int, default=50)
+    arg_parser.add_argument("--branches", type=int, default=200)
+    arg_parser.add_argument("--engine", default="closure")
+    args = arg_parser.parse_args()
+
+    parser = get_parser()
+    prefix_tree = parser.parse(
+        prefix(args.size, args.globals), lexer=get_lexer()
+    )
+    branches = [
+        parser.parse(branch(k, args.size, k % 2 == 0), lexer=get_lexer())
+        for k in range(args.branches)
+    ]
+
+    t0 = time.perf_counter()
+    for tree in branches:
+        interp = new_interpreter()
+        interp.interpret(prefix_tree, engine=args.engine)
+        interp.interpret(tree, engine=args.engine)
+    t_rerun = (time.perf_counter() - t0) / args.branches
+
+    base = new_interpreter()
+    base.interpret(prefix_tree, engine=args.engine)
+    t0 = time.perf_counter()
+    forks = [base.fork() for _ in branches]
+    t_fork = (time.perf_counter() - t0) / args.branches
+    for child, tree in zip(forks, branches):
+        child.interpret(tree, engine=args.engine)
+    t_total = (time.perf_counter() - t0) / args.branches
+
+    # Память - отдельным проходом: tracemalloc замедляет всё
+    del forks
+    tracemalloc.start()
+    forks = [base.fork() for _ in branches]
+    for child, tree in zip(forks, branches):
+        child.interpret(tree, engine=args.engine)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    print(
+        f"{args.branches} branches, array of {args.size},"
+        f" {args.globals} globals ({args.engine})"
+    )
+    print(f"rerun  {t_rerun * 1e3:9.3f} ms per branch")
+    print(
+        f"fork   {t_total * 1e3:9.3f} ms per branch"
+        f" (fork itself {t_fork * 1e6:.1f} us),"
+        f" {memory / args.branches / 1024:.1f} KiB per live branch"
+        f" (half write the array: {args.size * 8 / 1024:.1f} KiB copy)"
+    )
+
+
+if __name__ == "__main__":
+    main()
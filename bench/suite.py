@@ -0,0 +1,275 @@
+"""Набор бенчмарков: лексер, парсер и исполнение по отдельности.
+
+Программы - test/*.test и сгенерированные нагрузки (глубокая рекурсия,
+долгий while, большие массивы, много операторов верхнего уровня,
+разыменование указателей, маршруты робота, чтение переменных
+вызывающих функций), размер которых задают
+--scale и параметры ниже. Для каждой программы меряется лучшее из
+--repeat время фаз: lex (только токены), parse (разбор без лексера:
+parse минус lex), execute (по каждому движку, вывод в NullSink).
+
+Результаты пишутся в JSON (--output). С --baseline сравнивает с
+прошлым запуском и помечает замедления больше --threshold; если они
+есть, выходит с кодом 1.
+
+    python bench/suite.py [--engines tree,vm,closure] [--repeat N]
+        [--scale K] [--only NAME] [--output out.json]
+        [--baseline old.json] [--threshold 0.1]
+
+Рекурсия в движках tree и closure ограничена стеком Python: на
+большой глубине их фаза execute записывается как ошибка.
+"""
+import argparse
+import contextlib
+import io
+import json
+import platform
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.interpreter import ENGINES, Interpreter, Robot  # noqa: E402
+from src.lexer import get_lexer  # noqa: E402
+from src.output import NullSink  # noqa: E402
+from src.parser import get_parser  # noqa: E402
+
+# Изменения меньше этого (секунд) не считаются замедлением: шум таймера
+MIN_DELTA = 0.002
+
+
+def deep_recursion(scale: int):
+    depth = 120 * scale
+    return f"""
+function down(n) {{
+    if (n = 0) {{
+        return 0;
+    }} else {{
+        return 1 + down(n - 1);
+    }}
+}}
+print(down({depth}));
+""", 5
+
+
+def long_while(scale: int):
+    return f"""
+i := 0;
+total := 0;
+while (i < {20000 * scale}) {{
+    total := total + i * 2 - 1;
+    i := i + 1;
+}}
+print(total);
+""", 5
+
+
+def large_arrays(scale: int):
+    size = 10000 * scale
+    return f"""
+array integer of a ({size});
+i := 0;
+while (i < {size}) {{
+    a[i] := i * 3;
+    i := i + 1;
+}}
+b := a * 2 + 1;
+a[0:{size // 2}] := b[{size // 2}:{size}];
+print(sum(a) + max(b));
+""", 5
+
+
+def many_statements(scale: int):
+    lines = [f"x{i} := {i} * 2 + x{i - 1};" for i in range(1, 3000 * scale)]
+    return "x0 := 0;\n" + "\n".join(lines) + "\nprint(x1);\n", 5
+
+
+def pointer_deref(scale: int):
+    return f"""
+x := 1;
+p := &x;
+q := &p;
+i := 0;
+total := 0;
+while (i < {10000 * scale}) {{
+    total := total + *p + *(*q);
+    i := i + 1;
+}}
+print(total);
+""", 5
+
+
+def dynamic_reads(scale: int):
+    # add видит acc и step из кадров run и loop (динамическая область)
+    return f"""
+function add() {{
+    return acc + step + base;
+}}
+function loop(n) {{
+    acc := 0;
+    i := 0;
+    while (i < n) {{
+        acc := add();
+        i := i + 1;
+    }}
+    return acc;
+}}
+function run(n) {{
+    step := 3;
+    return loop(n);
+}}
+base := 1;
+print(run({10000 * scale}));
+""", 5
+
+
+def robot_routes(scale: int):
+    return f"""
+i := 0;
+while (i < {1000 * scale}) {{
+    right;
+    bottom;
+    slide right;
+    slide bottom;
+    goto(0, 0);
+    left;
+    top;
+    i := i + 1;
+}}
+print(goto(31, 31));
+""", 32
+
+
+WORKLOADS = {
+    "deep_recursion": deep_recursion,
+    "long_while": long_while,
+    "large_arrays": large_arrays,
+    "many_statements": many_statements,
+    "pointer_deref": pointer_deref,
+    "robot_routes": robot_routes,
+    "dynamic_reads": dynamic_reads,
+}
+
+
+def best_of(repeat: int, run) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def lex(code: str):
+    lexer = get_lexer()
+    lexer.input(code)
+    while lexer.token():
+        pass
+
+
+def execute(tree, engine: str, grid_size: int):
+    robot = Robot([[0] * grid_size for _ in range(grid_size)])
+    interp = Interpreter(robot, output=NullSink())
+    # Ошибки исполнения (как в test/array.test) - часть программы
+    with contextlib.redirect_stderr(io.StringIO()):
+        interp.interpret(tree, engine=engine)
+
+
+def measure(name: str, code: str, grid_size: int, args, results: dict):
+    parser = get_parser()
+    t_lex = best_of(args.repeat, lambda: lex(code))
+    results[f"{name}/lex"] = t_lex
+    try:
+        tree = parser.parse(code, lexer=get_lexer())
+    except Exception as e:
+        results[f"{name}/parse"] = {"error": str(e)}
+        print(f"{name:<32} parse error: {e}")
+        return
+    t_parse = best_of(
+        args.repeat, lambda: parser.parse(code, lexer=get_lexer())
+    )
+    t_parse = results[f"{name}/parse"] = max(t_parse - t_lex, 0.0)
+    line = [f"{name:<32} lex {t_lex * 1e3:8.2f}  parse {t_parse * 1e3:8.2f}"]
+    for engine in args.engines:
+        key = f"{name}/execute/{engine}"
+        try:
+            results[key] = best_of(
+                args.repeat, lambda: execute(tree, engine, grid_size)
+            )
+            line.append(f"{engine} {results[key] * 1e3:9.2f}")
+        except Exception as e:
+            results[key] = {"error": f"{type(e).__name__}: {e}"[:200]}
+            line.append(f"{engine} {'error':>9}")
+    print("  ".join(line) + "  ms")
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """Ключи, время которых выросло больше чем в 1 + threshold раз."""
+    regressions = []
+    for key, seconds in results.items():
+        old = baseline.get(key)
+        if not isinstance(seconds, float) or not isinstance(old, float):
+            continue
+        if seconds > old * (1 + threshold) and seconds - old > MIN_DELTA:
+            regressions.append(key)
+            print(
+                f"REGRESSION {key}: {old * 1e3:.2f} -> {seconds * 1e3:.2f} ms"
+                f" (+{(seconds / old - 1) * 100:.0f}%)"
+            )
+    return regressions
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--engines", default=",".join(ENGINES))
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    arg_parser.add_argument("--scale", type=int, default=1)
+    arg_parser.add_argument("--only", help="подстрока имени программы")
+    arg_parser.add_argument("--output", help="куда записать JSON")
+    arg_parser.add_argument("--baseline", help="JSON прошлого запуска")
+    arg_parser.add_argument("--threshold", type=float, default=0.1)
+    args = arg_parser.parse_args()
+    args.engines = args.engines.split(",")
+
+    programs = [
+        (f"test/{path.name}", path.read_text(), 5)
+        for path in sorted((ROOT / "test").glob("*.test"))
+    ]
+    programs += [
+        (f"gen/{name}", *generate(args.scale))
+        for name, generate in WORKLOADS.items()
+    ]
+    get_parser().parse("x := 1;", lexer=get_lexer())  # прогрев таблиц
+
+    results = {}
+    for name, code, grid_size in programs:
+        if args.only is None or args.only in name:
+            measure(name, code, grid_size, args, results)
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "engines": args.engines,
+            "repeat": args.repeat,
+            "scale": args.scale,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as out:
+            json.dump(report, out, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as inp:
+            baseline = json.load(inp)["results"]
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+        print(f"no regressions against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
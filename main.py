@@ -1,3 +1,6 @@
+import sys
+
+from src import batch
 from src.interpreter import test_interpreter
 from src.lexer import get_lexer
 
@@ -22,6 +25,10 @@ def test_lexer(s: str):
 
 
 def main():
+    if len(sys.argv) > 1:
+        # python main.py PATH... - пакетный запуск (src/batch.py)
+        batch.main()
+        return
     s = get_prog_from_file()
     test_interpreter(s)
 
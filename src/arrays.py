@@ -0,0 +1,169 @@
+import operator
+from array import array
+from itertools import repeat
+
+from src.exception import InterpError
+from src.limits import charge
+
+TYPECODE = "q"  # знаковое 64-битное целое
+
+
+class VectorOps:
+    """Поэлементные + - * / для массивов языка.
+
+    Второй операнд - массив той же длины или число. Цикл по элементам
+    идёт внутри map с функцией из operator, без шагов интерпретатора.
+    Результат - новый массив: IntArray, если все значения - 64-битные
+    целые, иначе ObjectArray. Его элементы и шаги по ним идут на счёт
+    текущего бюджета (src/limits.py).
+    """
+
+    __slots__ = ()
+
+    def _apply(self, fn, other, reflected=False):
+        size = len(self)
+        if isinstance(other, (array, list)):
+            if len(other) != size:
+                raise InterpError(
+                    f"Array length mismatch: {size} and {len(other)}"
+                )
+            items = other
+        else:
+            items = repeat(other, size)
+        charge(size, size)
+        if reflected:
+            return pack(list(map(fn, items, self)))
+        return pack(list(map(fn, self, items)))
+
+    def __add__(self, other):
+        return self._apply(operator.add, other)
+
+    def __radd__(self, other):
+        return self._apply(operator.add, other, reflected=True)
+
+    def __sub__(self, other):
+        return self._apply(operator.sub, other)
+
+    def __rsub__(self, other):
+        return self._apply(operator.sub, other, reflected=True)
+
+    def __mul__(self, other):
+        return self._apply(operator.mul, other)
+
+    def __rmul__(self, other):
+        return self._apply(operator.mul, other, reflected=True)
+
+    def __truediv__(self, other):
+        return self._apply(operator.truediv, other)
+
+    def __rtruediv__(self, other):
+        return self._apply(operator.truediv, other, reflected=True)
+
+    def __neg__(self):
+        charge(len(self), len(self))
+        return pack(list(map(operator.neg, self)))
+
+
+class IntArray(VectorOps, array):
+    """Значение `array integer of`: целые в непрерывном буфере по 8 байт
+    на элемент, без отдельного объекта int на каждый элемент.
+
+    Печатается и сравнивается как список. Нецелое значение или число
+    вне 64 бит в буфер не помещаются: Interpreter.store_index тогда
+    заменяет массив во всех переменных на ObjectArray (to_list).
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def zeros(cls, size: int) -> "IntArray":
+        return cls(TYPECODE, bytes(size * cls(TYPECODE).itemsize))
+
+    def to_list(self) -> "ObjectArray":
+        return ObjectArray(self.tolist())
+
+    def __repr__(self):
+        return repr(self.tolist())
+
+    __str__ = __repr__
+
+    def __eq__(self, other):
+        if isinstance(other, list):
+            return self.tolist() == other
+        return super().__eq__(other)
+
+    __hash__ = None
+
+
+class ObjectArray(VectorOps, list):
+    """Массив с произвольными элементами (дробными, строками...)."""
+
+    # Слабые ссылки - для Interpreter.shared_arrays, как у IntArray
+    __slots__ = ("__weakref__",)
+
+    def to_list(self) -> "ObjectArray":
+        return self
+
+
+def pack(values: list):
+    try:
+        return IntArray(TYPECODE, values)
+    except (TypeError, OverflowError):
+        return ObjectArray(values)
+
+
+def is_array(value) -> bool:
+    return isinstance(value, (IntArray, list))
+
+
+def copy_array(value):
+    """Копия массива языка того же типа (IntArray - копией буфера)."""
+    if type(value) is IntArray:
+        result = IntArray(TYPECODE)
+        result.frombytes(memoryview(value).cast("B"))
+        return result
+    return ObjectArray(value)
+
+
+def fill_items(value, size: int):
+    """Значения для записи в срез длины size: массив или повтор числа."""
+    if is_array(value):
+        if len(value) != size:
+            raise InterpError(
+                f"Array length mismatch: {size} and {len(value)}"
+            )
+        return value
+    if type(value) is int:
+        try:
+            return array(TYPECODE, [value]) * size
+        except OverflowError:
+            pass  # вне 64 бит: список, assign_slice перейдёт на ObjectArray
+    return [value] * size
+
+
+def assign_slice(target, start: int, end: int, items):
+    """Записывает items в target[start:end] одной операцией.
+
+    Возвращает массив, в который пришлось записывать: при значениях,
+    не помещающихся в IntArray, это новый ObjectArray.
+    """
+    if type(target) is IntArray:
+        try:
+            if type(items) is not IntArray and type(items) is not array:
+                items = array(TYPECODE, items)
+            target[start:end] = items
+            return target
+        except (TypeError, OverflowError):
+            target = target.to_list()
+    target[start:end] = list(items)
+    return target
+
+
+def reduce_array(func: str, value):
+    if not is_array(value):
+        raise InterpError(f"{func} expects an array, got {value!r}")
+    if func == "sum":
+        return sum(value)
+    if not value:
+        raise InterpError(f"{func} of an empty array")
+    return min(value) if func == "min" else max(value)
@@ -0,0 +1,295 @@
+"""Пакетный запуск: много программ на пуле процессов.
+
+    python -m src.batch PATH... [--jobs N] [--engine E] [--frontend F]
+        [--stream] [--jsonl] [--grid N] [--steps N] [--time S] ...
+
+PATH - файл программы или каталог (берутся *.test из него и
+подкаталогов). Каждая программа исполняется со своим Robot: карта из
+файла рядом с программой (prog.test -> prog.map, см. Grid.save),
+иначе пустая --grid x --grid. Процесс пула один раз при старте строит
+лексер и парсер и прогревает их, дальше только переиспользует.
+
+Результаты выдаются в порядке PATH или, с --stream, по мере готовности:
+строка текста на программу или (--jsonl) JSON с выводом, позицией
+робота, временем разбора и исполнения и ошибкой.
+"""
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import sys
+import time
+from pathlib import Path
+
+from src.exception import LimitExceeded
+from src.grid import Grid
+from src.interpreter import ENGINE_HELP, ENGINES, Interpreter, Robot
+from src.lexer import get_lexer
+from src.limits import Limits
+from src.output import CollectorSink
+from src.parser import FRONTENDS, get_parser
+
+# Расширение программ в каталогах и файлов карт рядом с ними
+PROGRAM_SUFFIX = ".test"
+MAP_SUFFIX = ".map"
+
+# Значения результата, которые можно отдать в JSON как есть
+JSON_TYPES = (int, float, str, bool, type(None))
+
+
+class BatchResult:
+    """Итог одной программы. output - строки вывода (print и события
+    робота), position - позиция робота в конце, error - текст ошибки
+    разбора или исполнения (None - без ошибок)."""
+
+    __slots__ = (
+        "path",
+        "output",
+        "result",
+        "position",
+        "parse_time",
+        "execute_time",
+        "error",
+        "usage",
+    )
+
+    def __init__(self, path: str):
+        self.path = path
+        self.output: list[str] = []
+        self.result = None
+        self.position: tuple = None
+        self.parse_time = 0.0
+        self.execute_time = 0.0
+        self.error: str = None
+        self.usage: dict = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def to_dict(self) -> dict:
+        data = {name: getattr(self, name) for name in self.__slots__}
+        data["ok"] = self.ok
+        return data
+
+    def __str__(self):
+        status = "ok" if self.ok else f"error: {self.error}"
+        return (
+            f"{self.path}: {status}, position {self.position},"
+            f" {len(self.output)} lines,"
+            f" parse {self.parse_time * 1e3:.2f} ms,"
+            f" execute {self.execute_time * 1e3:.2f} ms"
+        )
+
+
+class Worker:
+    """Состояние процесса пула: парсер строится один раз."""
+
+    def __init__(
+        self,
+        engine: str = "tree",
+        frontend: str = "ply",
+        grid_size: int = 5,
+        limits: Limits = None,
+    ):
+        self.engine = engine
+        self.frontend = frontend
+        self.grid_size = grid_size
+        self.limits = limits
+        # Прогрев: таблицы PLY и состояние лексера готовы до первой
+        # настоящей программы
+        self.parse("x := 1;")
+
+    def parse(self, code: str, frontend: str = None):
+        parser = get_parser(frontend or self.frontend)
+        return parser.parse(code, lexer=get_lexer())
+
+    def grid_for(self, path: Path):
+        map_path = path.with_suffix(MAP_SUFFIX)
+        if map_path.exists():
+            return Grid.load(map_path)
+        return Grid(self.grid_size, self.grid_size)
+
+    def run(self, path: str) -> BatchResult:
+        """Программа из файла path на своей карте (см. grid_for)."""
+        try:
+            with open(path) as inp:
+                code = inp.read()
+            grid = self.grid_for(Path(path))
+        except Exception as e:
+            res = BatchResult(path)
+            res.error = f"{type(e).__name__}: {e}"
+            return res
+        try:
+            return self.execute(path, code, grid)
+        finally:
+            grid.close()
+
+    def execute(
+        self,
+        name: str,
+        code: str,
+        grid,
+        engine: str = None,
+        frontend: str = None,
+        limits: Limits = None,
+    ) -> BatchResult:
+        """Разбирает и исполняет code с новыми Robot (на карте grid -
+        Grid или двумерный список) и Interpreter. engine, frontend и
+        limits - вместо заданных при создании Worker."""
+        res = BatchResult(name)
+        sink = CollectorSink()
+        errors = io.StringIO()
+        robot = interp = None
+        try:
+            t0 = time.perf_counter()
+            tree = self.parse(code, frontend)
+            res.parse_time = time.perf_counter() - t0
+            robot = Robot(grid)
+            interp = Interpreter(robot, output=sink)
+            t0 = time.perf_counter()
+            # interpret сообщает об InterpError в stderr и не бросает её,
+            # кроме LimitExceeded
+            with contextlib.redirect_stderr(errors):
+                result = interp.interpret(
+                    tree,
+                    engine=engine or self.engine,
+                    limits=limits if limits is not None else self.limits,
+                )
+            res.execute_time = time.perf_counter() - t0
+            # Массивы и функции - текстом: результат идёт через pickle
+            if not isinstance(result, JSON_TYPES):
+                result = repr(result)
+            res.result = result
+        except LimitExceeded as e:
+            res.execute_time = time.perf_counter() - t0
+            res.error = str(e)
+        except Exception as e:
+            res.error = f"{type(e).__name__}: {e}"
+        finally:
+            if robot is not None:
+                res.position = robot.position
+            if interp is not None and interp.budget is not None:
+                res.usage = interp.budget.usage()
+        if res.error is None and errors.getvalue():
+            res.error = errors.getvalue().strip().removeprefix("[error] ")
+        res.output = sink.lines
+        return res
+
+
+_worker: Worker = None
+
+
+def _init_worker(*args):
+    global _worker
+    _worker = Worker(*args)
+
+
+def _run(path: str) -> BatchResult:
+    return _worker.run(path)
+
+
+def collect_programs(paths) -> list[str]:
+    """Файлы как есть, каталоги - все *.test в них по порядку."""
+    programs = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            programs += sorted(
+                str(p) for p in path.rglob(f"*{PROGRAM_SUFFIX}")
+            )
+        else:
+            programs.append(str(path))
+    return programs
+
+
+def run_batch(
+    programs: list[str],
+    jobs: int = None,
+    engine: str = "tree",
+    frontend: str = "ply",
+    grid_size: int = 5,
+    limits: Limits = None,
+    ordered: bool = True,
+    chunksize: int = None,
+):
+    """Исполняет programs на jobs процессах (по умолчанию - по числу
+    ядер) и отдаёт BatchResult по одной: в порядке programs или, если
+    ordered=False, по мере готовности. jobs=1 - в текущем процессе."""
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine: {engine}")
+    if frontend not in FRONTENDS:
+        raise ValueError(f"Unknown frontend: {frontend}")
+    settings = (engine, frontend, grid_size, limits)
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(programs) <= 1:
+        worker = Worker(*settings)
+        for path in programs:
+            yield worker.run(path)
+        return
+    if chunksize is None:
+        # Пачки побольше - меньше пересылок, но не хуже балансировка
+        chunksize = max(1, min(64, len(programs) // (jobs * 8)))
+    with multiprocessing.Pool(jobs, _init_worker, settings) as pool:
+        imap = pool.imap if ordered else pool.imap_unordered
+        yield from imap(_run, programs, chunksize)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("paths", nargs="+")
+    arg_parser.add_argument("--jobs", "-j", type=int, default=None)
+    arg_parser.add_argument(
+        "--engine", default="tree", choices=ENGINES, help=ENGINE_HELP
+    )
+    arg_parser.add_argument("--frontend", default="ply", choices=FRONTENDS)
+    arg_parser.add_argument("--grid", type=int, default=5)
+    arg_parser.add_argument(
+        "--stream", action="store_true", help="по мере готовности"
+    )
+    arg_parser.add_argument("--jsonl", action="store_true")
+    arg_parser.add_argument(
+        "--show-output", action="store_true", help="печатать вывод программ"
+    )
+    arg_parser.add_argument("--steps", type=int)
+    # Как у src/server.py: зациклившаяся программа не держит процесс
+    arg_parser.add_argument("--time", type=float, default=10.0)
+    arg_parser.add_argument("--array-elements", type=int)
+    arg_parser.add_argument("--depth", type=int)
+    args = arg_parser.parse_args()
+
+    limits = Limits(args.steps, args.time, args.array_elements, args.depth)
+
+    programs = collect_programs(args.paths)
+    failed = 0
+    t0 = time.perf_counter()
+    for res in run_batch(
+        programs,
+        jobs=args.jobs,
+        engine=args.engine,
+        frontend=args.frontend,
+        grid_size=args.grid,
+        limits=limits,
+        ordered=not args.stream,
+    ):
+        failed += not res.ok
+        if args.jsonl:
+            print(json.dumps(res.to_dict()))
+        else:
+            print(res)
+            if args.show_output:
+                for line in res.output:
+                    print(f"    {line}")
+    elapsed = time.perf_counter() - t0
+    print(
+        f"{len(programs)} programs, {failed} failed, {elapsed:.2f} s"
+        f" ({len(programs) / elapsed if elapsed else 0:.1f} programs/s)",
+        file=sys.stderr,
+    )
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Встроенные функции языка: sum, min, max и goto.
+
+Это обычные имена, а не ключевые слова. Вызов f(...) берёт функцию f
+из global_env, а если там не функция (или ничего нет) - встроенную с
+тем же именем. Так `sum := 0;` и `function max(a, b) {...}` остаются
+допустимыми, а sum(a) работает, пока его не переопределили.
+"""
+from src.arrays import reduce_array
+from src.exception import InterpError
+from src.logic import FunctionDecl
+
+
+class Builtin:
+    """Встроенная функция: fn(interp, *args). pure - без побочных
+    эффектов (для src/purity.py)."""
+
+    __slots__ = ("name", "arity", "pure", "fn")
+
+    def __init__(self, name: str, arity: int, pure: bool, fn):
+        self.name = name
+        self.arity = arity
+        self.pure = pure
+        self.fn = fn
+
+    def __call__(self, interp, args: list):
+        if len(args) != self.arity:
+            raise InterpError(
+                f"{self.name} expects {self.arity} argument(s),"
+                f" got {len(args)}"
+            )
+        return self.fn(interp, *args)
+
+    def __repr__(self):
+        return f"<builtin {self.name}>"
+
+
+def _reduction(name: str) -> Builtin:
+    def reduce(interp, value):
+        return reduce_array(name, value)
+
+    return Builtin(name, 1, True, reduce)
+
+
+BUILTINS = {
+    builtin.name: builtin
+    for builtin in (
+        _reduction("sum"),
+        _reduction("min"),
+        _reduction("max"),
+        Builtin("goto", 2, False, lambda interp, x, y: interp.goto(x, y)),
+    )
+}
+
+
+def resolve_function(genv: dict, name: str):
+    """FunctionDecl из global_env или встроенная функция name."""
+    func = genv.get(name)
+    if type(func) is FunctionDecl:
+        return func
+    builtin = BUILTINS.get(name)
+    if builtin is None:
+        raise Exception(f"Function {name} is not defined")
+    return builtin
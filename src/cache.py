@@ -0,0 +1,194 @@
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+import zlib
+from pathlib import Path
+
+from src.lexer import get_lexer
+from src.logic import AST
+from src.optimizer import Optimizer
+from src.parser import get_parser
+
+# Меняется при несовместимом изменении формата записи
+CACHE_VERSION = 1
+
+DEFAULT_CACHE_DIR = Path(
+    os.environ.get(
+        "ROBOT_CACHE_DIR", Path.home() / ".cache" / "robot-lang"
+    )
+)
+DEFAULT_MAX_BYTES = 64 << 20
+
+# От этих модулей зависит, какое дерево получится из исходника
+_FRONTEND_MODULES = (
+    "lexer.py",
+    "logic.py",
+    "optimizer.py",
+    "parser.py",
+    "parsetab.py",
+    "pratt.py",
+)
+_SUFFIX = ".ast"
+
+_grammar_stamp: str = None
+
+
+def grammar_stamp() -> str:
+    """Отпечаток грамматики, классов AST и оптимизатора.
+
+    Любая правка этих модулей меняет ключи, и старые записи
+    перестают находиться (а потом вытесняются по LRU).
+    """
+    global _grammar_stamp
+    if _grammar_stamp is None:
+        digest = hashlib.sha256()
+        digest.update(f"{CACHE_VERSION}:{sys.version_info[:2]}".encode())
+        src_dir = Path(__file__).resolve().parent
+        for name in _FRONTEND_MODULES:
+            digest.update(name.encode())
+            digest.update((src_dir / name).read_bytes())
+        _grammar_stamp = digest.hexdigest()
+    return _grammar_stamp
+
+
+class ProgramCache:
+    """Кэш разобранных программ на диске, аналог .pyc.
+
+    Ключ - sha256 от исходника, фронтенда, флага optimize и
+    grammar_stamp(). Запись - сжатый pickle списка операторов, каждая
+    в своём файле. Файл пишется во временный и переименовывается
+    (os.replace атомарен), поэтому несколько процессов могут работать
+    с одним каталогом без блокировок: читатель видит либо старую
+    запись, либо новую целиком. Попадание обновляет mtime, по нему
+    при превышении max_bytes удаляются самые давние записи.
+    """
+
+    def __init__(
+        self,
+        directory=DEFAULT_CACHE_DIR,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        frontend: str = "ply",
+        optimize: bool = True,
+    ):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.frontend = frontend
+        self.optimize = optimize
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def key(self, code: str) -> str:
+        digest = hashlib.sha256()
+        digest.update(grammar_stamp().encode())
+        digest.update(f"{self.frontend}:{self.optimize}:".encode())
+        digest.update(code.encode())
+        return digest.hexdigest()
+
+    def path(self, key: str) -> Path:
+        return self.directory / (key + _SUFFIX)
+
+    def load(self, code: str) -> list[AST]:
+        """Возвращает дерево программы: из кэша или после разбора.
+
+        Синтаксические ошибки не кэшируются и пробрасываются как есть.
+        """
+        key = self.key(code)
+        tree = self.get(key)
+        if tree is not None:
+            self.hits += 1
+            return tree
+        self.misses += 1
+        tree = get_parser(self.frontend).parse(code, lexer=get_lexer())
+        if self.optimize:
+            tree = Optimizer().optimize(tree)
+        if tree is not None:
+            self.put(key, tree)
+        return tree
+
+    def get(self, key: str) -> list[AST]:
+        path = self.path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            tree = pickle.loads(zlib.decompress(data))
+        except FileNotFoundError:
+            return None
+        except (OSError, zlib.error, pickle.UnpicklingError, EOFError):
+            # Повреждённая запись: считаем промахом и перезапишем
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass  # запись могли вытеснить другим процессом
+        return tree
+
+    def put(self, key: str, tree: list[AST]):
+        try:
+            data = pickle.dumps(tree, pickle.HIGHEST_PROTOCOL)
+        except RecursionError:
+            return  # слишком глубокое дерево, просто не кэшируем
+        data = zlib.compress(data)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, self.path(key))
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+        self.stores += 1
+        self.evict()
+
+    def entries(self) -> list[tuple[float, int, Path]]:
+        result = []
+        for path in self.directory.glob("*" + _SUFFIX):
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            result.append((st.st_mtime, st.st_size, path))
+        return result
+
+    def evict(self):
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+                self.evictions += 1
+            except FileNotFoundError:
+                pass  # уже удалил другой процесс
+            total -= size
+
+    def clear(self):
+        for _, _, path in self.entries():
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def stats(self) -> dict:
+        entries = self.entries()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "entries": len(entries),
+            "bytes": sum(size for _, size, _ in entries),
+        }
@@ -0,0 +1,135 @@
+"""Клиент сервиса исполнения (src/server.py).
+
+    python -m src.client PROGRAM... [--unix PATH | --port N] [--engine E]
+        [--jsonl] [--stats] [--health]
+
+Печатает вывод программ так же, как обычный запуск, ошибки - в stderr.
+Несколько программ отправляются разом (без ожидания ответов).
+"""
+import argparse
+import itertools
+import json
+import socket
+import sys
+
+from src.server import DEFAULT_HOST, DEFAULT_SOCKET
+
+
+class ServiceError(Exception):
+    pass
+
+
+class Client:
+    """Соединение с сервисом. Запросы можно отправлять пачкой (send) и
+    потом забирать ответы по id (receive): сервер отвечает по готовности,
+    не обязательно по порядку."""
+
+    def __init__(
+        self,
+        unix: str = None,
+        host: str = DEFAULT_HOST,
+        port: int = None,
+        timeout: float = None,
+    ):
+        if port is not None:
+            self.sock = socket.create_connection((host, port), timeout)
+        else:
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.sock.settimeout(timeout)
+            self.sock.connect(unix or DEFAULT_SOCKET)
+        self.file = self.sock.makefile("rwb")
+        self.ids = itertools.count(1)
+        # Ответы, пришедшие раньше, чем их спросили
+        self.ready: dict = {}
+
+    def send(self, request: dict, flush: bool = True):
+        """Отправляет запрос, не дожидаясь ответа; возвращает его id."""
+        if request.get("id") is None:
+            request = {**request, "id": next(self.ids)}
+        self.file.write(json.dumps(request).encode() + b"\n")
+        if flush:
+            self.file.flush()
+        return request["id"]
+
+    def receive(self, request_id) -> dict:
+        while request_id not in self.ready:
+            line = self.file.readline()
+            if not line:
+                raise ServiceError("Connection closed by the server")
+            response = json.loads(line)
+            self.ready[response.get("id")] = response
+        return self.ready.pop(request_id)
+
+    def request(self, request: dict) -> dict:
+        return self.receive(self.send(request))
+
+    def run(self, code: str, **options) -> dict:
+        """Исполняет программу; options - engine, frontend, grid, limits."""
+        return self.request({"code": code, **options})
+
+    def run_many(self, codes, **options) -> list[dict]:
+        """Отправляет все программы сразу и возвращает ответы по порядку."""
+        ids = [
+            self.send({"code": code, **options}, flush=False)
+            for code in codes
+        ]
+        self.file.flush()
+        return [self.receive(request_id) for request_id in ids]
+
+    def stats(self) -> dict:
+        return self.request({"op": "stats"})["stats"]
+
+    def health(self) -> bool:
+        return self.request({"op": "health"}).get("status") == "ok"
+
+    def close(self):
+        self.file.close()
+        self.sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("programs", nargs="*")
+    arg_parser.add_argument("--unix")
+    arg_parser.add_argument("--host", default=DEFAULT_HOST)
+    arg_parser.add_argument("--port", type=int)
+    arg_parser.add_argument("--engine")
+    arg_parser.add_argument("--jsonl", action="store_true")
+    arg_parser.add_argument("--stats", action="store_true")
+    arg_parser.add_argument("--health", action="store_true")
+    args = arg_parser.parse_args()
+
+    options = {"engine": args.engine} if args.engine else {}
+    failed = False
+    with Client(args.unix, args.host, args.port) as client:
+        if args.health:
+            print("ok" if client.health() else "unhealthy")
+        if args.stats:
+            print(json.dumps(client.stats(), indent=2))
+        codes = []
+        for path in args.programs:
+            with open(path) as inp:
+                codes.append(inp.read())
+        for path, response in zip(
+            args.programs, client.run_many(codes, **options)
+        ):
+            failed = failed or not response["ok"]
+            if args.jsonl:
+                print(json.dumps({**response, "path": path}))
+                continue
+            for line in response.get("output", ()):
+                print(line)
+            if response["error"] is not None:
+                print(f"[error] {path}: {response['error']}", file=sys.stderr)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
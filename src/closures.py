@@ -0,0 +1,342 @@
+from src.builtins import resolve_function
+from src.logic import *
+from src.purity import MISS
+from src.resolver import GLOBAL, UNSET
+from src.visitor import NodeVisitor
+
+def _run_block(block, env):
+    res = None
+    for stmt in block:
+        res = stmt(env)
+    return res
+
+
+class ClosureCompiler(NodeVisitor):
+    """Однократно превращает AST в дерево замыканий вида f(env) -> value.
+
+    env - список слотов текущего кадра (None на верхнем уровне).
+    Диспетчеризация по типу узла и разбор операторов происходят во время
+    компиляции, а при исполнении вызываются уже готовые функции.
+    Семантика совпадает с Interpreter: состояние берётся у него же.
+    """
+
+    def __init__(self, interp):
+        self.interp = interp
+        self.bodies: dict[FunctionDecl, tuple] = {}
+
+    def compile(self, tree: list[AST]) -> tuple:
+        return self.compile_block(tree)
+
+    def compile_block(self, statements: list[AST]) -> tuple:
+        return tuple(self.visit(stmt) for stmt in statements or [])
+
+    def body_for(self, func: FunctionDecl) -> tuple:
+        body = self.bodies.get(func)
+        if body is None:
+            body = self.bodies[func] = self.compile_block(func.body)
+        return body
+
+    def visit_Num(self, node: Num):
+        value = node.value
+        return lambda env: value
+
+    def visit_Str(self, node: Str):
+        value = node.value
+        return lambda env: value
+
+    def visit_Var(self, node: Var):
+        name = node.value
+        slot = node.slot
+        genv = self.interp.global_env
+        lookup_site = self.interp.lookup_site
+
+        if slot >= 0:
+
+            def load_fast(env):
+                value = env[slot]
+                if value is UNSET:
+                    return lookup_site(node)
+                return value
+
+            return load_fast
+
+        if slot == GLOBAL:
+
+            def load_global(env):
+                if name in genv:
+                    return genv[name]
+                raise Exception(f"Undefined variable: {name}")
+
+            return load_global
+
+        return lambda env: lookup_site(node)
+
+    def compile_store(self, name: str, slot: int):
+        genv = self.interp.global_env
+        if slot >= 0:
+
+            def store_fast(env, value):
+                env[slot] = value
+
+            return store_fast
+
+        def store_global(env, value):
+            genv[name] = value
+
+        return store_global
+
+    def visit_BinOp(self, node: BinOp):
+        left = self.visit(node.left)
+        fn = BINARY_FUNCS[node.op]
+        if type(node.right) is Num and type(node.right.token) is int:
+            # i + 1, i < n: константа справа - без вызова и проверки
+            const = node.right.token
+
+            def binop_const(env):
+                lhs = left(env)
+                if lhs is None:
+                    raise Exception(
+                        f"Unexpected None value: left={lhs}, right={const}"
+                    )
+                return fn(lhs, const)
+
+            return binop_const
+
+        right = self.visit(node.right)
+
+        def binop(env):
+            lhs = left(env)
+            rhs = right(env)
+            if lhs is None or rhs is None:
+                raise Exception(
+                    f"Unexpected None value: left={lhs}, right={rhs}"
+                )
+            return fn(lhs, rhs)
+
+        return binop
+
+    def visit_Assign(self, node: Assign):
+        return self._assign(node.left.value, node.left.slot, node.right)
+
+    def _assign(self, name: str, slot: int, expr: AST):
+        right = self.visit(expr)
+        store = self.compile_store(name, slot)
+        init_var = self.interp.variables.init_var
+        call_stack = self.interp.call_stack
+
+        def assign(env):
+            value = right(env)
+            store(env, value)
+            init_var(name, len(call_stack))
+            return value
+
+        return assign
+
+    def visit_VarDecl(self, node: VarDecl):
+        if node.init_value:
+            return self._assign(node.var_name, node.slot, node.init_value)
+        store = self.compile_store(node.var_name, node.slot)
+        return lambda env: store(env, None)
+
+    def visit_PointerDecl(self, node: PointerDecl):
+        name = node.var_name
+        init = self.visit(node.init_value) if node.init_value else None
+        genv = self.interp.global_env
+
+        def declare_pointer(env):
+            value = genv[name] = init(env) if init else None
+            return value
+
+        return declare_pointer
+
+    def visit_Print(self, node: Print):
+        expr = self.visit(node.expr)
+        interp = self.interp
+
+        def print_(env):
+            value = expr(env)
+            interp.output.print(value)
+            return value
+
+        return print_
+
+    def visit_Return(self, node: Return):
+        expr = self.visit(node.expr)
+
+        def return_(env):
+            value = expr(env)
+            if value is None:
+                raise Exception("Return value is None")
+            return value
+
+        return return_
+
+    def visit_Move(self, node: Move):
+        direction = node.direction
+        move = self.interp.move
+        return lambda env: move(direction)
+
+    def visit_Slide(self, node: Slide):
+        direction = node.direction
+        slide = self.interp.slide
+        return lambda env: slide(direction)
+
+    def visit_FunctionDecl(self, node: FunctionDecl):
+        define_function = self.interp.define_function
+        name = node.name
+        return lambda env: define_function(name, node)
+
+    def visit_FunctionCall(self, node: FunctionCall):
+        name = node.name
+        args = self.compile_block(node.arguments)
+        interp = self.interp
+        genv = interp.global_env
+        push_frame = interp.push_frame
+        pop_frame = interp.pop_frame
+        memo = interp.memo
+        body_for = self.body_for
+
+        def call(env):
+            func = genv.get(name)
+            if type(func) is not FunctionDecl:
+                builtin = resolve_function(genv, name)
+                return builtin(interp, [arg(env) for arg in args])
+            values = [arg(env) for _, arg in zip(func.params, args)]
+            key = memo.key(func, values)
+            if key is not None:
+                result = memo.lookup(key)
+                if result is not MISS:
+                    return result
+            frame = func.scope.new_frame(values)
+            body = body_for(func)
+            push_frame(frame)
+            local_env = frame.values
+            result = None
+            for stmt in body:
+                result = stmt(local_env)
+            pop_frame()
+            if key is not None:
+                memo.store(key, result)
+            return result
+
+        return call
+
+    def visit_ArrayDecl(self, node: ArrayDecl):
+        name = node.var_name
+        declare_array = self.interp.declare_array
+        if isinstance(node.size_expr, (Num, Var, BinOp, Neg)):
+            size = self.visit(node.size_expr)
+        else:
+            value = node.size_expr
+            size = lambda env: value  # noqa: E731
+        return lambda env: declare_array(name, size(env))
+
+    def visit_ArrayAssignment(self, node: ArrayAssignment):
+        name = node.array_name
+        index = self.visit(node.index)
+        value = self.visit(node.value)
+        store_index = self.interp.store_index
+        return lambda env: store_index(name, index(env), value(env))
+
+    def visit_ArrayAccess(self, node: ArrayAccess):
+        name = node.array_name
+        index = self.visit(node.index_expr)
+        genv = self.interp.global_env
+        load_index = self.interp.load_index
+
+        def array_access(env):
+            array = genv.get(name)
+            if array is None:
+                raise Exception(f"Array {name} not found.")
+            return load_index(array, index(env))
+
+        return array_access
+
+    def visit_ArraySlice(self, node: ArraySlice):
+        name = node.array_name
+        start = self.visit(node.start)
+        end = self.visit(node.end)
+        slice_of = self.interp.slice_of
+        return lambda env: slice_of(name, start(env), end(env))
+
+    def visit_SliceAssignment(self, node: SliceAssignment):
+        name = node.array_name
+        value = self.visit(node.value)
+        store_slice = self.interp.store_slice
+        if node.start is None:
+            return lambda env: store_slice(name, None, None, value(env))
+        start = self.visit(node.start)
+        end = self.visit(node.end)
+
+        def slice_assignment(env):
+            return store_slice(name, start(env), end(env), value(env))
+
+        return slice_assignment
+
+    def visit_SizeOf(self, node: SizeOf):
+        identifier = node.identifier
+        size_of = self.interp.size_of
+        return lambda env: size_of(identifier)
+
+    def visit_LenOf(self, node: LenOf):
+        expr = self.visit(node.expr)
+        len_of = self.interp.len_of
+        return lambda env: len_of(expr(env))
+
+    def visit_AddressOf(self, node: AddressOf):
+        name = node.name
+        address_of = self.interp.address_of
+        return lambda env: address_of(name)
+
+    def visit_Neg(self, node: Neg):
+        expr = self.visit(node.expr)
+
+        def neg(env):
+            value = expr(env)
+            if value is None:
+                raise Exception(
+                    f"Unexpected None value: left=-1, right={value}"
+                )
+            return -1 * value
+
+        return neg
+
+    def visit_Unarop(self, node: Unarop):
+        expr = self.visit(node.expr)
+        deref = self.interp.deref
+        return lambda env: deref(expr(env))
+
+    def visit_If(self, node: If):
+        condition = self.visit(node.condition)
+        true_branch = self.compile_block(node.true_branch)
+        false_branch = self.compile_block(node.false_branch)
+
+        def if_(env):
+            if condition(env):
+                return _run_block(true_branch, env)
+            elif false_branch:
+                return _run_block(false_branch, env)
+
+        return if_
+
+    def visit_While(self, node: While):
+        condition = self.visit(node.condition)
+        body = self.compile_block(node.body)
+        instead_body = self.compile_block(node.instead_body)
+
+        interp = self.interp
+
+        def while_(env):
+            res = None
+            if not condition(env):
+                return _run_block(instead_body, env)
+            budget = interp.budget
+            while True:
+                for stmt in body:
+                    res = stmt(env)
+                if not condition(env):
+                    return res
+                if budget is not None:
+                    budget.tick()
+
+        return while_
@@ -0,0 +1,368 @@
+from src.logic import *
+from src.resolver import GLOBAL
+from src.visitor import NodeVisitor
+
+# Опкоды. Каждая инструкция занимает две ячейки: (opcode, arg).
+LOAD_CONST = 0
+LOAD_NAME = 1
+STORE_NAME = 2
+POP_RESULT = 3
+JUMP = 4
+JUMP_IF_FALSE = 5
+JUMP_IF_TRUE = 6
+BINARY_ADD = 7
+BINARY_SUB = 8
+BINARY_MUL = 9
+BINARY_DIV = 10
+COMPARE_LT = 11
+COMPARE_GT = 12
+COMPARE_EQ = 13
+COMPARE_NE = 14
+COMPARE_LE = 15
+COMPARE_GE = 16
+LOAD_FUNC = 17
+CALL = 18
+END = 19
+CLEAR_RESULT = 20
+RETURN_VALUE = 21
+PRINT = 22
+MAKE_FUNCTION = 23
+STORE_GLOBAL = 24
+LOAD_FAST = 25
+MAKE_ARRAY = 26
+STORE_INDEX = 27
+LOAD_INDEX = 28
+SIZE_OF = 29
+LEN_OF = 30
+ADDRESS_OF = 31
+DEREF = 32
+MOVE = 33
+UNARY_NEG = 34
+STORE_FAST = 35
+SET_FAST = 36
+LOAD_GLOBAL = 37
+SLICE = 38
+STORE_SLICE = 39
+TAIL_CALL = 40
+SLIDE = 41
+# Правый операнд - целая константа из пула (arg): i + 1, i < 100.
+# Идут последними, VM узнаёт их одним сравнением op >= BINARY_ADD_CONST
+BINARY_ADD_CONST = 42
+BINARY_SUB_CONST = 43
+BINARY_MUL_CONST = 44
+COMPARE_LT_CONST = 45
+COMPARE_GT_CONST = 46
+COMPARE_EQ_CONST = 47
+COMPARE_NE_CONST = 48
+COMPARE_LE_CONST = 49
+COMPARE_GE_CONST = 50
+
+OPNAMES = {
+    value: name
+    for name, value in list(globals().items())
+    if name.isupper() and isinstance(value, int)
+}
+
+BINARY_OPS = {
+    Op.PLUS: BINARY_ADD,
+    Op.MINUS: BINARY_SUB,
+    Op.MUL: BINARY_MUL,
+    Op.DIV: BINARY_DIV,
+    Op.LT: COMPARE_LT,
+    Op.GT: COMPARE_GT,
+    Op.EQ: COMPARE_EQ,
+    Op.NE: COMPARE_NE,
+    Op.LE: COMPARE_LE,
+    Op.GE: COMPARE_GE,
+}
+
+CONST_OPS = {
+    Op.PLUS: BINARY_ADD_CONST,
+    Op.MINUS: BINARY_SUB_CONST,
+    Op.MUL: BINARY_MUL_CONST,
+    Op.LT: COMPARE_LT_CONST,
+    Op.GT: COMPARE_GT_CONST,
+    Op.EQ: COMPARE_EQ_CONST,
+    Op.NE: COMPARE_NE_CONST,
+    Op.LE: COMPARE_LE_CONST,
+    Op.GE: COMPARE_GE_CONST,
+}
+
+# Инструкции, чей аргумент - индекс в пуле имён
+NAME_OPS = {
+    LOAD_NAME,
+    STORE_NAME,
+    LOAD_FUNC,
+    MAKE_FUNCTION,
+    STORE_GLOBAL,
+    LOAD_GLOBAL,
+    MAKE_ARRAY,
+    STORE_INDEX,
+    LOAD_INDEX,
+    SIZE_OF,
+    ADDRESS_OF,
+    SLICE,
+    STORE_SLICE,
+}
+
+
+class CodeObject:
+    __slots__ = ("name", "code", "consts", "names", "params")
+
+    def __init__(self, name: str, params: list[str] = None):
+        self.name = name
+        self.code: list[int] = []
+        self.consts: list = []
+        self.names: list[str] = []
+        self.params: list[str] = params or []
+
+    def dis(self) -> str:
+        lines = [f"code object {self.name}({', '.join(self.params)})"]
+        for pc in range(0, len(self.code), 2):
+            op, arg = self.code[pc], self.code[pc + 1]
+            if op in (LOAD_CONST, MOVE, SLIDE) or op >= BINARY_ADD_CONST:
+                detail = f"({self.consts[arg]!r})"
+            elif op in NAME_OPS:
+                detail = f"({self.names[arg]})"
+            else:
+                detail = ""
+            lines.append(f"{pc:>6} {OPNAMES[op]:<16} {arg} {detail}")
+        return "\n".join(lines)
+
+
+class Compiler(NodeVisitor):
+    """Переводит AST из src/logic.py в байткод для src/vm.py.
+
+    Значение каждого оператора попадает в регистр результата кадра
+    (POP_RESULT): по нему tree-walking Interpreter определяет результат
+    программы и функции, так что поведение обоих движков совпадает.
+    """
+
+    def __init__(self, tail_calls: set = None):
+        self.co: CodeObject = None
+        # Хвостовые вызовы (TailCalls.tail)
+        self.tail_calls = tail_calls if tail_calls is not None else set()
+        self._consts: dict = {}
+        self._names: dict[str, int] = {}
+
+    def compile(self, tree: list[AST], name: str = "<module>") -> CodeObject:
+        return self._compile_body(CodeObject(name), tree)
+
+    def compile_function(self, node: FunctionDecl) -> CodeObject:
+        return self._compile_body(
+            CodeObject(node.name, list(node.params)), node.body
+        )
+
+    def _compile_body(self, co: CodeObject, body: list[AST]) -> CodeObject:
+        outer = self.co, self._consts, self._names
+        self.co, self._consts, self._names = co, {}, {}
+        try:
+            self.compile_block(body)
+            self.emit(END)
+        finally:
+            self.co, self._consts, self._names = outer
+        return co
+
+    def emit(self, op: int, arg: int = 0) -> int:
+        code = self.co.code
+        code.append(op)
+        code.append(arg)
+        return len(code) - 2
+
+    def patch(self, pos: int, target: int = None):
+        self.co.code[pos + 1] = len(self.co.code) if target is None else target
+
+    def const(self, value) -> int:
+        try:
+            key = (type(value), value)
+            hash(key)
+        except TypeError:
+            key = id(value)
+        if key not in self._consts:
+            self._consts[key] = len(self.co.consts)
+            self.co.consts.append(value)
+        return self._consts[key]
+
+    def name(self, name: str) -> int:
+        if name not in self._names:
+            self._names[name] = len(self.co.names)
+            self.co.names.append(name)
+        return self._names[name]
+
+    def compile_block(self, statements: list[AST]):
+        for stmt in statements or []:
+            self.visit(stmt)
+            if not isinstance(stmt, (If, While)):
+                self.emit(POP_RESULT)
+
+    def visit_Num(self, node: Num):
+        self.emit(LOAD_CONST, self.const(node.value))
+
+    def visit_Str(self, node: Str):
+        self.emit(LOAD_CONST, self.const(node.value))
+
+    def visit_Var(self, node: Var):
+        if node.slot >= 0:
+            self.emit(LOAD_FAST, node.slot)
+        elif node.slot == GLOBAL:
+            self.emit(LOAD_GLOBAL, self.name(node.value))
+        else:
+            self.emit(LOAD_NAME, self.name(node.value))
+
+    def store(self, name: str, slot: int):
+        if slot >= 0:
+            self.emit(STORE_FAST, slot)
+        else:
+            self.emit(STORE_NAME, self.name(name))
+
+    def visit_BinOp(self, node: BinOp):
+        self.visit(node.left)
+        right = node.right
+        if (
+            type(right) is Num
+            and type(right.token) is int
+            and node.op in CONST_OPS
+        ):
+            self.emit(CONST_OPS[node.op], self.const(right.token))
+            return
+        self.visit(right)
+        self.emit(BINARY_OPS[node.op])
+
+    def visit_Assign(self, node: Assign):
+        self.visit(node.right)
+        self.store(node.left.value, node.left.slot)
+
+    def visit_VarDecl(self, node: VarDecl):
+        if node.init_value:
+            self.visit(node.init_value)
+            self.store(node.var_name, node.slot)
+            return
+        self.emit(LOAD_CONST, self.const(None))
+        if node.slot >= 0:
+            self.emit(SET_FAST, node.slot)
+        else:
+            self.emit(STORE_GLOBAL, self.name(node.var_name))
+
+    def visit_PointerDecl(self, node: PointerDecl):
+        if node.init_value:
+            self.visit(node.init_value)
+        else:
+            self.emit(LOAD_CONST, self.const(None))
+        self.emit(STORE_GLOBAL, self.name(node.var_name))
+
+    def visit_Print(self, node: Print):
+        self.visit(node.expr)
+        self.emit(PRINT)
+
+    def visit_Return(self, node: Return):
+        if isinstance(node.expr, FunctionCall):
+            self.compile_call(node.expr, check_none=True)
+        else:
+            self.visit(node.expr)
+        self.emit(RETURN_VALUE)
+
+    def visit_Move(self, node: Move):
+        self.emit(MOVE, self.const(node.direction))
+
+    def visit_Slide(self, node: Slide):
+        self.emit(SLIDE, self.const(node.direction))
+
+    def visit_FunctionDecl(self, node: FunctionDecl):
+        self.emit(LOAD_CONST, self.const(node))
+        self.emit(MAKE_FUNCTION, self.name(node.name))
+
+    def visit_FunctionCall(self, node: FunctionCall):
+        self.compile_call(node)
+
+    def compile_call(self, node: FunctionCall, check_none: bool = False):
+        self.emit(LOAD_FUNC, self.name(node.name))
+        for arg in node.arguments:
+            self.visit(arg)
+        argc = len(node.arguments)
+        if node in self.tail_calls:
+            # Младший бит: результат проверяется, как в RETURN_VALUE.
+            # Если VM не сможет заменить кадр, это обычный CALL, и
+            # исполнение продолжится со следующей инструкции.
+            self.emit(TAIL_CALL, argc << 1 | check_none)
+        else:
+            self.emit(CALL, argc)
+
+    def visit_ArrayDecl(self, node: ArrayDecl):
+        if isinstance(node.size_expr, (Num, Var, BinOp, Neg)):
+            self.visit(node.size_expr)
+        else:
+            self.emit(LOAD_CONST, self.const(node.size_expr))
+        self.emit(MAKE_ARRAY, self.name(node.var_name))
+
+    def visit_ArrayAssignment(self, node: ArrayAssignment):
+        self.visit(node.index)
+        self.visit(node.value)
+        self.emit(STORE_INDEX, self.name(node.array_name))
+
+    def visit_ArrayAccess(self, node: ArrayAccess):
+        self.visit(node.index_expr)
+        self.emit(LOAD_INDEX, self.name(node.array_name))
+
+    def visit_ArraySlice(self, node: ArraySlice):
+        self.visit(node.start)
+        self.visit(node.end)
+        self.emit(SLICE, self.name(node.array_name))
+
+    def visit_SliceAssignment(self, node: SliceAssignment):
+        if node.start is None:
+            self.emit(LOAD_CONST, self.const(None))
+            self.emit(LOAD_CONST, self.const(None))
+        else:
+            self.visit(node.start)
+            self.visit(node.end)
+        self.visit(node.value)
+        self.emit(STORE_SLICE, self.name(node.array_name))
+
+    def visit_SizeOf(self, node: SizeOf):
+        self.emit(SIZE_OF, self.name(node.identifier))
+
+    def visit_LenOf(self, node: LenOf):
+        self.visit(node.expr)
+        self.emit(LEN_OF)
+
+    def visit_AddressOf(self, node: AddressOf):
+        self.emit(ADDRESS_OF, self.name(node.name))
+
+    def visit_Neg(self, node: Neg):
+        self.visit(node.expr)
+        self.emit(UNARY_NEG)
+
+    def visit_Unarop(self, node: Unarop):
+        self.visit(node.expr)
+        self.emit(DEREF)
+
+    def visit_If(self, node: If):
+        self.emit(CLEAR_RESULT)
+        self.visit(node.condition)
+        to_else = self.emit(JUMP_IF_FALSE)
+        self.compile_block(node.true_branch)
+        if node.false_branch:
+            to_end = self.emit(JUMP)
+            self.patch(to_else)
+            self.compile_block(node.false_branch)
+            self.patch(to_end)
+        else:
+            self.patch(to_else)
+
+    def visit_While(self, node: While):
+        # Условие проверяется в конце тела, чтобы на итерацию
+        # приходился один переход. Первая проверка решает, нужен ли instead.
+        self.emit(CLEAR_RESULT)
+        self.visit(node.condition)
+        to_instead = self.emit(JUMP_IF_FALSE)
+        loop = len(self.co.code)
+        self.compile_block(node.body)
+        self.visit(node.condition)
+        self.emit(JUMP_IF_TRUE, loop)
+        if node.instead_body:
+            to_end = self.emit(JUMP)
+            self.patch(to_instead)
+            self.compile_block(node.instead_body)
+            self.patch(to_end)
+        else:
+            self.patch(to_instead)
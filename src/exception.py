@@ -1,2 +1,12 @@
 class InterpError(Exception):
     pass
+
+
+class LimitExceeded(InterpError):
+    """Исполнение превысило лимит ресурса (src/limits.py)."""
+
+    def __init__(self, resource: str, limit, used):
+        self.resource = resource
+        self.limit = limit
+        self.used = used
+        super().__init__(f"Limit exceeded: {resource} {used} > {limit}")
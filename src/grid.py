@@ -0,0 +1,515 @@
+import mmap
+import struct
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+
+from src.limits import charge
+
+# Заголовок файла карты: сигнатура, бит на клетку, ширина, высота
+MAGIC = b"RMAP"
+HEADER = struct.Struct("<4sB3xII")
+
+FREE, WALL = 0, 1
+
+
+class Grid:
+    """Карта робота: клетки подряд в одном буфере, по байту на клетку.
+
+    Клетка (x, y) лежит в cells[y * width + x], 0 - свободно, иначе
+    препятствие. Буфер - bytearray или кусок mmap файла карты (load),
+    так что несколько процессов могут делить одну копию карты.
+    Клетки меняются только через set: он увеличивает version, по
+    которому Routes узнаёт, что кэш расстояний устарел, и поправляет
+    таблицы свободных отрезков runs. Как и прежний двумерный список,
+    карта индексируется grid[y][x] (GridRow) и перебирается по строкам.
+    """
+
+    BITS = 8
+
+    __slots__ = ("width", "height", "cells", "version", "_runs", "_mmap")
+
+    def __init__(self, width: int, height: int, cells=None):
+        if width <= 0 or height <= 0:
+            raise ValueError(f"Bad grid size {width}x{height}")
+        self.width = width
+        self.height = height
+        size = self.buffer_size(width, height)
+        if cells is None:
+            cells = bytearray(size)
+        elif len(cells) != size:
+            raise ValueError(f"Grid buffer of {len(cells)} bytes, need {size}")
+        self.cells = cells
+        self.version = 0
+        self._runs = None
+        self._mmap = None
+
+    @classmethod
+    def buffer_size(cls, width: int, height: int) -> int:
+        return width * height
+
+    @classmethod
+    def from_rows(cls, rows) -> "Grid":
+        """Карта из двумерного списка (строки по y)."""
+        grid = cls(len(rows[0]), len(rows))
+        for y, row in enumerate(rows):
+            if len(row) != grid.width:
+                raise ValueError(f"Row {y} has {len(row)} cells")
+            for x, cell in enumerate(row):
+                if cell:
+                    grid.set(x, y, WALL)
+        return grid
+
+    def free(self, x: int, y: int) -> bool:
+        """Можно ли встать на клетку: внутри карты и не препятствие."""
+        return (
+            0 <= x < self.width
+            and 0 <= y < self.height
+            and not self.cells[y * self.width + x]
+        )
+
+    def get(self, x: int, y: int) -> int:
+        return self.cells[y * self.width + x]
+
+    def set(self, x: int, y: int, value: int):
+        self._write(x, y, value)
+        self.version += 1
+        if self._runs is not None:
+            self._runs.update(x, y)
+
+    def _write(self, x: int, y: int, value: int):
+        self.cells[y * self.width + x] = WALL if value else FREE
+
+    @property
+    def runs(self) -> "Runs":
+        if self._runs is None:
+            self._runs = Runs(self)
+        return self._runs
+
+    def walls(self):
+        """Клетки по байту на каждую, подряд по строкам."""
+        return self.cells
+
+    def wall(self, i: int) -> int:
+        """Клетка с индексом i = y * width + x."""
+        return self.cells[i]
+
+    def __len__(self) -> int:
+        return self.height
+
+    def __getitem__(self, y: int) -> "GridRow":
+        return GridRow(self, _index(y, self.height))
+
+    def __iter__(self):
+        return (GridRow(self, y) for y in range(self.height))
+
+    def to_rows(self) -> list[list[int]]:
+        return [
+            [self.get(x, y) for x in range(self.width)]
+            for y in range(self.height)
+        ]
+
+    def save(self, path):
+        with open(path, "wb") as out:
+            out.write(HEADER.pack(MAGIC, self.BITS, self.width, self.height))
+            out.write(self.cells)
+
+    @staticmethod
+    def load(path, mode: str = "r") -> "Grid":
+        """Отображает файл карты в память без чтения целиком.
+
+        mode: "r" - только чтение, "c" - копия при записи (изменения
+        видны только этому процессу), "w" - запись прямо в файл.
+        Класс (Grid или BitGrid) выбирается по заголовку.
+        """
+        access = {
+            "r": mmap.ACCESS_READ,
+            "c": mmap.ACCESS_COPY,
+            "w": mmap.ACCESS_WRITE,
+        }[mode]
+        with open(path, "rb" if mode == "r" else "r+b") as inp:
+            mapped = mmap.mmap(inp.fileno(), 0, access=access)
+        try:
+            magic, bits, width, height = HEADER.unpack_from(mapped)
+            if magic != MAGIC or bits not in GRID_TYPES:
+                raise ValueError(f"{Path(path)} is not a robot map")
+            cls = GRID_TYPES[bits]
+            end = HEADER.size + cls.buffer_size(width, height)
+            if len(mapped) < end:
+                raise ValueError(f"{Path(path)} is truncated")
+            grid = cls(width, height, memoryview(mapped)[HEADER.size:end])
+        except Exception:
+            mapped.close()
+            raise
+        grid._mmap = mapped
+        return grid
+
+    def close(self):
+        if self._mmap is not None:
+            self.cells.release()
+            self._mmap.close()
+            self._mmap = None
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.width}x{self.height})"
+
+
+class BitGrid(Grid):
+    """Карта по биту на клетку: 20000x20000 занимает 50 МБ."""
+
+    BITS = 1
+
+    __slots__ = ()
+
+    @classmethod
+    def buffer_size(cls, width: int, height: int) -> int:
+        return (width * height + 7) >> 3
+
+    def free(self, x: int, y: int) -> bool:
+        if 0 <= x < self.width and 0 <= y < self.height:
+            i = y * self.width + x
+            return not self.cells[i >> 3] >> (i & 7) & 1
+        return False
+
+    def get(self, x: int, y: int) -> int:
+        i = y * self.width + x
+        return self.cells[i >> 3] >> (i & 7) & 1
+
+    def _write(self, x: int, y: int, value: int):
+        i = y * self.width + x
+        if value:
+            self.cells[i >> 3] |= 1 << (i & 7)
+        else:
+            self.cells[i >> 3] &= ~(1 << (i & 7)) & 0xFF
+
+    def walls(self):
+        unpacked = b"".join(map(UNPACKED_BYTES.__getitem__, self.cells))
+        return unpacked[: self.width * self.height]
+
+    def wall(self, i: int) -> int:
+        return self.cells[i >> 3] >> (i & 7) & 1
+
+
+class GridRow:
+    """Строка y карты: row[x] читает клетку, row[x] = v пишет её через
+    Grid.set (version и runs остаются верными)."""
+
+    __slots__ = ("grid", "y")
+
+    def __init__(self, grid: Grid, y: int):
+        self.grid = grid
+        self.y = y
+
+    def __len__(self) -> int:
+        return self.grid.width
+
+    def __getitem__(self, x: int) -> int:
+        return self.grid.get(_index(x, self.grid.width), self.y)
+
+    def __setitem__(self, x: int, value: int):
+        self.grid.set(_index(x, self.grid.width), self.y, value)
+
+    def __iter__(self):
+        get, y = self.grid.get, self.y
+        return (get(x, y) for x in range(self.grid.width))
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+def _index(i: int, size: int) -> int:
+    """Индекс как у списка: отрицательные - с конца, вне - IndexError."""
+    if i < 0:
+        i += size
+    if not 0 <= i < size:
+        raise IndexError("grid index out of range")
+    return i
+
+
+# Байт карты BitGrid -> 8 байт по клетке (младший бит - первая клетка)
+UNPACKED_BYTES = [
+    bytes((byte >> bit) & 1 for bit in range(8)) for byte in range(256)
+]
+
+
+GRID_TYPES = {Grid.BITS: Grid, BitGrid.BITS: BitGrid}
+
+
+# Клетка недостижима из цели
+UNREACHABLE = -1
+
+# Карты до стольких клеток получают поле целиком (4 байта на клетку),
+# большие - LazyField по мере надобности
+DENSE_CELLS = 1 << 22
+# Сколько памяти могут занимать поля в кэше Routes
+MAX_FIELD_BYTES = 256 << 20
+# Примерная цена клетки LazyField: запись словаря и ключ int
+LAZY_CELL_BYTES = 64
+
+
+def distance_field(grid: Grid, x: int, y: int) -> array:
+    """Поиск в ширину от (x, y): число шагов до цели из каждой клетки."""
+    width = grid.width
+    walls = grid.walls()
+    size = width * grid.height
+    field = array("i", [UNREACHABLE]) * size
+    target = y * width + x
+    field[target] = 0
+    frontier = [target]
+    steps = 0
+    while frontier:
+        charge(len(frontier))
+        steps += 1
+        next_frontier = []
+        for i in frontier:
+            column = i % width
+            for j in (
+                i - width,
+                i + width,
+                i - 1 if column else -1,
+                i + 1 if column < width - 1 else -1,
+            ):
+                if 0 <= j < size and field[j] < 0 and not walls[j]:
+                    field[j] = steps
+                    next_frontier.append(j)
+        frontier = next_frontier
+    return field
+
+
+class LazyField:
+    """Поле расстояний до цели, построенное только там, где спросили.
+
+    Поиск в ширину от цели идёт слоями и останавливается на слое, где
+    нашлась нужная клетка; следующий запрос продолжает его с того же
+    места. Память - словарь по пройденным клеткам, а не массив на всю
+    карту. Индексация как у поля distance_field; known не продолжает
+    поиск.
+    """
+
+    __slots__ = ("grid", "distances", "frontier", "steps")
+
+    def __init__(self, grid: Grid, x: int, y: int):
+        self.grid = grid
+        target = y * grid.width + x
+        self.distances = {target: 0}
+        self.frontier = [target]
+        self.steps = 0
+
+    def __getitem__(self, i: int) -> int:
+        distances = self.distances
+        while i not in distances and self.frontier:
+            self._expand()
+        return distances.get(i, UNREACHABLE)
+
+    def known(self, i: int) -> int:
+        return self.distances.get(i, UNREACHABLE)
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.distances) * LAZY_CELL_BYTES
+
+    def _expand(self):
+        grid = self.grid
+        width = grid.width
+        size = width * grid.height
+        wall = grid.wall
+        distances = self.distances
+        charge(len(self.frontier))
+        self.steps += 1
+        steps = self.steps
+        next_frontier = []
+        for i in self.frontier:
+            column = i % width
+            for j in (
+                i - width,
+                i + width,
+                i - 1 if column else -1,
+                i + 1 if column < width - 1 else -1,
+            ):
+                if 0 <= j < size and j not in distances and not wall(j):
+                    distances[j] = steps
+                    next_frontier.append(j)
+        self.frontier = next_frontier
+
+
+def field_bytes(field) -> int:
+    if isinstance(field, LazyField):
+        return field.nbytes
+    return len(field) * field.itemsize
+
+
+class Routes:
+    """Кэш полей расстояний карты по целям (LRU на maxsize целей).
+
+    Первый маршрут к цели строит поле поиском в ширину, дальше число
+    шагов - одно чтение, а сам путь (path) - O(длины пути). Поле
+    пересчитывается, если с момента построения менялась карта.
+    Карта больше dense_cells клеток получает LazyField. Поля в кэше
+    занимают не больше max_bytes: старые вытесняются, последнее
+    остаётся, даже если одно больше.
+    """
+
+    def __init__(
+        self,
+        grid: Grid,
+        maxsize: int = 8,
+        max_bytes: int = MAX_FIELD_BYTES,
+        dense_cells: int = DENSE_CELLS,
+    ):
+        self.grid = grid
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.dense_cells = dense_cells
+        self.fields: OrderedDict = OrderedDict()
+
+    def field(self, x: int, y: int):
+        target = x, y
+        grid = self.grid
+        cached = self.fields.get(target)
+        if cached is not None and cached[0] == grid.version:
+            self.fields.move_to_end(target)
+            field = cached[1]
+        else:
+            if grid.width * grid.height <= self.dense_cells:
+                field = distance_field(grid, x, y)
+            else:
+                field = LazyField(grid, x, y)
+            self.fields[target] = grid.version, field
+            self.fields.move_to_end(target)
+        self.evict()
+        return field
+
+    def evict(self):
+        fields = self.fields
+        while len(fields) > self.maxsize:
+            fields.popitem(last=False)
+        # LazyField растёт после запросов: размер считается каждый раз
+        total = sum(field_bytes(field) for _, field in fields.values())
+        while len(fields) > 1 and total > self.max_bytes:
+            _, (_, field) = fields.popitem(last=False)
+            total -= field_bytes(field)
+
+    def steps(self, start: tuple, target: tuple) -> int:
+        """Длина кратчайшего пути или UNREACHABLE."""
+        (x, y), (tx, ty) = start, target
+        if not self.grid.free(tx, ty):
+            return UNREACHABLE
+        return self.field(tx, ty)[y * self.grid.width + x]
+
+    def path(self, start: tuple, target: tuple) -> list[tuple]:
+        """Клетки кратчайшего пути от start до target включительно."""
+        if self.steps(start, target) == UNREACHABLE:
+            return []
+        field = self.field(*target)
+        # Соседи на пути ближе к цели, чем start, и LazyField их уже знает
+        known = getattr(field, "known", field.__getitem__)
+        width = self.grid.width
+        x, y = start
+        path = [start]
+        while (x, y) != target:
+            here = known(y * width + x)
+            for nx, ny in ((x, y - 1), (x, y + 1), (x - 1, y), (x + 1, y)):
+                if (
+                    0 <= nx < width
+                    and 0 <= ny < self.grid.height
+                    and known(ny * width + nx) == here - 1
+                ):
+                    x, y = nx, ny
+                    break
+            path.append((x, y))
+        return path
+
+
+class Runs:
+    """Свободные отрезки карты по строкам и столбцам.
+
+    Для строки y хранятся два массива по x: начало и конец свободного
+    отрезка, в котором лежит клетка (для стены - она сама). Тогда
+    «ехать вправо до упора» - одно чтение: конец отрезка за соседней
+    клеткой. Таблицы строятся при первом обращении к строке (столбцу),
+    а Grid.set пересчитывает только отрезок вокруг изменённой клетки.
+    """
+
+    def __init__(self, grid: Grid):
+        self.grid = grid
+        self.rows: dict[int, tuple[array, array]] = {}
+        self.columns: dict[int, tuple[array, array]] = {}
+
+    def row(self, y: int) -> tuple[array, array]:
+        line = self.rows.get(y)
+        if line is None:
+            line = self.rows[y] = self._build(self.grid.width)
+            self._scan(line, self._row_free(y), 0, self.grid.width - 1)
+        return line
+
+    def column(self, x: int) -> tuple[array, array]:
+        line = self.columns.get(x)
+        if line is None:
+            line = self.columns[x] = self._build(self.grid.height)
+            self._scan(line, self._column_free(x), 0, self.grid.height - 1)
+        return line
+
+    def _row_free(self, y: int):
+        free = self.grid.free
+        return lambda x: free(x, y)
+
+    def _column_free(self, x: int):
+        free = self.grid.free
+        return lambda y: free(x, y)
+
+    @staticmethod
+    def _build(size: int) -> tuple[array, array]:
+        return array("i", range(size)), array("i", range(size))
+
+    @staticmethod
+    def _scan(line: tuple, free, lo: int, hi: int):
+        """Заполняет line для клеток lo..hi (за ними - стена или край)."""
+        charge(hi - lo + 1)
+        start, end = line
+        i = lo
+        while i <= hi:
+            j = i
+            if free(i):
+                while j < hi and free(j + 1):
+                    j += 1
+            for k in range(i, j + 1):
+                start[k] = i
+                end[k] = j
+            i = j + 1
+
+    def update(self, x: int, y: int):
+        """Клетка (x, y) изменилась: пересчитать затронутые отрезки."""
+        if y in self.rows:
+            self._update(self.rows[y], self._row_free(y), x)
+        if x in self.columns:
+            self._update(self.columns[x], self._column_free(x), y)
+
+    def _update(self, line: tuple, free, i: int):
+        # Соседние клетки не менялись, их отрезки ещё верны
+        start, end = line
+        lo = start[i - 1] if free(i - 1) else i
+        hi = end[i + 1] if free(i + 1) else i
+        self._scan(line, free, lo, hi)
+
+    def distance(self, x: int, y: int, direction: str) -> int:
+        """Сколько клеток робот из (x, y) проедет в direction до упора."""
+        free = self.grid.free
+        if direction == "right":
+            return self.row(y)[1][x + 1] - x if free(x + 1, y) else 0
+        if direction == "left":
+            return x - self.row(y)[0][x - 1] if free(x - 1, y) else 0
+        if direction == "bottom":
+            return self.column(x)[1][y + 1] - y if free(x, y + 1) else 0
+        if direction == "top":
+            return y - self.column(x)[0][y - 1] if free(x, y - 1) else 0
+        raise ValueError(f"Unknown direction: {direction}")
+
+
+def as_grid(grid) -> Grid:
+    """Grid как есть, двумерный список - в Grid."""
+    if isinstance(grid, Grid):
+        return grid
+    return Grid.from_rows(grid)
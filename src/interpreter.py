@@ -1,84 +1,141 @@
-from copy import copy
+import copy
 import sys
-from typing import TypeAlias
-from src.exception import InterpError
+import weakref
+from typing import Iterable, TypeAlias
+from src.exception import InterpError, LimitExceeded
 from src.parser import get_parser
+from src.pratt import PrattParser
 from src.lexer import get_lexer
 from src.logic import *
-
-
-class NodeVisitor:
-    def visit(self, node):
-        if isinstance(node, str):
-            print(node)
-        method_name = "visit_" + type(node).__name__
-        visitor = getattr(self, method_name, self.generic_visit)
-        return visitor(node)
-
-    def generic_visit(self, node):
-        raise Exception(f"No visit_{type(node).__name__} method")
-
-    def print_ast(self, node, indent=""):
-        if isinstance(node, list):
-            for n in node:
-                self.print_ast(n, indent)
-        else:
-            print(f"{indent}{type(node).__name__}: {self.node_to_dict(node)}")
-            indent += "  "
-            for child in self.node_to_dict(node).values():
-                if isinstance(child, (AST, list)):
-                    self.print_ast(child, indent)
-
-    def node_to_dict(self, node):
-        if hasattr(node, "__dict__"):
-            return vars(node)
-        elif hasattr(node, "__slots__"):
-            return {
-                slot: getattr(node, slot)
-                for slot in getattr(node, "__slots__")
-            }
-        else:
-            return {}
+from src.visitor import NodeVisitor
+from src.vm import MAX_CALL_DEPTH, VM
+from src.arrays import (
+    TYPECODE,
+    IntArray,
+    ObjectArray,
+    assign_slice,
+    copy_array,
+    fill_items,
+    is_array,
+)
+from src.builtins import resolve_function
+from src.cache import ProgramCache
+from src.closures import ClosureCompiler
+from src.grid import UNREACHABLE, Grid, Routes, as_grid
+from src.limits import Budget, Limits, activate, charge
+from src.optimizer import Optimizer
+from src.output import RobotEvent, StdoutSink
+from src.profiler import Profiler
+from src.resolver import DYNAMIC, GLOBAL, UNSET, Frame, Resolver
+from src.snapshot import Snapshot
+from src.purity import MISS, MemoCache, Purity
+from src.tailcalls import TailCalls
+
+# Сколько кадров вызывающих может проверить кэш места переменной
+SITE_DEPTH = 4
+
+# Движки исполнения: обход дерева, байткод на стековой машине
+# или дерево заранее собранных замыканий. Глубокая рекурсия - только
+# vm: tree и closure вызывают функции на стеке Python (MAX_CALL_DEPTH)
+ENGINES = ("tree", "vm", "closure")
+
+# Подсказка к --engine (src/batch.py, src/server.py)
+ENGINE_HELP = (
+    "vm - байткод, кадры в куче: рекурсия на миллионы вызовов; tree и"
+    " closure вызывают функции на стеке Python: порядка сотни"
+    " вложенных вызовов"
+)
+
+# Ошибка вместо RecursionError у tree и closure
+STACK_DEPTH_ERROR = (
+    "Maximum call depth exceeded: the {engine} engine calls functions"
+    " on the Python stack, use the vm engine for deep recursion"
+)
 
 
 class Robot:
-    def __init__(self, grid, start_position=(0, 0)):
-        # grid - это двумерный список, представляющий карту. 0 - свободная клетка, 1 - препятствие.
-        self.grid = grid
+    def __init__(self, grid, start_position=(0, 0), sink: StdoutSink = None):
+        # grid - Grid (src/grid.py) или двумерный список, представляющий
+        # карту. 0 - свободная клетка, 1 - препятствие.
+        self.grid: Grid = as_grid(grid)
         self.position = start_position  # Текущая позиция робота (x, y)
+        self.routes = Routes(self.grid)
+        # Куда сообщать о движениях (src/output.py)
+        self.sink = sink if sink is not None else StdoutSink()
 
     def move_top(self):
         x, y = self.position
-        if y > 0 and self.grid[y - 1][x] == 0:
+        if self.grid.free(x, y - 1):
             self.position = (x, y - 1)
             return 1
-        print(f"Cannot move top from position {self.position}")
+        self.sink.event(RobotEvent("blocked", self.position, "top"))
         return 0
 
     def move_bottom(self):
         x, y = self.position
-        if y < len(self.grid) - 1 and self.grid[y + 1][x] == 0:
+        if self.grid.free(x, y + 1):
             self.position = (x, y + 1)
             return 1
-        print(f"Cannot move bottom from position {self.position}")
+        self.sink.event(RobotEvent("blocked", self.position, "bottom"))
         return 0
 
     def move_left(self):
         x, y = self.position
-        if x > 0 and self.grid[y][x - 1] == 0:
+        if self.grid.free(x - 1, y):
             self.position = (x - 1, y)
             return 1
-        print(f"Cannot move left from position {self.position}")
+        self.sink.event(RobotEvent("blocked", self.position, "left"))
         return 0
 
     def move_right(self):
         x, y = self.position
-        if x < len(self.grid[0]) - 1 and self.grid[y][x + 1] == 0:
+        if self.grid.free(x + 1, y):
             self.position = (x + 1, y)
             return 1
-        print(f"Cannot move right from position {self.position}")
+        self.sink.event(RobotEvent("blocked", self.position, "right"))
         return 0
 
+    def slide(self, direction: str):
+        """Едет в direction до препятствия или края карты.
+
+        Возвращает число пройденных клеток, 0 - если не сдвинулся."""
+        x, y = self.position
+        steps = self.grid.runs.distance(x, y, direction)
+        if not steps:
+            self.sink.event(RobotEvent("blocked", self.position, direction))
+            return 0
+        if direction == "right":
+            self.position = (x + steps, y)
+        elif direction == "left":
+            self.position = (x - steps, y)
+        elif direction == "bottom":
+            self.position = (x, y + steps)
+        else:
+            self.position = (x, y - steps)
+        return steps
+
+    def goto(self, x: int, y: int):
+        """Переходит в (x, y) кратчайшим путём, возвращает число шагов.
+
+        0, если цель недостижима (робот остаётся на месте)."""
+        if self.routes.grid is not self.grid:
+            self.routes = Routes(self.grid)
+        steps = self.routes.steps(self.position, (x, y))
+        if steps == UNREACHABLE:
+            self.sink.event(
+                RobotEvent("unreachable", self.position, target=(x, y))
+            )
+            return 0
+        self.position = (x, y)
+        return steps
+
+    def fork(self, sink: StdoutSink = None) -> "Robot":
+        """Робот в той же позиции; карта и кэш маршрутов общие."""
+        robot = copy.copy(self)
+        if sink is not None:
+            robot.sink = sink
+        return robot
+
 
 Id2Var: TypeAlias = dict[int, str]
 Var2Id: TypeAlias = dict[str, int]
@@ -94,52 +151,104 @@ Var2Id: TypeAlias = dict[str, int]
 
 
 class Variables:
-    STACK_MAX_DEPTH = 1000
+    """Адреса переменных для &x и *p.
+
+    Переменная получает адрес при первом присваивании в своей области
+    видимости (глубине стека вызовов) и сохраняет его, пока область
+    жива. При снятии кадра функции адреса его переменных освобождаются
+    и выдаются заново, поэтому таблица не растёт на долгих циклах.
+    Области заводятся по мере углубления стека.
+    """
 
     def __init__(self):
-        self.counter = 0
-        self.skopes: list[Var2Id] = [{} for _ in range(self.STACK_MAX_DEPTH)]
+        self.skopes: list[Var2Id] = [{}]
         self.ids: Id2Var = dict()
+        self.free: list[int] = []  # освобождённые адреса
 
     def init_var(self, var_name: str, skope: int = 0):
-        _id = self.counter
-        self.counter += 1
-        cur_sckope = self.skopes[skope]
+        skopes = self.skopes
+        while skope >= len(skopes):
+            skopes.append({})
+        cur_sckope = skopes[skope]
+        if var_name in cur_sckope:
+            return
+        _id = self.free.pop() if self.free else len(self.ids)
         self.ids[_id] = var_name
         cur_sckope[var_name] = _id
 
-    @classmethod
-    def parse_name(cls, var_name: str) -> tuple[int, str]:
-        s, n = var_name.split(":", 1)
-        return int(s), n
+    def release(self, skope: int):
+        """Освобождает адреса области skope и всех более глубоких.
 
-    @classmethod
-    def calc_name(cls, name: str, stack: list) -> str:
-        return f"{len(stack)}:{name}"
+        Области глубже skope отбрасываются: список не длиннее стека
+        вызовов, и снятие кадра не перебирает давно снятые области."""
+        skopes = self.skopes
+        for cur_sckope in skopes[skope:]:
+            for _id in cur_sckope.values():
+                del self.ids[_id]
+                self.free.append(_id)
+            cur_sckope.clear()
+        del skopes[max(skope, 1) :]
 
-    def get_id_by_name(self, var_name: str) -> int:
-        skope, name = self.parse_name(var_name)
-        return self.skopes[skope][name]  # Exception
+    def get_id(self, var_name: str, skope: int) -> int:
+        if skope >= len(self.skopes):
+            raise KeyError(var_name)
+        return self.skopes[skope][var_name]  # Exception
 
     def get_name_by_id(self, vid: int) -> str:
         return self.ids[vid]  # Exception
 
+    def copy(self) -> "Variables":
+        other = Variables()
+        other.skopes = [dict(skope) for skope in self.skopes]
+        other.ids = dict(self.ids)
+        other.free = list(self.free)
+        return other
+
 
 class Interpreter(NodeVisitor):
-    def __init__(self, robot: Robot):
+    def __init__(
+        self,
+        robot: Robot,
+        max_depth: int = MAX_CALL_DEPTH,
+        memo_size: int = 1024,
+        output: StdoutSink = None,
+        profiler: Profiler = None,
+    ):
         self.robot: Robot = robot
+        # Вывод print и события робота; общий с роботом
+        if output is not None:
+            robot.sink = output
+        self.output = robot.sink
+        # Профилировщик движка tree (src/profiler.py), None - выключен
+        self.profiler = profiler
         self.global_env = {}
-        self.current_env = self.global_env
+        self.current_frame: Frame = None  # None - верхний уровень
         self.variables = Variables()
-        self.call_stack = []  # Стек вызовов функций
+        self.call_stack: list[Frame] = []  # Стек вызовов функций
+        self.resolver = Resolver()
+        self.tail_calls = TailCalls()
+        # Предел глубины вызовов (push_frame); tree и closure раньше
+        # упираются в стек Python, см. MAX_CALL_DEPTH
+        self.max_depth = max_depth
+        # Результаты чистых функций
+        self.purity = Purity()
+        self.memo = MemoCache(memo_size, self.purity.pure)
+        # Расход ресурсов последнего запуска с лимитами, None - без них
+        self.budget: Budget = None
+        # Места чтения переменных из кадров вызывающих (lookup_site)
+        self.sites: dict[Var, tuple] = {}
+        # Массивы, общие со снимками и ветками (src/snapshot.py), по id:
+        # перед записью такой массив копируется (share_arrays)
+        self.shared_arrays: dict[int, weakref.ref] = {}
 
     def visit_LenOf(self, node):
         # Получаем выражение из узла
-        expr = self.visit(node.expr)
+        return self.len_of(self.visit(node.expr))
 
+    def len_of(self, expr):
         if isinstance(expr, (int, float, str)):
             return 1
-        elif isinstance(expr, list):
+        elif isinstance(expr, (list, IntArray)):
             return len(expr)
         else:
             raise Exception(
@@ -148,30 +257,43 @@ class Interpreter(NodeVisitor):
 
     def visit_Print(self, node):
         value = self.visit(node.expr)
-        print(value)
+        self.output.print(value)
         return value
 
     def visit_AddressOf(self, node: AddressOf) -> int:
-        var_name = Variables.calc_name(node.name, self.call_stack)
-        return self.variables.get_id_by_name(var_name)
+        return self.address_of(node.name)
+
+    def address_of(self, name: str) -> int:
+        return self.variables.get_id(name, len(self.call_stack))
 
     def visit_ArrayAssignment(self, node: ArrayAssignment):
-        # Access the array using the correct attribute
-        array = self.global_env.get(node.array_name)
         index = self.visit(node.index)
         value = self.visit(node.value)
+        return self.store_index(node.array_name, index, value)
 
+    def store_index(self, array_name: str, index, value):
+        # Access the array using the correct attribute
+        array = self.global_env.get(array_name)
         if array is None:
-            raise NameError(f"Name '{node.array_name}' is not defined")
+            raise NameError(f"Name '{array_name}' is not defined")
+        if self.shared_arrays and id(array) in self.shared_arrays:
+            array = self.own_array(array)
 
         # Assuming array is a list or a similar structure
         arr_size = len(array)
         if index >= arr_size:
             raise InterpError(
-                f"var (array) `{node.array_name}` has max length of"
+                f"var (array) `{array_name}` has max length of"
                 f" {arr_size}, but got index {index}"
             )
-        array[index] = value
+        if type(array) is IntArray and type(value) is not int:
+            array = self.promote(array)
+        try:
+            array[index] = value
+        except OverflowError:
+            # Не помещается в 64 бита: дальше массив - обычный список
+            array = self.promote(array)
+            array[index] = value
 
         return value
 
@@ -189,38 +311,174 @@ class Interpreter(NodeVisitor):
     def visit_ArrayDecl(self, node: ArrayDecl):
         var_name = node.var_name
         if node.size_expr is not None:
-            if isinstance(node.size_expr, (Num, Var, BinOp)):
+            if isinstance(node.size_expr, (Num, Var, BinOp, Neg)):
                 size = self.visit(node.size_expr)
             else:
                 size = node.size_expr
             # Прямое использование, так как это число
+        return self.declare_array(var_name, size)
+
+    def declare_array(self, var_name: str, size):
         # Обновление глобальной среды
         if size <= 0:
             raise InterpError(f"Illegal array size. Got {size}")
-        self.global_env[var_name] = [0] * size
+        charge(size, size)
+        self.global_env[var_name] = IntArray.zeros(size)
         return self.global_env[var_name]
 
     def visit_ArrayAccess(self, node):
         array = self.global_env.get(node.array_name)
         if array is None:
             raise Exception(f"Array {node.array_name} not found.")
-        index = self.visit(node.index_expr)
+        return self.load_index(array, self.visit(node.index_expr))
+
+    def load_index(self, array, index):
         if not 0 <= index < len(array):
             raise Exception(f"Index {index} out of bounds.")
         return array[index]
 
+    def visit_ArraySlice(self, node: ArraySlice):
+        start = self.visit(node.start)
+        end = self.visit(node.end)
+        return self.slice_of(node.array_name, start, end)
+
+    def slice_of(self, array_name: str, start, end):
+        array = self.global_env.get(array_name)
+        if array is None:
+            raise Exception(f"Array {array_name} not found.")
+        start, end = self.slice_bounds(array_name, array, start, end)
+        charge(end - start, end - start)
+        if type(array) is IntArray:
+            result = IntArray(TYPECODE)
+            result.frombytes(memoryview(array)[start:end].cast("B"))
+            return result
+        return ObjectArray(array[start:end])
+
+    def slice_bounds(self, array_name: str, array, start, end):
+        if not is_array(array):
+            raise InterpError(f"`{array_name}` is not an array")
+        size = len(array)
+        if start is None:
+            return 0, size
+        if not (
+            type(start) is int
+            and type(end) is int
+            and 0 <= start <= end <= size
+        ):
+            raise InterpError(
+                f"Slice [{start}:{end}] is out of bounds for"
+                f" `{array_name}` of length {size}"
+            )
+        return start, end
+
+    def visit_SliceAssignment(self, node: SliceAssignment):
+        start = end = None
+        if node.start is not None:
+            start = self.visit(node.start)
+            end = self.visit(node.end)
+        value = self.visit(node.value)
+        return self.store_slice(node.array_name, start, end, value)
+
+    def store_slice(self, array_name: str, start, end, value):
+        # a[] := v заполняет массив, a[i:j] := b[k:l] копирует срез;
+        # обе записи идут одной операцией над буфером
+        array = self.global_env.get(array_name)
+        if array is None:
+            raise NameError(f"Name '{array_name}' is not defined")
+        start, end = self.slice_bounds(array_name, array, start, end)
+        charge(end - start)
+        items = fill_items(value, end - start)
+        if self.shared_arrays and id(array) in self.shared_arrays:
+            array = self.own_array(array)
+        result = assign_slice(array, start, end, items)
+        if result is not array:
+            charge(len(result), len(result))
+            self.replace_array(array, result)
+
+    def own_array(self, array):
+        """Своя копия общего массива вместо него во всех ссылках."""
+        del self.shared_arrays[id(array)]
+        charge(len(array), len(array))
+        return self.replace_array(array, copy_array(array))
+
+    def share_arrays(self, arrays: Iterable):
+        """Отмечает arrays общими: запись в них сначала копирует массив.
+
+        Отметка держит слабую ссылку и снимается вместе с массивом, так
+        что id умершего массива не достанется новому. Массив, который
+        интерпретатор так и не менял, остаётся отмеченным, пока жив:
+        это стоит одной лишней копии при записи."""
+        shared = self.shared_arrays
+        for array in arrays:
+            key = id(array)
+            if key not in shared:
+                shared[key] = weakref.ref(
+                    array, lambda ref, key=key: shared.pop(key, None)
+                )
+
+    def promote(self, array):
+        """IntArray -> ObjectArray во всех ссылках (store_index)."""
+        charge(len(array), len(array))
+        return self.replace_array(array, array.to_list())
+
+    def replace_array(self, array, new):
+        """Ставит new вместо array во всех переменных: в global_env и в
+        кадрах вызовов (после `b := a` обе переменные по-прежнему один
+        массив). Возвращает new."""
+        genv = self.global_env
+        for name, value in genv.items():
+            if value is array:
+                genv[name] = new
+        for frame in self.call_stack:
+            values = frame.values
+            for slot, value in enumerate(values):
+                if value is array:
+                    values[slot] = new
+        return new
+
+    def snapshot(self) -> Snapshot:
+        """Снимок состояния между запусками interpret (src/snapshot.py)."""
+        return Snapshot(self)
+
+    def restore(self, snapshot: Snapshot):
+        snapshot.apply(self)
+
+    def fork(self, output: StdoutSink = None) -> "Interpreter":
+        """Ветка: новый Interpreter в текущем состоянии, дальше они
+        независимы. Робот - копия (Robot.fork), вывод - output или тот
+        же. Разбор программ (resolver, tail_calls, purity) - копия: ветка
+        знает функции родителя, но свои программы разбирает отдельно.
+        Кэш чистых функций у ветки свой, того же размера.
+
+        Стоит O(n) по числу имён: global_env и адреса Variables
+        копируются (Snapshot), а значения - нет, массивы становятся
+        общими и копируются при первой записи."""
+        child = Interpreter(
+            self.robot.fork(output), self.max_depth, self.memo.maxsize
+        )
+        child.resolver = self.resolver.copy()
+        child.tail_calls = self.tail_calls.copy()
+        child.purity = self.purity.copy()
+        child.memo.pure = child.purity.pure
+        self.snapshot().apply(child)
+        return child
+
     def visit_SizeOf(self, node):
-        identifier = node.identifier
+        return self.size_of(node.identifier)
+
+    def size_of(self, identifier: str):
         if identifier in self.global_env:
             value = self.global_env[identifier]
-            if isinstance(value, list):
+            if isinstance(value, (list, IntArray)):
                 return len(value)
             else:
                 return 1
         raise Exception(f"Undefined identifier: {identifier}")
 
     def visit_Move(self, node: Move):
-        direction = node.direction
+        return self.move(node.direction)
+
+    def move(self, direction: str):
         try:
             if direction == "top":
                 result = self.robot.move_top()
@@ -232,109 +490,231 @@ class Interpreter(NodeVisitor):
                 result = self.robot.move_right()
             else:
                 raise Exception(f"Unknown direction: {direction}")
-            print(
-                f"Moved {direction}. Current position: {self.robot.position}"
+            self.output.event(
+                RobotEvent("move", self.robot.position, direction)
             )
             return result
         except Exception as e:
-            print(f"Error during movement: {e}")
+            self.movement_error(e)
+
+    def movement_error(self, e: Exception):
+        self.output.event(
+            RobotEvent("error", self.robot.position, message=str(e))
+        )
+
+    def visit_Slide(self, node: Slide):
+        return self.slide(node.direction)
+
+    def slide(self, direction: str):
+        try:
+            result = self.robot.slide(direction)
+            self.output.event(
+                RobotEvent("slide", self.robot.position, direction, result)
+            )
+            return result
+        except Exception as e:
+            self.movement_error(e)
+
+    def goto(self, x, y):
+        if type(x) is not int or type(y) is not int:
+            raise InterpError(
+                f"goto expects integer coordinates, got {x!r}, {y!r}"
+            )
+        steps = self.robot.goto(x, y)
+        if steps:
+            self.output.event(
+                RobotEvent(
+                    "goto", self.robot.position, steps=steps, target=(x, y)
+                )
+            )
+        return steps
 
     def visit_BinOp(self, node: BinOp):
         left = self.visit(node.left)
         right = self.visit(node.right)
 
-        # print(f"BinOp: left={left}, right={right}, op={node.op.type}")
+        # print(f"BinOp: left={left}, right={right}, op={node.op!r}")
 
         if left is None or right is None:
             raise Exception(
                 f"Unexpected None value: left={left}, right={right}"
             )
+        return BINARY_FUNCS[node.op](left, right)
 
-        if node.op.type == "PLUS":
-            return left + right
-        elif node.op.type == "MINUS":
-            return left - right
-        elif node.op.type == "MUL":
-            return left * right
-        elif node.op.type == "DIV":
-            return left / right
-        elif node.op.type == "LT":
-            return left < right
-        elif node.op.type == "GT":
-            return left > right
-        elif node.op.type == "EQ":
-            return left == right
+    def visit_Neg(self, node: Neg):
+        value = self.visit(node.expr)
+        if value is None:
+            raise Exception(f"Unexpected None value: left=-1, right={value}")
+        # Как BinOp(-1 * x): для строк и массивов - пустое значение
+        return -1 * value
 
     def visit_Num(self, node: Num):
-        return node.value
+        return node.token
 
     def visit_Str(self, node):
         return node.value
 
     def visit_Var(self, node):
-        var_name = node.value
-        if var_name in self.current_env:
-            return self.current_env[var_name]
-        elif var_name in self.global_env:
+        slot = node.slot
+        if slot >= 0:
+            value = self.current_frame.values[slot]
+            if value is not UNSET:
+                return value
+        elif slot == GLOBAL:
+            value = self.global_env.get(node.token, UNSET)
+            if value is not UNSET:
+                return value
+            raise Exception(f"Undefined variable: {node.token}")
+        return self.lookup_site(node)
+
+    def lookup(self, var_name: str):
+        # Вызываемая функция видит локальные переменные вызывающих
+        for frame in reversed(self.call_stack):
+            value = frame.get(var_name)
+            if value is not UNSET:
+                return value
+        if var_name in self.global_env:
             return self.global_env[var_name]
+        raise Exception(f"Undefined variable: {var_name}")
+
+    def lookup_site(self, var: Var):
+        """lookup для чтения var из кадров вызывающих, с кэшем места.
+
+        self.sites[var] - где имя нашлось в прошлый раз: области
+        видимости кадров под текущим сверху вниз до кадра с именем и
+        слот в нём (или все кадры и GLOBAL). Промежуточные области имени
+        не содержат, так что, пока на стеке кадры тех же функций, оно
+        там же. Текущий кадр проверяет visit_Var. Иначе - обычный
+        поиск, и место записывается заново.
+        """
+        stack = self.call_stack
+        site = self.sites.get(var)
+        if site is not None:
+            scopes, slot = site
+            depth = len(scopes)
+            if len(stack) > depth if slot >= 0 else len(stack) == depth + 1:
+                index = -1
+                for scope in scopes:
+                    index -= 1
+                    if stack[index].scope is not scope:
+                        break
+                else:
+                    if slot >= 0:
+                        value = stack[index].values[slot]
+                    else:
+                        value = self.global_env.get(var.token, UNSET)
+                    if value is not UNSET:
+                        return value
+        return self.find_site(var)
+
+    def find_site(self, var: Var):
+        name = var.token
+        scopes = []
+        # Кэшировать можно, если имя не может появиться выше найденного
+        cacheable = True
+        for frame in reversed(self.call_stack):
+            slot = frame.scope.index.get(name)
+            if frame is not self.current_frame:
+                scopes.append(frame.scope)
+            if slot is None:
+                continue
+            value = frame.values[slot]
+            if value is not UNSET:
+                if cacheable and scopes and len(scopes) <= SITE_DEPTH:
+                    self.sites[var] = (tuple(scopes), slot)
+                return value
+            if frame is not self.current_frame:
+                cacheable = False
+        if name in self.global_env:
+            if cacheable and len(scopes) <= SITE_DEPTH:
+                self.sites[var] = (tuple(scopes), GLOBAL)
+            return self.global_env[name]
+        raise Exception(f"Undefined variable: {name}")
+
+    def store(self, var: Var, value):
+        if var.slot >= 0:
+            self.current_frame.values[var.slot] = value
         else:
-            raise Exception(f"Undefined variable: {var_name}")
+            self.global_env[var.value] = value
+        return value
 
     def visit_Assign(self, node):
         var_name = node.left.value
-        self.current_env[var_name] = self.visit(node.right)
+        value = self.store(node.left, self.visit(node.right))
         self.variables.init_var(var_name, len(self.call_stack))
-        return self.current_env[var_name]
+        return value
 
     def visit_Unarop(self, node: Unarop):
-        uid = self.visit(node.expr)
+        return self.deref(self.visit(node.expr))
 
+    def deref(self, uid: int):
         name = self.variables.get_name_by_id(uid)
-        if name in self.current_env:
-            return self.current_env[name]
-        elif name in self.global_env[name]:
-            return self.global_env[name]
-        raise InterpError(f"Incorrect addr: {uid}")
+        try:
+            return self.lookup(name)
+        except Exception:
+            raise InterpError(f"Incorrect addr: {uid}")
 
     def visit_VarDecl(self, node: VarDecl):
-        var_name = node.var_name
+        var = Var(node.var_name)
+        var.slot = node.slot
         if node.init_value:
-            self.current_env[var_name] = self.visit(node.init_value)
-            self.variables.init_var(var_name, len(self.call_stack))
-        else:
-            self.current_env[var_name] = None
-        return self.current_env[var_name]
+            value = self.store(var, self.visit(node.init_value))
+            self.variables.init_var(var.value, len(self.call_stack))
+            return value
+        return self.store(var, None)
 
     def visit_FunctionDecl(self, node: FunctionDecl):
         # print(f"Defining function {node.name}")
-        self.global_env[node.name] = node
-        return node
+        return self.define_function(node.name, node)
+
+    def define_function(self, name: str, func: FunctionDecl):
+        old = self.global_env.get(name)
+        if old is not None and old is not func:
+            # Закэшированные результаты могли зависеть от прежнего тела
+            self.memo.clear()
+        self.global_env[name] = func
+        return func
 
     def visit_FunctionCall(self, node: FunctionCall):
         func: FunctionDecl = self.global_env.get(node.name)
-        if not func:
-            raise Exception(f"Function {node.name} is not defined")
-
-        # Создание новой локальной среды для вызова функции
-        local_env = {}
-        for param, arg in zip(func.params, node.arguments):
-            local_env[param] = self.visit(arg)
-
-        # Выполнение тела функции в локальной среде
-        tmp = copy(self.current_env)
-        self.call_stack.append(self.current_env)
-        self.current_env = tmp | local_env
+        if type(func) is not FunctionDecl:
+            builtin = resolve_function(self.global_env, node.name)
+            return builtin(self, [self.visit(arg) for arg in node.arguments])
+
+        # Кадр фиксированного размера: параметры кладутся в свои слоты
+        args = [
+            self.visit(arg) for _, arg in zip(func.params, node.arguments)
+        ]
+        key = self.memo.key(func, args)
+        if key is not None:
+            result = self.memo.lookup(key)
+            if result is not MISS:
+                return result
+        frame = func.scope.new_frame(args)
+
+        # Выполнение тела функции в новом кадре
+        self.push_frame(frame)
         result = None
         for statement in func.body:
             result = self.visit(statement)
-            if isinstance(result, Return):
-                result = self.visit(
-                    result.expr
-                )  # Извлечение возвращаемого значения
-                break
-        self.current_env = self.call_stack.pop()
+        self.pop_frame()
+        if key is not None:
+            self.memo.store(key, result)
         return result
 
+    def push_frame(self, frame: Frame):
+        if len(self.call_stack) >= self.max_depth:
+            raise InterpError(f"Maximum call depth {self.max_depth} exceeded")
+        if self.budget is not None:
+            self.budget.call(len(self.call_stack) + 1)
+        self.call_stack.append(frame)
+        self.current_frame = frame
+
+    def pop_frame(self):
+        self.variables.release(len(self.call_stack))
+        self.call_stack.pop()
+        self.current_frame = self.call_stack[-1] if self.call_stack else None
+
     def visit_Return(self, node):
         # return self.visit(node.expr)
         value = self.visit(node.expr)
@@ -356,7 +736,10 @@ class Interpreter(NodeVisitor):
     def visit_While(self, node):
         res = None
         c = 0
+        budget = self.budget
         while self.visit(node.condition):  # Проверка условия
+            if c and budget is not None:
+                budget.tick()  # повтор тела - обратный переход
             c += 1
             for statement in node.body:  # Выполнение тела цикла
                 res = self.visit(statement)
@@ -370,27 +753,177 @@ class Interpreter(NodeVisitor):
                 res = self.visit(statement)
         return res
 
-    def interpret(self, tree: list[AST]):
+    def interpret(
+        self,
+        tree: list[AST],
+        engine: str = "tree",
+        optimize: bool = True,
+        limits: Limits = None,
+    ):
+        """Исполняет программу. Об InterpError сообщает в stderr и
+        возвращает результат. С limits исполнение прерывается
+        LimitExceeded: она не глушится, а уходит вызывающему, расход
+        ресурсов остаётся в self.budget.usage()."""
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine: {engine}")
+        if optimize:
+            tree = Optimizer().optimize(tree)
+        tree = self.resolver.resolve(tree)
+        if tree is not None:
+            self.tail_calls.mark(tree)
+            if self.purity.mark(tree):
+                self.memo.clear()
+        vm = VM(self) if engine == "vm" else None
+        profiler = self.start_profiler(engine)
+        self.budget = Budget(limits) if limits is not None else None
+        previous = activate(self.budget)
+        result = None
         try:
             if tree is None:
-                print("AST is None. No code to interpret.")
+                self.output.print("AST is None. No code to interpret.")
                 return
-            result = None
-            self.current_env = self.global_env
-            for node in tree:
-                result = self.visit(node)
+            self.call_stack.clear()
+            self.current_frame = None
+            self.variables.release(1)  # кадры, брошенные после ошибки
+            self.sites.clear()
+            if vm is not None:
+                result = vm.interpret(tree)
+            elif engine == "closure":
+                for stmt in ClosureCompiler(self).compile(tree):
+                    result = stmt(None)
+            else:
+                for node in tree:
+                    result = self.visit(node)
+        except LimitExceeded:
+            raise
         except InterpError as e:
+            if vm is not None:
+                result = vm.result
+            self.output.flush()
             print(f"[error] {str(e)}", file=sys.stderr)
-        except Exception:
+        except RecursionError:
+            self.output.flush()
+            message = STACK_DEPTH_ERROR.format(engine=engine)
+            print(f"[error] {message}", file=sys.stderr)
+        finally:
+            self.output.flush()
+            if profiler is not None:
+                profiler.stop(self)
+            activate(previous)
+            if self.budget is not None:
+                self.budget.stop()
+        return result
+
+    def start_profiler(self, engine: str) -> Profiler:
+        if self.profiler is None:
+            return None
+        if engine != "tree":
+            raise ValueError("Profiling is supported by the tree engine only")
+        self.profiler.start(self)
+        return self.profiler
+
+    def interpret_stream(
+        self,
+        statements: Iterable[AST],
+        engine: str = "tree",
+        optimize: bool = True,
+        limits: Limits = None,
+    ):
+        """Исполняет операторы верхнего уровня по одному, по мере того
+        как их отдаёт statements (например, PrattParser.iter_statements).
+        Операторы до синтаксической ошибки успевают выполниться.
+        limits - как в interpret (LimitExceeded тоже уходит
+        вызывающему), общие на весь поток."""
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine: {engine}")
+        optimizer = Optimizer()
+        resolver = Resolver(streaming=True)
+        vm = VM(self) if engine == "vm" else None
+        closures = ClosureCompiler(self) if engine == "closure" else None
+        result = None
+        self.call_stack.clear()
+        self.current_frame = None
+        self.variables.release(1)
+        self.sites.clear()
+        profiler = self.start_profiler(engine)
+        self.budget = Budget(limits) if limits is not None else None
+        previous = activate(self.budget)
+        try:
+            for stmt in statements:
+                block = [stmt]
+                if optimize:
+                    block = optimizer.optimize(block)
+                resolver.resolve(block)
+                if vm is not None:
+                    result = vm.result = vm.interpret(block)
+                elif closures is not None:
+                    for compiled in closures.compile(block):
+                        result = compiled(None)
+                else:
+                    for node in block:
+                        result = self.visit(node)
+        except LimitExceeded:
             raise
+        except InterpError as e:
+            if vm is not None:
+                result = vm.result
+            self.output.flush()
+            print(f"[error] {str(e)}", file=sys.stderr)
+        except RecursionError:
+            self.output.flush()
+            message = STACK_DEPTH_ERROR.format(engine=engine)
+            print(f"[error] {message}", file=sys.stderr)
+        finally:
+            self.output.flush()
+            if profiler is not None:
+                profiler.stop(self)
+            activate(previous)
+            if self.budget is not None:
+                self.budget.stop()
         return result
 
 
-def test_interpreter(code):
+def test_interpreter(
+    code,
+    engine: str = "tree",
+    optimize: bool = True,
+    dump_ast: bool = False,
+    frontend: str = "ply",
+    cache: ProgramCache = None,
+    output: StdoutSink = None,
+    limits: Limits = None,
+):
     robot = Robot(grid=[[0] * 5 for _ in range(5)])
-    interpreter = Interpreter(robot)
-    parser = get_parser()
+    interpreter = Interpreter(robot, output=output)
+    if cache is not None:
+        # Настройки разбора задаёт сам кэш: они входят в ключ
+        tree = cache.load(code)
+    else:
+        parser = get_parser(frontend)
+        tree = parser.parse(code, lexer=get_lexer())
+        if optimize:
+            tree = Optimizer().optimize(tree)
+    if dump_ast:
+        interpreter.print_ast(tree)
     result = interpreter.interpret(
-        parser.parse(code, lexer=get_lexer(), debug=True)
+        tree, engine=engine, optimize=False, limits=limits
     )
     return result
+
+
+def stream_interpreter(
+    stream,
+    engine: str = "tree",
+    optimize: bool = True,
+    chunk_size: int = 1 << 16,
+    output: StdoutSink = None,
+    limits: Limits = None,
+):
+    """Как test_interpreter, но читает программу из файлового объекта
+    и исполняет её, не дожидаясь конца разбора."""
+    robot = Robot(grid=[[0] * 5 for _ in range(5)])
+    interpreter = Interpreter(robot, output=output)
+    statements = PrattParser().iter_statements(stream, chunk_size)
+    return interpreter.interpret_stream(
+        statements, engine=engine, optimize=optimize, limits=limits
+    )
@@ -1,3 +1,5 @@
+import sys
+
 import ply.lex as lex
 
 __all__ = ["tokens", "get_lexer"]
@@ -46,6 +48,7 @@ tokens = [
     "SEMI",
     "COMMA",
     "ASSIGN",
+    "COLON",
     "AMPERSAND",
     "QUESTION_MARK",
     "EMPTY_ARRAY",
@@ -70,6 +73,7 @@ t_RBRACE = r"\}"
 t_SEMI = r";"
 t_COMMA = r","
 t_ASSIGN = r":="
+t_COLON = r":"
 t_AMPERSAND = r"&"
 t_QUESTION_MARK = r"\?"
 t_EMPTY_ARRAY = r"\[\]"
@@ -83,12 +87,14 @@ def t_NUMBER(t):
 
 def t_STRING(t):
     r'"[^"]*"'
-    t.value = t.value[1:-1]  # Remove the quotes
+    t.value = sys.intern(t.value[1:-1])  # Remove the quotes
     return t
 
 
 def t_IDENTIFIER(t):
     r"[a-zA-Z_][a-zA-Z_0-9]*"
+    # Одинаковые имена в дереве - один и тот же объект str
+    t.value = sys.intern(t.value)
     t.type = TYPES.get(t.value, "IDENTIFIER")
     return t
 
@@ -106,5 +112,12 @@ def t_error(t):
 t_ignore = " \t"
 
 
+# Мастер-лексер строится один раз на процесс, get_lexer отдаёт его копии
+_lexer: lex.Lexer = None
+
+
 def get_lexer() -> lex.Lexer:
-    return lex.lex()
+    global _lexer
+    if _lexer is None:
+        _lexer = lex.lex()
+    return _lexer.clone()
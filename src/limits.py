@@ -0,0 +1,157 @@
+import time
+
+from src.exception import LimitExceeded
+
+# Как часто (в шагах) смотреть на часы
+CLOCK_EVERY = 1024
+
+
+class Limits:
+    """Лимиты одного запуска Interpreter.interpret; None - без лимита.
+
+    steps - повторов тела цикла (обратных переходов), вызовов функций
+    и элементов, обработанных массовыми операциями (векторные операции,
+    срезы, заполнение массива, поиск пути goto, таблицы slide),
+    time - секунд от начала исполнения,
+    array_elements - элементов во всех созданных массивах: объявленных,
+    срезах, результатах векторных операций и копиях,
+    depth - глубина стека вызовов.
+    """
+
+    FIELDS = ("steps", "time", "array_elements", "depth")
+
+    def __init__(
+        self,
+        steps: int = None,
+        time: float = None,
+        array_elements: int = None,
+        depth: int = None,
+    ):
+        self.steps = steps
+        self.time = time
+        self.array_elements = array_elements
+        self.depth = depth
+
+    def within(self, cap: "Limits") -> "Limits":
+        """Лимиты не выше cap: по каждому ресурсу меньший из двух."""
+        values = []
+        for name in self.FIELDS:
+            mine, other = getattr(self, name), getattr(cap, name)
+            if mine is None or other is None:
+                values.append(other if mine is None else mine)
+            else:
+                values.append(min(mine, other))
+        return Limits(*values)
+
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+
+class Budget:
+    """Расход ресурсов одного запуска и проверка лимитов.
+
+    Движки зовут tick на каждой итерации цикла (обратный переход),
+    call при входе в функцию, allocate перед созданием массива и work
+    в массовых операциях, а не на каждом узле. Часы читаются раз в
+    CLOCK_EVERY шагов, так что лимит time может быть превышен на долю
+    этого интервала.
+    При превышении бросается LimitExceeded, exceeded - имя ресурса.
+    """
+
+    def __init__(self, limits: Limits):
+        self.limits = limits
+        self.steps = 0
+        self.array_elements = 0
+        self.depth = 0
+        self.exceeded: str = None
+        self.started = time.monotonic()
+        self.finished: float = None
+        self._deadline = (
+            self.started + limits.time if limits.time is not None else None
+        )
+        self._next_check = 0
+        self._plan_check()
+
+    def _plan_check(self):
+        next_check = self.steps + CLOCK_EVERY
+        if self.limits.steps is not None:
+            next_check = min(next_check, self.limits.steps + 1)
+        self._next_check = next_check
+
+    def _fail(self, resource: str, limit, used):
+        self.exceeded = resource
+        raise LimitExceeded(resource, limit, used)
+
+    def check(self):
+        limits = self.limits
+        if limits.steps is not None and self.steps > limits.steps:
+            self._fail("steps", limits.steps, self.steps)
+        if self._deadline is not None:
+            now = time.monotonic()
+            if now > self._deadline:
+                self._fail("time", limits.time, round(now - self.started, 6))
+        self._plan_check()
+
+    def tick(self):
+        self.steps += 1
+        if self.steps >= self._next_check:
+            self.check()
+
+    def call(self, depth: int):
+        if depth > self.depth:
+            self.depth = depth
+            if self.limits.depth is not None and depth > self.limits.depth:
+                self._fail("depth", self.limits.depth, depth)
+        self.tick()
+
+    def work(self, elements: int):
+        """Массовая операция над elements элементами: столько же шагов."""
+        self.steps += elements
+        if self.steps >= self._next_check:
+            self.check()
+
+    def allocate(self, elements: int):
+        self.array_elements += elements
+        limit = self.limits.array_elements
+        if limit is not None and self.array_elements > limit:
+            self._fail("array_elements", limit, self.array_elements)
+
+    def stop(self):
+        self.finished = time.monotonic()
+
+    def usage(self) -> dict:
+        """Сколько каждого ресурса израсходовано и каков лимит."""
+        end = self.finished if self.finished is not None else time.monotonic()
+        return {
+            "steps": (self.steps, self.limits.steps),
+            "time": (round(end - self.started, 6), self.limits.time),
+            "array_elements": (
+                self.array_elements,
+                self.limits.array_elements,
+            ),
+            "depth": (self.depth, self.limits.depth),
+            "exceeded": self.exceeded,
+        }
+
+
+# Бюджет идущего запуска (Interpreter.interpret). Через него массовые
+# операции без ссылки на интерпретатор - векторные операции
+# src/arrays.py, поиск в ширину src/grid.py - списывают шаги
+_active: Budget = None
+
+
+def activate(budget: Budget) -> Budget:
+    """Делает budget (None - без лимитов) текущим, возвращает прежний."""
+    global _active
+    previous, _active = _active, budget
+    return previous
+
+
+def charge(work: int, allocated: int = 0):
+    """work элементов обработки и allocated новых элементов массивов
+    на счёт текущего бюджета."""
+    budget = _active
+    if budget is not None:
+        if allocated:
+            budget.allocate(allocated)
+        budget.work(work)
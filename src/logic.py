@@ -1,7 +1,48 @@
-from ply.lex import LexToken
+import operator
+from enum import IntEnum
+
+# Узлы объявляют __slots__: у экземпляров нет __dict__, и на больших
+# сгенерированных программах дерево занимает заметно меньше памяти.
+# Поля перечислены в порядке аргументов конструктора, дополнительные
+# слоты (slot, scope) заполняет src/resolver.py.
+
+
+class Op(IntEnum):
+    """Бинарный оператор; имена совпадают с типами токенов лексера."""
+
+    PLUS = 1
+    MINUS = 2
+    MUL = 3
+    DIV = 4
+    EQ = 5
+    NE = 6
+    LT = 7
+    GT = 8
+    LE = 9
+    GE = 10
+
+    def __repr__(self):
+        return self.name
+
+
+# Значение оператора - общее для движков и свёртки констант
+# (src/optimizer.py): от него зависит дерево в кэше (src/cache.py)
+BINARY_FUNCS = {
+    Op.PLUS: operator.add,
+    Op.MINUS: operator.sub,
+    Op.MUL: operator.mul,
+    Op.DIV: operator.truediv,
+    Op.LT: operator.lt,
+    Op.GT: operator.gt,
+    Op.EQ: operator.eq,
+    Op.NE: operator.ne,
+    Op.LE: operator.le,
+    Op.GE: operator.ge,
+}
 
 
 class ValueMixin:
+    __slots__ = ()
 
     @property
     def value(self):
@@ -9,16 +50,26 @@ class ValueMixin:
 
 
 class AST:
-    pass
+    __slots__ = ()
 
 
-class ArrayDecl(AST):
+class Statement(AST):
+    # lineno - строка первого токена оператора (лексер считает строки в
+    # t_newline); ставит парсер, когда узел разобран как оператор
+    __slots__ = ("lineno",)
+
+
+class ArrayDecl(Statement):
+    __slots__ = ("var_name", "size_expr")
+
     def __init__(self, var_name, size_expr):
         self.var_name = var_name
         self.size_expr = size_expr
 
 
-class PointerDecl(AST):
+class PointerDecl(Statement):
+    __slots__ = ("var_type", "var_name", "init_value", "mutable")
+
     def __init__(self, var_type, var_name, init_value=None, mutable=False):
         self.var_type = var_type
         self.var_name = var_name
@@ -27,56 +78,104 @@ class PointerDecl(AST):
 
 
 class ArrayAccess(AST):
+    __slots__ = ("array_name", "index_expr")
+
     def __init__(self, array_name, index_expr):
         self.array_name = array_name
         self.index_expr = index_expr
 
 
+class ArraySlice(AST):
+    __slots__ = ("array_name", "start", "end")
+
+    def __init__(self, array_name, start, end):
+        self.array_name = array_name
+        self.start = start
+        self.end = end
+
+
+class SliceAssignment(Statement):
+    # start и end равны None, если присваивается весь массив: a[] := ...
+    __slots__ = ("array_name", "start", "end", "value")
+
+    def __init__(self, array_name, start, end, value):
+        self.array_name = array_name
+        self.start = start
+        self.end = end
+        self.value = value
+
+
 class SizeOf(AST):
+    __slots__ = ("identifier",)
+
     def __init__(self, identifier):
         self.identifier = identifier
 
 
-class Move(AST):
+class Move(Statement):
+    __slots__ = ("direction",)
+
+    def __init__(self, direction):
+        self.direction = direction
+
+
+class Slide(Statement):
+    # slide right; - ехать в direction до препятствия
+    __slots__ = ("direction",)
+
     def __init__(self, direction):
         self.direction = direction
 
 
 class BinOp(AST):
-    def __init__(self, left, op: LexToken, right):
+    __slots__ = ("left", "op", "right")
+
+    def __init__(self, left, op: Op, right):
         self.left = left
         self.op = op
         self.right = right
 
 
 class Num(AST, ValueMixin):
+    __slots__ = ("token",)
+
     def __init__(self, token):
         self.token = token
 
 
 class Str(AST, ValueMixin):
+    __slots__ = ("token",)
+
     def __init__(self, token):
         self.token = token
 
 
 class Var(AST, ValueMixin):
+    __slots__ = ("token", "slot")
+
     def __init__(self, token):
         self.token = token
 
 
-class Assign(AST):
+class Assign(Statement):
+    __slots__ = ("left", "op", "right")
+
     def __init__(self, left, op, right):
         self.left = left
         self.op = op
         self.right = right
 
 
-class Return(AST):
+class Return(Statement):
+    __slots__ = ("expr",)
+
     def __init__(self, expr):
         self.expr = expr
 
 
 class VarDecl(AST):
+    __slots__ = ("var_type", "var_name", "init_value", "mutable", "slot")
+
     def __init__(self, var_type, var_name, init_value=None, mutable=False):
         self.var_type = var_type
         self.var_name = var_name
@@ -84,55 +183,81 @@ class VarDecl(AST):
         self.mutable = mutable
 
 
-class If(AST):
+class If(Statement):
+    __slots__ = ("condition", "true_branch", "false_branch")
+
     def __init__(self, condition, true_branch, false_branch=None):
         self.condition = condition
         self.true_branch = true_branch
         self.false_branch = false_branch
 
 
-class While(AST):
+class While(Statement):
+    __slots__ = ("condition", "body", "instead_body")
+
     def __init__(self, condition, body, instead_body=None):
         self.condition = condition
         self.body = body
         self.instead_body = instead_body
 
 
-class Print(AST):
+class Print(Statement):
+    __slots__ = ("expr",)
+
     def __init__(self, expr):
         self.expr = expr
 
 
-class FunctionDecl(AST):
+class FunctionDecl(Statement):
+    # scope заполняет src/resolver.py
+    __slots__ = ("name", "params", "body", "scope")
+
     def __init__(self, name, params, body):
         self.name = name
         self.params: list[str] = params
         self.body = body
 
 
-class FunctionCall(AST):
+class FunctionCall(Statement):
+    __slots__ = ("name", "arguments")
+
     def __init__(self, name, arguments):
         self.name = name
         self.arguments = arguments
 
 
-class ArrayAssignment(AST):
+class ArrayAssignment(Statement):
+    __slots__ = ("array_name", "index", "value")
+
     def __init__(self, array_name, index, value):
         self.array_name = array_name
         self.index = index
         self.value = value
 
 
-class AddressOf(AST):
+class AddressOf(Statement):
+    __slots__ = ("name",)
+
     def __init__(self, name):
         self.name = name
 
 
 class LenOf(AST):
+    __slots__ = ("expr",)
+
     def __init__(self, expr):
         self.expr = expr
 
 
 class Unarop(AST):
+    __slots__ = ("expr",)
+
+    def __init__(self, expr):
+        self.expr = expr
+
+
+class Neg(AST):
+    __slots__ = ("expr",)
+
     def __init__(self, expr):
         self.expr = expr
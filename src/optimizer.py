@@ -0,0 +1,142 @@
+import operator
+from copy import copy
+
+from src.logic import *
+from src.visitor import NodeVisitor
+
+
+def is_const(node) -> bool:
+    return isinstance(node, (Num, Str))
+
+
+def make_const(value) -> AST:
+    return Str(value) if isinstance(value, str) else Num(value)
+
+
+def same_line(new: Statement, old: Statement) -> Statement:
+    """Переносит lineno на перестроенный оператор (для профилировщика)."""
+    if hasattr(old, "lineno"):
+        new.lineno = old.lineno
+    return new
+
+
+def is_uminus(node) -> bool:
+    # p_expr_uminus строит -x как BinOp(Num(-1), MUL, x)
+    return (
+        isinstance(node, BinOp)
+        and node.op is Op.MUL
+        and isinstance(node.left, Num)
+        and node.left.value == -1
+        and type(node.left.value) is int
+    )
+
+
+class Optimizer(NodeVisitor):
+    """Проход между parser.parse и Interpreter.interpret.
+
+    Сворачивает константные BinOp, заменяет унарный минус на Neg
+    (или сразу на литерал) и убирает ветки If/While с константным
+    условием. Исходное дерево не изменяется.
+    """
+
+    def optimize(self, tree: list[AST]) -> list[AST]:
+        if tree is None:
+            return None
+        return self.visit_block(tree)
+
+    def visit(self, node):
+        if isinstance(node, AST):
+            return super().visit(node)
+        return node
+
+    def generic_visit(self, node):
+        node = copy(node)
+        for field, child in self.node_to_dict(node).items():
+            if isinstance(child, list):
+                setattr(node, field, [self.visit(c) for c in child])
+            elif isinstance(child, AST):
+                setattr(node, field, self.visit(child))
+        return node
+
+    def visit_block(self, statements: list[AST]) -> list[AST]:
+        if not statements:
+            return statements
+        result = []
+        last = len(statements) - 1
+        for i, stmt in enumerate(statements):
+            stmt = self.visit(stmt)
+            if isinstance(stmt, If) and is_const(stmt.condition):
+                branch = (
+                    stmt.true_branch
+                    if stmt.condition.value
+                    else stmt.false_branch
+                )
+                if branch:
+                    result.extend(branch)
+                elif i == last:
+                    # Значение последнего оператора - результат блока,
+                    # а If без выполненной ветки возвращает None
+                    result.append(same_line(If(stmt.condition, []), stmt))
+            elif (
+                isinstance(stmt, While)
+                and is_const(stmt.condition)
+                and not stmt.condition.value
+            ):
+                if stmt.instead_body:
+                    result.extend(stmt.instead_body)
+                elif i == last:
+                    result.append(same_line(If(stmt.condition, []), stmt))
+            else:
+                result.append(stmt)
+        return result
+
+    def visit_If(self, node: If):
+        return same_line(
+            If(
+                self.visit(node.condition),
+                self.visit_block(node.true_branch),
+                self.visit_block(node.false_branch),
+            ),
+            node,
+        )
+
+    def visit_While(self, node: While):
+        return same_line(
+            While(
+                self.visit(node.condition),
+                self.visit_block(node.body),
+                self.visit_block(node.instead_body),
+            ),
+            node,
+        )
+
+    def visit_FunctionDecl(self, node: FunctionDecl):
+        return same_line(
+            FunctionDecl(node.name, node.params, self.visit_block(node.body)),
+            node,
+        )
+
+    def visit_Neg(self, node: Neg):
+        expr = self.visit(node.expr)
+        if isinstance(expr, Num):
+            return Num(-expr.value)
+        return Neg(expr)
+
+    def visit_BinOp(self, node: BinOp):
+        if is_uminus(node) and not isinstance(node.right, Str):
+            return self.visit_Neg(Neg(node.right))
+
+        left = self.visit(node.left)
+        right = self.visit(node.right)
+        fn = BINARY_FUNCS.get(node.op)
+        foldable = is_const(left) and is_const(right)
+        if fn is operator.mul and Str in (type(left), type(right)):
+            # Повторение строки может раздуть дерево
+            foldable = False
+        if fn is not None and foldable:
+            try:
+                return make_const(fn(left.value, right.value))
+            except (ArithmeticError, TypeError):
+                # Ошибка должна случиться при исполнении, как и раньше
+                pass
+        return BinOp(left, node.op, right)
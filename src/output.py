@@ -0,0 +1,152 @@
+import sys
+
+
+class RobotEvent:
+    """Запись о действии робота. Текст (str) - прежнее сообщение.
+
+    kind:
+      "move"        - шаг в direction (даже если упёрся, как раньше)
+      "slide"       - проезд до упора, steps клеток
+      "goto"        - переход в target за steps шагов
+      "blocked"     - нельзя сдвинуться в direction
+      "unreachable" - target недостижима
+      "error"       - ошибка движения, текст в message
+    position - позиция робота после действия.
+    """
+
+    __slots__ = (
+        "kind",
+        "position",
+        "direction",
+        "steps",
+        "target",
+        "message",
+    )
+
+    def __init__(
+        self,
+        kind: str,
+        position: tuple,
+        direction: str = None,
+        steps: int = None,
+        target: tuple = None,
+        message: str = None,
+    ):
+        self.kind = kind
+        self.position = position
+        self.direction = direction
+        self.steps = steps
+        self.target = target
+        self.message = message
+
+    def __str__(self):
+        kind = self.kind
+        if kind == "move":
+            return (
+                f"Moved {self.direction}. Current position: {self.position}"
+            )
+        if kind == "slide":
+            return (
+                f"Moved {self.direction} {self.steps} cells. "
+                f"Current position: {self.position}"
+            )
+        if kind == "goto":
+            return (
+                f"Moved {self.steps} steps to {self.target}. "
+                f"Current position: {self.position}"
+            )
+        if kind == "blocked":
+            return (
+                f"Cannot move {self.direction} from position {self.position}"
+            )
+        if kind == "unreachable":
+            return f"Cannot reach {self.target} from position {self.position}"
+        return f"Error during movement: {self.message}"
+
+    def __repr__(self):
+        fields = ", ".join(
+            f"{name}={getattr(self, name)!r}"
+            for name in self.__slots__
+            if getattr(self, name) is not None
+        )
+        return f"RobotEvent({fields})"
+
+
+class StdoutSink:
+    """Вывод программы: print и события робота. Этот - сразу в stdout,
+    как раньше (sys.stdout берётся в момент записи)."""
+
+    def print(self, value):
+        print(value)
+
+    def event(self, event: RobotEvent):
+        print(event)
+
+    def flush(self):
+        pass
+
+
+class BufferedSink(StdoutSink):
+    """Копит строки и пишет их в stream пачками по batch строк.
+
+    Interpreter.interpret сбрасывает остаток в конце исполнения.
+    """
+
+    def __init__(self, stream=None, batch: int = 4096):
+        self.stream = stream
+        self.batch = batch
+        self.lines: list[str] = []
+
+    def print(self, value):
+        self.lines.append(str(value))
+        if len(self.lines) >= self.batch:
+            self.flush()
+
+    def event(self, event: RobotEvent):
+        self.print(event)
+
+    def flush(self):
+        if self.lines:
+            stream = self.stream or sys.stdout
+            stream.write("\n".join(self.lines) + "\n")
+            self.lines.clear()
+            stream.flush()
+
+
+class CollectorSink(StdoutSink):
+    """Собирает вывод в памяти: lines - текст по строкам (как в
+    stdout), events - записи RobotEvent, values - значения print."""
+
+    def __init__(self):
+        self.lines: list[str] = []
+        self.values: list = []
+        self.events: list[RobotEvent] = []
+
+    def print(self, value):
+        self.values.append(value)
+        self.lines.append(str(value))
+
+    def event(self, event: RobotEvent):
+        self.events.append(event)
+        self.lines.append(str(event))
+
+    def getvalue(self) -> str:
+        return "".join(line + "\n" for line in self.lines)
+
+
+class NullSink(StdoutSink):
+    """Отбрасывает весь вывод."""
+
+    def print(self, value):
+        pass
+
+    def event(self, event: RobotEvent):
+        pass
+
+
+SINKS = {
+    "stdout": StdoutSink,
+    "buffered": BufferedSink,
+    "collect": CollectorSink,
+    "null": NullSink,
+}
@@ -1,7 +1,10 @@
+import sys
+
 import ply.yacc as yacc
 
 from src.lexer import *
 from src.logic import *
+from src.pratt import PrattParser
 
 # Определяем приоритеты операций
 precedence = (
@@ -24,7 +27,9 @@ def p_statement_list(p):
     if len(p) == 2:
         p[0] = [p[1]]
     else:
-        p[0] = p[1] + [p[2]]
+        # Дописываем на месте: p[1] + [p[2]] копировал бы список на каждом шаге
+        p[1].append(p[2])
+        p[0] = p[1]
 
 
 def p_statement(p):
@@ -40,26 +45,46 @@ def p_statement(p):
     | address_of
     | function_call_stmt"""
     p[0] = p[1]
+    p[0].lineno = p.lineno(1)
+
+
+def first_line(p):
+    """Номер строки первого токена правила - для p_statement (без
+    tracking=True PLY не знает строк нетерминалов)."""
+    p.set_lineno(0, p.lineno(1))
 
 
 def p_assignment(p):
     """assignment : IDENTIFIER ASSIGN expr SEMI
     | IDENTIFIER LSQUARE expr RSQUARE ASSIGN expr SEMI
     | IDENTIFIER ASSIGN function_call SEMI"""
+    first_line(p)
     if len(p) == 5:
-        p[0] = Assign(Var(p[1]), p[2], p[3])
+        p[0] = Assign(Var(p[1]), sys.intern(p[2]), p[3])
     else:
         p[0] = ArrayAssignment(p[1], p[3], p[6])
 
 
+def p_slice_assignment(p):
+    """assignment : IDENTIFIER EMPTY_ARRAY ASSIGN expr SEMI
+    | IDENTIFIER LSQUARE expr COLON expr RSQUARE ASSIGN expr SEMI"""
+    first_line(p)
+    if len(p) == 6:
+        p[0] = SliceAssignment(p[1], None, None, p[4])
+    else:
+        p[0] = SliceAssignment(p[1], p[3], p[5], p[8])
+
+
 def p_print_statement(p):
     """print_statement : PRINT LPAREN expr RPAREN SEMI"""
+    first_line(p)
     p[0] = Print(p[3])
 
 
 def p_if_statement(p):
     """if_statement : IF LPAREN expr RPAREN LBRACE statement_list RBRACE ELSE LBRACE statement_list RBRACE
     | IF LPAREN expr RPAREN LBRACE statement_list RBRACE"""
+    first_line(p)
     if len(p) == 12:
         p[0] = If(p[3], p[6], p[10])
     else:
@@ -70,6 +95,7 @@ def p_while_statement(p):
     """while_statement : WHILE LPAREN expr RPAREN LBRACE statement_list RBRACE
     | WHILE LPAREN expr RPAREN LBRACE statement_list RBRACE INSTEAD LBRACE statement_list RBRACE
     """
+    first_line(p)
     if len(p) == 8:
         p[0] = While(p[3], p[6])
     else:
@@ -78,26 +104,43 @@ def p_while_statement(p):
 
 def p_return_statement(p):
     """return_statement : RETURN expr SEMI"""
+    first_line(p)
     p[0] = Return(p[2])
 
 
 def p_move_statement(p):
     """move_statement : direction SEMI"""
+    first_line(p)
     p[0] = Move(p[1])
 
 
+def p_slide_statement(p):
+    """move_statement : IDENTIFIER direction SEMI"""
+    first_line(p)
+    p[0] = slide(p[1], p[2])
+
+
+def slide(name: str, direction: str) -> Slide:
+    # slide - не ключевое слово: имя перед направлением значит только его
+    if name != "slide":
+        raise Exception(f"Syntax error at '{direction}'")
+    return Slide(direction)
+
+
 def p_direction(p):
     """direction : TOP
     | BOTTOM
     | LEFT
     | RIGHT
     | TIMESHIFT"""
+    first_line(p)
     p[0] = p[1]
 
 
 def p_function_decl(p):
     """function_decl : FUNCTION IDENTIFIER LPAREN params RPAREN LBRACE statement_list RBRACE
     | FUNCTION IDENTIFIER LPAREN RPAREN LBRACE statement_list RBRACE"""
+    first_line(p)
     if len(p) == 9:
         p[0] = FunctionDecl(p[2], p[4], p[7])
     else:
@@ -122,6 +165,7 @@ def p_function_args_list(p):
 def p_function_call(p):
     """function_call : IDENTIFIER LPAREN function_args_list RPAREN
     | IDENTIFIER LPAREN RPAREN"""
+    first_line(p)
     if len(p) == 5:
         p[0] = FunctionCall(p[1], p[3])
     else:
@@ -130,6 +174,7 @@ def p_function_call(p):
 
 def p_function_call_stmt(p):
     """function_call_stmt : function_call SEMI"""
+    first_line(p)
     p[0] = p[1]
 
 
@@ -145,6 +190,7 @@ def p_params(p):
 def p_array_decl1(p):
     """array_decl : ARRAY_TYPE INTEGER_TYPE OF IDENTIFIER expr SEMI
     | ARRAY_TYPE INTEGER_TYPE OF IDENTIFIER SEMI"""
+    first_line(p)
     if len(p) == 7:
         p[0] = ArrayDecl(p[4], p[5])
     else:
@@ -154,6 +200,7 @@ def p_array_decl1(p):
 def p_pointer_decl(p):
     """pointer_decl : POINTER_TYPE INTEGER_TYPE IDENTIFIER ASSIGN expr SEMI
     | POINTER_TYPE IDENTIFIER SEMI"""
+    first_line(p)
     if len(p) == 7:
         p[0] = PointerDecl(p[1], p[3], p[5])
     else:
@@ -171,7 +218,7 @@ def p_expr_binop(p: yacc.YaccProduction):
     | expr GT expr
     | expr LE expr
     | expr GE expr"""
-    p[0] = BinOp(p[1], p.slice[2], p[3])
+    p[0] = BinOp(p[1], Op[p.slice[2].type], p[3])
 
 
 def p_expr_group(p):
@@ -186,10 +233,17 @@ def p_expr_num(p):
 
 def p_expr_uminus(p):
     "expr : MINUS expr %prec UMINUS"
-    t = LexToken()
-    t.type = "MUL"
-    t.value = "*"
-    p[0] = BinOp(Num(-1), t, p[2])
+    p[0] = BinOp(Num(-1), Op.MUL, p[2])
+
+
+def p_expr_slice(p):
+    """expr : IDENTIFIER LSQUARE expr COLON expr RSQUARE"""
+    p[0] = ArraySlice(p[1], p[3], p[5])
+
+
+def p_expr_slide(p):
+    """expr : IDENTIFIER direction"""
+    p[0] = slide(p[1], p[2])
 
 
 def p_expr_umul(p):
@@ -204,6 +258,7 @@ def p_expr_questionmark(p):
 
 def p_address_of(p):
     """address_of : AMPERSAND IDENTIFIER"""
+    first_line(p)
     p[0] = AddressOf(p[2])
 
 
@@ -226,5 +281,32 @@ def p_error(p):
     raise Exception(f"Syntax error at '{p.value if p else 'EOF'}'")
 
 
-def get_parser() -> yacc.LRParser:
-    return yacc.yacc()
+# Парсер строится один раз на процесс из готовых таблиц src/parsetab.py:
+# без проверки сигнатуры грамматики и без записи файлов
+_parser: yacc.LRParser = None
+_pratt_parser = None
+
+# "ply" - таблицы LALR, "pratt" - рукописный парсер из src/pratt.py
+FRONTENDS = ("ply", "pratt")
+
+
+def get_parser(frontend: str = "ply"):
+    global _parser, _pratt_parser
+    if frontend == "pratt":
+        if _pratt_parser is None:
+            _pratt_parser = PrattParser()
+        return _pratt_parser
+    elif frontend != "ply":
+        raise ValueError(f"Unknown frontend: {frontend}")
+    if _parser is None:
+        _parser = yacc.yacc(debug=False, optimize=True, write_tables=False)
+    return _parser
+
+
+def build_tables():
+    # После изменения грамматики: python -m src.parser
+    yacc.yacc(debug=False, write_tables=True)
+
+
+if __name__ == "__main__":
+    build_tables()
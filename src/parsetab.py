@@ -6,9 +6,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'leftPLUSMINUSleftMULDIVrightUMINUSrightQUESTION_MARKAMPERSANDUMULAMPERSAND ARRAY_TYPE ASSIGN BOTTOM COMMA DIV ELSE EMPTY_ARRAY EQ FUNCTION GE GT IDENTIFIER IF INSTEAD INTEGER_TYPE LBRACE LE LEFT LPAREN LSQUARE LT MINUS MUL MUTABLE NE NUMBER OF PLUS POINTER_TYPE PRINT QUESTION_MARK RBRACE RETURN RIGHT RPAREN RSQUARE SEMI STRING STRING_TYPE TIMESHIFT TOP WHILEprogram : statement_liststatement_list : statement\n    | statement_list statementstatement : assignment\n    | print_statement\n    | if_statement\n    | while_statement\n    | return_statement\n    | move_statement\n    | function_decl\n    | array_decl\n    | pointer_decl\n    | address_of\n    | function_call_stmtassignment : IDENTIFIER ASSIGN expr SEMI\n    | IDENTIFIER LSQUARE expr RSQUARE ASSIGN expr SEMI\n    | IDENTIFIER ASSIGN function_call SEMIprint_statement : PRINT LPAREN expr RPAREN SEMIif_statement : IF LPAREN expr RPAREN LBRACE statement_list RBRACE ELSE LBRACE statement_list RBRACE\n    | IF LPAREN expr RPAREN LBRACE statement_list RBRACEwhile_statement : WHILE LPAREN expr RPAREN LBRACE statement_list RBRACE\n    | WHILE LPAREN expr RPAREN LBRACE statement_list RBRACE INSTEAD LBRACE statement_list RBRACE\n    return_statement : RETURN expr SEMImove_statement : direction SEMIdirection : TOP\n    | BOTTOM\n    | LEFT\n    | RIGHT\n    | TIMESHIFTfunction_decl : FUNCTION IDENTIFIER LPAREN params RPAREN LBRACE statement_list RBRACE\n    | FUNCTION IDENTIFIER LPAREN RPAREN LBRACE statement_list RBRACEfunction_args : expr\n    | function_callfunction_args_list : function_args\n    | function_args COMMA function_args_listfunction_call : IDENTIFIER LPAREN function_args_list RPAREN\n    | IDENTIFIER LPAREN RPARENfunction_call_stmt : function_call SEMIparams : IDENTIFIER\n    | IDENTIFIER COMMA paramsarray_decl : ARRAY_TYPE INTEGER_TYPE OF IDENTIFIER expr SEMI\n    | ARRAY_TYPE INTEGER_TYPE OF IDENTIFIER SEMIpointer_decl : POINTER_TYPE INTEGER_TYPE IDENTIFIER ASSIGN expr SEMI\n    | POINTER_TYPE IDENTIFIER SEMIexpr : expr PLUS expr\n    | expr MINUS expr\n    | expr MUL expr\n    | expr DIV expr\n    | expr EQ expr\n    | expr NE expr\n    | expr LT expr\n    | expr GT expr\n    | expr LE expr\n    | expr GE exprexpr : LPAREN expr RPARENexpr : NUMBERexpr : MINUS expr %prec UMINUSexpr : MUL expr %prec UMULexpr : QUESTION_MARK IDENTIFIERaddress_of : AMPERSAND IDENTIFIERexpr : STRINGexpr : IDENTIFIER\n    | function_call\n    | address_of'
+_lr_signature = 'leftPLUSMINUSleftMULDIVrightUMINUSrightQUESTION_MARKAMPERSANDUMULAMPERSAND ARRAY_TYPE ASSIGN BOTTOM COLON COMMA DIV ELSE EMPTY_ARRAY EQ FUNCTION GE GT IDENTIFIER IF INSTEAD INTEGER_TYPE LBRACE LE LEFT LPAREN LSQUARE LT MINUS MUL MUTABLE NE NUMBER OF PLUS POINTER_TYPE PRINT QUESTION_MARK RBRACE RETURN RIGHT RPAREN RSQUARE SEMI STRING STRING_TYPE TIMESHIFT TOP WHILEprogram : statement_liststatement_list : statement\n    | statement_list statementstatement : assignment\n    | print_statement\n    | if_statement\n    | while_statement\n    | return_statement\n    | move_statement\n    | function_decl\n    | array_decl\n    | pointer_decl\n    | address_of\n    | function_call_stmtassignment : IDENTIFIER ASSIGN expr SEMI\n    | IDENTIFIER LSQUARE expr RSQUARE ASSIGN expr SEMI\n    | IDENTIFIER ASSIGN function_call SEMIassignment : IDENTIFIER EMPTY_ARRAY ASSIGN expr SEMI\n    | IDENTIFIER LSQUARE expr COLON expr RSQUARE ASSIGN expr SEMIprint_statement : PRINT LPAREN expr RPAREN SEMIif_statement : IF LPAREN expr RPAREN LBRACE statement_list RBRACE ELSE LBRACE statement_list RBRACE\n    | IF LPAREN expr RPAREN LBRACE statement_list RBRACEwhile_statement : WHILE LPAREN expr RPAREN LBRACE statement_list RBRACE\n    | WHILE LPAREN expr RPAREN LBRACE statement_list RBRACE INSTEAD LBRACE statement_list RBRACE\n    return_statement : RETURN expr SEMImove_statement : direction SEMImove_statement : IDENTIFIER direction SEMIdirection : TOP\n    | BOTTOM\n    | LEFT\n    | RIGHT\n    | TIMESHIFTfunction_decl : FUNCTION IDENTIFIER LPAREN params RPAREN LBRACE statement_list RBRACE\n    | FUNCTION IDENTIFIER LPAREN RPAREN LBRACE statement_list RBRACEfunction_args : expr\n    | function_callfunction_args_list : function_args\n    | function_args COMMA function_args_listfunction_call : IDENTIFIER LPAREN function_args_list RPAREN\n    | IDENTIFIER LPAREN RPARENfunction_call_stmt : function_call SEMIparams : IDENTIFIER\n    | IDENTIFIER COMMA paramsarray_decl : ARRAY_TYPE INTEGER_TYPE OF IDENTIFIER expr SEMI\n    | ARRAY_TYPE INTEGER_TYPE OF IDENTIFIER SEMIpointer_decl : POINTER_TYPE INTEGER_TYPE IDENTIFIER ASSIGN expr SEMI\n    | POINTER_TYPE IDENTIFIER SEMIexpr : expr PLUS expr\n    | expr MINUS expr\n    | expr MUL expr\n    | expr DIV expr\n    | expr EQ expr\n    | expr NE expr\n    | expr LT expr\n    | expr GT expr\n    | expr LE expr\n    | expr GE exprexpr : LPAREN expr RPARENexpr : NUMBERexpr : MINUS expr %prec UMINUSexpr : IDENTIFIER LSQUARE expr COLON expr RSQUAREexpr : IDENTIFIER directionexpr : MUL expr %prec UMULexpr : QUESTION_MARK IDENTIFIERaddress_of : AMPERSAND IDENTIFIERexpr : STRINGexpr : IDENTIFIER\n    | function_call\n    | address_of'
     
-_lr_action_items = {'IDENTIFIER':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,20,22,24,25,31,32,33,34,35,36,37,38,40,41,42,44,49,52,54,66,67,68,69,70,71,72,73,74,75,76,81,82,84,85,86,89,107,108,109,111,112,113,114,116,118,121,122,124,125,126,127,128,129,130,131,132,135,136,137,138,139,140,141,],[15,15,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,45,50,53,54,-3,45,45,45,-38,45,45,45,45,45,45,80,-24,83,-60,-23,45,45,45,45,45,45,45,45,45,45,104,107,-44,-15,-17,45,45,45,45,-18,15,15,104,15,-42,15,15,15,15,-41,-43,-16,-20,-21,15,-31,-30,15,15,15,15,-19,-22,]),'PRINT':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,31,35,49,54,66,84,85,86,111,112,113,116,118,121,122,124,125,126,127,128,129,130,131,132,135,136,137,138,139,140,141,],[17,17,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-3,-38,-24,-60,-23,-44,-15,-17,-18,17,17,17,-42,17,17,17,17,-41,-43,-16,-20,-21,17,-31,-30,17,17,17,17,-19,-22,]),'IF':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,31,35,49,54,66,84,85,86,111,112,113,116,118,121,122,124,125,126,127,128,129,130,131,132,135,136,137,138,139,140,141,],[18,18,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-3,-38,-24,-60,-23,-44,-15,-17,-18,18,18,18,-42,18,18,18,18,-41,-43,-16,-20,-21,18,-31,-30,18,18,18,18,-19,-22,]),'WHILE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,31,35,49,54,66,84,85,86,111,112,113,116,118,121,122,124,125,126,127,128,129,130,131,132,135,136,137,138,139,140,141,],[19,19,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-3,-38,-24,-60,-23,-44,-15,-17,-18,19,19,19,-42,19,19,19,19,-41,-43,-16,-20,-21,19,-31,-30,19,19,19,19,-19,-22,]),'RETURN':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,31,35,49,54,66,84,85,86,111,112,113,116,118,121,122,124,125,126,127,128,129,130,131,132,135,136,137,138,139,140,141,],[20,20,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-3,-38,-24,-60,-23,-44,-15,-17,-18,20,20,20,-42,20,20,20,20,-41,-43,-16,-20,-21,20,-31,-30,20,20,20,20,-19,-22,]),'FUNCTION':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,31,35,49,54,66,84,85,86,111,112,113,116,118,121,122,124,125,126,127,128,129,130,131,132,135,136,137,138,139,140,141,],[22,22,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-3,-38,-24,-60,-23,-44,-15,-17,-18,22,22,22,-42,22,22,22,22,-41,-43,-16,-20,-21,22,-31,-30,22,22,22,22,-19,-22,]),'ARRAY_TYPE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,31,35,49,54,66,84,85,86,111,112,113,116,118,121,122,124,125,126,127,128,129,130,131,132,135,136,137,138,139,140,141,],[23,23,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-3,-38,-24,-60,-23,-44,-15,-17,-18,23,23,23,-42,23,23,23,23,-41,-43,-16,-20,-21,23,-31,-30,23,23,23,23,-19,-22,]),'POINTER_TYPE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,31,35,49,54,66,84,85,86,111,112,113,116,118,121,122,124,125,126,127,128,129,130,131,132,135,136,137,138,139,140,141,],[24,24,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-3,-38,-24,-60,-23,-44,-15,-17,-18,24,24,24,-42,24,24,24,24,-41,-43,-16,-20,-21,24,-31,-30,24,24,24,24,-19,-22,]),'AMPERSAND':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,20,31,32,33,34,35,36,37,38,40,41,42,49,54,66,67,68,69,70,71,72,73,74,75,76,84,85,86,89,107,108,109,111,112,113,116,118,121,122,124,125,126,127,128,129,130,131,132,135,136,137,138,139,140,141,],[25,25,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,25,-3,25,25,25,-38,25,25,25,25,25,25,-24,-60,-23,25,25,25,25,25,25,25,25,25,25,-44,-15,-17,25,25,25,25,-18,25,25,25,-42,25,25,25,25,-41,-43,-16,-20,-21,25,-31,-30,25,25,25,25,-19,-22,]),'TOP':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,31,35,49,54,66,84,85,86,111,112,113,116,118,121,122,124,125,126,127,128,129,130,131,132,135,136,137,138,139,140,141,],[26,26,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-3,-38,-24,-60,-23,-44,-15,-17,-18,26,26,26,-42,26,26,26,26,-41,-43,-16,-20,-21,26,-31,-30,26,26,26,26,-19,-22,]),'BOTTOM':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,31,35,49,54,66,84,85,86,111,112,113,116,118,121,122,124,125,126,127,128,129,130,131,132,135,136,137,138,139,140,141,],[27,27,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-3,-38,-24,-60,-23,-44,-15,-17,-18,27,27,27,-42,27,27,27,27,-41,-43,-16,-20,-21,27,-31,-30,27,27,27,27,-19,-22,]),'LEFT':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,31,35,49,54,66,84,85,86,111,112,113,116,118,121,122,124,125,126,127,128,129,130,131,132,135,136,137,138,139,140,141,],[28,28,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-3,-38,-24,-60,-23,-44,-15,-17,-18,28,28,28,-42,28,28,28,28,-41,-43,-16,-20,-21,28,-31,-30,28,28,28,28,-19,-22,]),'RIGHT':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,31,35,49,54,66,84,85,86,111,112,113,116,118,121,122,124,125,126,127,128,129,130,131,132,135,136,137,138,139,140,141,],[29,29,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-3,-38,-24,-60,-23,-44,-15,-17,-18,29,29,29,-42,29,29,29,29,-41,-43,-16,-20,-21,29,-31,-30,29,29,29,29,-19,-22,]),'TIMESHIFT':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,31,35,49,54,66,84,85,86,111,112,113,116,118,121,122,124,125,126,127,128,129,130,131,132,135,136,137,138,139,140,141,],[30,30,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-3,-38,-24,-60,-23,-44,-15,-17,-18,30,30,30,-42,30,30,30,30,-41,-43,-16,-20,-21,30,-31,-30,30,30,30,30,-19,-22,]),'$end':([1,2,3,4,5,6,7,8,9,10,11,12,13,14,31,35,49,54,66,84,85,86,111,118,126,127,128,129,130,132,135,140,141,],[0,-1,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-3,-38,-24,-60,-23,-44,-15,-17,-18,-42,-41,-43,-16,-20,-21,-31,-30,-19,-22,]),'RBRACE':([3,4,5,6,7,8,9,10,11,12,13,14,31,35,49,54,66,84,85,86,111,118,121,122,125,126,127,128,129,130,131,132,135,138,139,140,141,],[-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-3,-38,-24,-60,-23,-44,-15,-17,-18,-42,129,130,132,-41,-43,-16,-20,-21,135,-31,-30,140,141,-19,-22,]),'ASSIGN':([15,83,87,],[32,108,109,]),'LSQUARE':([15,],[33,]),'LPAREN':([15,17,18,19,20,32,33,34,36,37,38,40,41,42,45,50,67,68,69,70,71,72,73,74,75,76,89,107,108,109,],[34,36,37,38,42,42,42,42,42,42,42,42,42,42,34,81,42,42,42,42,42,42,42,42,42,42,42,42,42,42,]),'SEMI':([16,21,26,27,28,29,30,39,43,45,46,47,48,53,54,55,56,59,77,78,80,88,90,93,94,95,96,97,98,99,100,101,102,103,107,117,119,120,],[35,49,-25,-26,-27,-28,-29,66,-56,-62,-61,-63,-64,84,-60,85,86,-37,-57,-58,-59,-36,111,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,118,126,127,128,]),'NUMBER':([20,32,33,34,36,37,38,40,41,42,67,68,69,70,71,72,73,74,75,76,89,107,108,109,],[43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,]),'MINUS':([20,32,33,34,36,37,38,39,40,41,42,43,45,46,47,48,54,55,56,57,59,61,62,63,64,65,67,68,69,70,71,72,73,74,75,76,77,78,79,80,88,89,93,94,95,96,97,98,99,100,101,102,103,107,108,109,117,119,120,],[40,40,40,40,40,40,40,68,40,40,40,-56,-62,-61,-63,-64,-60,68,-63,68,-37,68,-63,68,68,68,40,40,40,40,40,40,40,40,40,40,-57,-58,68,-59,-36,40,-45,-46,-47,-48,68,68,68,68,68,68,-55,40,40,40,68,68,68,]),'MUL':([20,32,33,34,36,37,38,39,40,41,42,43,45,46,47,48,54,55,56,57,59,61,62,63,64,65,67,68,69,70,71,72,73,74,75,76,77,78,79,80,88,89,93,94,95,96,97,98,99,100,101,102,103,107,108,109,117,119,120,],[41,41,41,41,41,41,41,69,41,41,41,-56,-62,-61,-63,-64,-60,69,-63,69,-37,69,-63,69,69,69,41,41,41,41,41,41,41,41,41,41,-57,-58,69,-59,-36,41,69,69,-47,-48,69,69,69,69,69,69,-55,41,41,41,69,69,69,]),'QUESTION_MARK':([20,32,33,34,36,37,38,40,41,42,67,68,69,70,71,72,73,74,75,76,89,107,108,109,],[44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,]),'STRING':([20,32,33,34,36,37,38,40,41,42,67,68,69,70,71,72,73,74,75,76,89,107,108,109,],[46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,]),'INTEGER_TYPE':([23,24,],[51,52,]),'RPAREN':([34,43,45,46,47,48,54,58,59,60,61,62,63,64,65,77,78,79,80,81,88,93,94,95,96,97,98,99,100,101,102,103,104,105,110,123,],[59,-56,-62,-61,-63,-64,-60,88,-37,-34,-32,-33,90,91,92,-57,-58,103,-59,106,-36,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-39,115,-35,-40,]),'PLUS':([39,43,45,46,47,48,54,55,56,57,59,61,62,63,64,65,77,78,79,80,88,93,94,95,96,97,98,99,100,101,102,103,117,119,120,],[67,-56,-62,-61,-63,-64,-60,67,-63,67,-37,67,-63,67,67,67,-57,-58,67,-59,-36,-45,-46,-47,-48,67,67,67,67,67,67,-55,67,67,67,]),'DIV':([39,43,45,46,47,48,54,55,56,57,59,61,62,63,64,65,77,78,79,80,88,93,94,95,96,97,98,99,100,101,102,103,117,119,120,],[70,-56,-62,-61,-63,-64,-60,70,-63,70,-37,70,-63,70,70,70,-57,-58,70,-59,-36,70,70,-47,-48,70,70,70,70,70,70,-55,70,70,70,]),'EQ':([39,43,45,46,47,48,54,55,56,57,59,61,62,63,64,65,77,78,79,80,88,93,94,95,96,97,98,99,100,101,102,103,117,119,120,],[71,-56,-62,-61,-63,-64,-60,71,-63,71,-37,71,-63,71,71,71,-57,-58,71,-59,-36,-45,-46,-47,-48,71,71,71,71,71,71,-55,71,71,71,]),'NE':([39,43,45,46,47,48,54,55,56,57,59,61,62,63,64,65,77,78,79,80,88,93,94,95,96,97,98,99,100,101,102,103,117,119,120,],[72,-56,-62,-61,-63,-64,-60,72,-63,72,-37,72,-63,72,72,72,-57,-58,72,-59,-36,-45,-46,-47,-48,72,72,72,72,72,72,-55,72,72,72,]),'LT':([39,43,45,46,47,48,54,55,56,57,59,61,62,63,64,65,77,78,79,80,88,93,94,95,96,97,98,99,100,101,102,103,117,119,120,],[73,-56,-62,-61,-63,-64,-60,73,-63,73,-37,73,-63,73,73,73,-57,-58,73,-59,-36,-45,-46,-47,-48,73,73,73,73,73,73,-55,73,73,73,]),'GT':([39,43,45,46,47,48,54,55,56,57,59,61,62,63,64,65,77,78,79,80,88,93,94,95,96,97,98,99,100,101,102,103,117,119,120,],[74,-56,-62,-61,-63,-64,-60,74,-63,74,-37,74,-63,74,74,74,-57,-58,74,-59,-36,-45,-46,-47,-48,74,74,74,74,74,74,-55,74,74,74,]),'LE':([39,43,45,46,47,48,54,55,56,57,59,61,62,63,64,65,77,78,79,80,88,93,94,95,96,97,98,99,100,101,102,103,117,119,120,],[75,-56,-62,-61,-63,-64,-60,75,-63,75,-37,75,-63,75,75,75,-57,-58,75,-59,-36,-45,-46,-47,-48,75,75,75,75,75,75,-55,75,75,75,]),'GE':([39,43,45,46,47,48,54,55,56,57,59,61,62,63,64,65,77,78,79,80,88,93,94,95,96,97,98,99,100,101,102,103,117,119,120,],[76,-56,-62,-61,-63,-64,-60,76,-63,76,-37,76,-63,76,76,76,-57,-58,76,-59,-36,-45,-46,-47,-48,76,76,76,76,76,76,-55,76,76,76,]),'RSQUARE':([43,45,46,47,48,54,57,59,77,78,80,88,93,94,95,96,97,98,99,100,101,102,103,],[-56,-62,-61,-63,-64,-60,87,-37,-57,-58,-59,-36,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,]),'COMMA':([43,45,46,47,48,54,59,60,61,62,77,78,80,88,93,94,95,96,97,98,99,100,101,102,103,104,],[-56,-62,-61,-63,-64,-60,-37,89,-32,-33,-57,-58,-59,-36,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,114,]),'OF':([51,],[82,]),'LBRACE':([91,92,106,115,133,134,],[112,113,116,124,136,137,]),'ELSE':([129,],[133,]),'INSTEAD':([130,],[134,]),}
+_lr_action_items = {'IDENTIFIER':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,20,22,24,25,31,32,33,36,37,38,39,40,42,43,44,47,51,54,56,60,61,70,71,72,73,74,75,76,77,78,79,80,84,87,88,90,91,92,94,97,116,117,118,120,122,123,124,125,126,128,130,134,135,138,139,140,141,142,143,144,145,147,148,152,153,154,155,156,157,158,159,],[15,15,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,46,52,55,56,-3,46,46,46,-41,46,46,46,46,46,46,86,-26,89,-65,46,-27,-25,46,46,46,46,46,46,46,46,46,46,46,113,116,-47,-15,-17,46,46,46,46,46,-18,-20,15,15,46,113,15,-45,15,15,15,15,-44,-46,-16,46,-22,-23,15,-34,-33,-19,15,15,15,15,-21,-24,]),'PRINT':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,31,37,51,56,61,70,90,91,92,120,122,123,124,128,130,134,135,138,139,140,141,142,144,145,147,148,152,153,154,155,156,157,158,159,],[17,17,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-3,-41,-26,-65,-27,-25,-47,-15,-17,-18,-20,17,17,17,-45,17,17,17,17,-44,-46,-16,-22,-23,17,-34,-33,-19,17,17,17,17,-21,-24,]),'IF':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,31,37,51,56,61,70,90,91,92,120,122,123,124,128,130,134,135,138,139,140,141,142,144,145,147,148,152,153,154,155,156,157,158,159,],[18,18,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-3,-41,-26,-65,-27,-25,-47,-15,-17,-18,-20,18,18,18,-45,18,18,18,18,-44,-46,-16,-22,-23,18,-34,-33,-19,18,18,18,18,-21,-24,]),'WHILE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,31,37,51,56,61,70,90,91,92,120,122,123,124,128,130,134,135,138,139,140,141,142,144,145,147,148,152,153,154,155,156,157,158,159,],[19,19,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-3,-41,-26,-65,-27,-25,-47,-15,-17,-18,-20,19,19,19,-45,19,19,19,19,-44,-46,-16,-22,-23,19,-34,-33,-19,19,19,19,19,-21,-24,]),'RETURN':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,31,37,51,56,61,70,90,91,92,120,122,123,124,128,130,134,135,138,139,140,141,142,144,145,147,148,152,153,154,155,156,157,158,159,],[20,20,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-3,-41,-26,-65,-27,-25,-47,-15,-17,-18,-20,20,20,20,-45,20,20,20,20,-44,-46,-16,-22,-23,20,-34,-33,-19,20,20,20,20,-21,-24,]),'FUNCTION':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,31,37,51,56,61,70,90,91,92,120,122,123,124,128,130,134,135,138,139,140,141,142,144,145,147,148,152,153,154,155,156,157,158,159,],[22,22,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-3,-41,-26,-65,-27,-25,-47,-15,-17,-18,-20,22,22,22,-45,22,22,22,22,-44,-46,-16,-22,-23,22,-34,-33,-19,22,22,22,22,-21,-24,]),'ARRAY_TYPE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,31,37,51,56,61,70,90,91,92,120,122,123,124,128,130,134,135,138,139,140,141,142,144,145,147,148,152,153,154,155,156,157,158,159,],[23,23,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-3,-41,-26,-65,-27,-25,-47,-15,-17,-18,-20,23,23,23,-45,23,23,23,23,-44,-46,-16,-22,-23,23,-34,-33,-19,23,23,23,23,-21,-24,]),'POINTER_TYPE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,31,37,51,56,61,70,90,91,92,120,122,123,124,128,130,134,135,138,139,140,141,142,144,145,147,148,152,153,154,155,156,157,158,159,],[24,24,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-3,-41,-26,-65,-27,-25,-47,-15,-17,-18,-20,24,24,24,-45,24,24,24,24,-44,-46,-16,-22,-23,24,-34,-33,-19,24,24,24,24,-21,-24,]),'AMPERSAND':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,20,31,32,33,36,37,38,39,40,42,43,44,51,56,60,61,70,71,72,73,74,75,76,77,78,79,80,84,90,91,92,94,97,116,117,118,120,122,123,124,125,128,130,134,135,138,139,140,141,142,143,144,145,147,148,152,153,154,155,156,157,158,159,],[25,25,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,25,-3,25,25,25,-41,25,25,25,25,25,25,-26,-65,25,-27,-25,25,25,25,25,25,25,25,25,25,25,25,-47,-15,-17,25,25,25,25,25,-18,-20,25,25,25,25,-45,25,25,25,25,-44,-46,-16,25,-22,-23,25,-34,-33,-19,25,25,25,25,-21,-24,]),'TOP':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,31,37,46,51,56,61,70,90,91,92,120,122,123,124,128,130,134,135,138,139,140,141,142,144,145,147,148,152,153,154,155,156,157,158,159,],[26,26,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,26,-3,-41,26,-26,-65,-27,-25,-47,-15,-17,-18,-20,26,26,26,-45,26,26,26,26,-44,-46,-16,-22,-23,26,-34,-33,-19,26,26,26,26,-21,-24,]),'BOTTOM':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,31,37,46,51,56,61,70,90,91,92,120,122,123,124,128,130,134,135,138,139,140,141,142,144,145,147,148,152,153,154,155,156,157,158,159,],[27,27,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,27,-3,-41,27,-26,-65,-27,-25,-47,-15,-17,-18,-20,27,27,27,-45,27,27,27,27,-44,-46,-16,-22,-23,27,-34,-33,-19,27,27,27,27,-21,-24,]),'LEFT':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,31,37,46,51,56,61,70,90,91,92,120,122,123,124,128,130,134,135,138,139,140,141,142,144,145,147,148,152,153,154,155,156,157,158,159,],[28,28,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,28,-3,-41,28,-26,-65,-27,-25,-47,-15,-17,-18,-20,28,28,28,-45,28,28,28,28,-44,-46,-16,-22,-23,28,-34,-33,-19,28,28,28,28,-21,-24,]),'RIGHT':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,31,37,46,51,56,61,70,90,91,92,120,122,123,124,128,130,134,135,138,139,140,141,142,144,145,147,148,152,153,154,155,156,157,158,159,],[29,29,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,29,-3,-41,29,-26,-65,-27,-25,-47,-15,-17,-18,-20,29,29,29,-45,29,29,29,29,-44,-46,-16,-22,-23,29,-34,-33,-19,29,29,29,29,-21,-24,]),'TIMESHIFT':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,31,37,46,51,56,61,70,90,91,92,120,122,123,124,128,130,134,135,138,139,140,141,142,144,145,147,148,152,153,154,155,156,157,158,159,],[30,30,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,30,-3,-41,30,-26,-65,-27,-25,-47,-15,-17,-18,-20,30,30,30,-45,30,30,30,30,-44,-46,-16,-22,-23,30,-34,-33,-19,30,30,30,30,-21,-24,]),'$end':([1,2,3,4,5,6,7,8,9,10,11,12,13,14,31,37,51,56,61,70,90,91,92,120,122,130,140,141,142,144,145,148,152,153,158,159,],[0,-1,-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-3,-41,-26,-65,-27,-25,-47,-15,-17,-18,-20,-45,-44,-46,-16,-22,-23,-34,-33,-19,-21,-24,]),'RBRACE':([3,4,5,6,7,8,9,10,11,12,13,14,31,37,51,56,61,70,90,91,92,120,122,130,134,135,139,140,141,142,144,145,147,148,152,153,156,157,158,159,],[-2,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-14,-3,-41,-26,-65,-27,-25,-47,-15,-17,-18,-20,-45,144,145,148,-44,-46,-16,-22,-23,152,-34,-33,-19,158,159,-21,-24,]),'ASSIGN':([15,34,89,93,133,],[32,60,117,118,143,]),'LSQUARE':([15,46,],[33,84,]),'EMPTY_ARRAY':([15,],[34,]),'LPAREN':([15,17,18,19,20,32,33,36,38,39,40,42,43,44,46,52,60,71,72,73,74,75,76,77,78,79,80,84,94,97,116,117,118,125,143,],[36,38,39,40,44,44,44,44,44,44,44,44,44,44,36,87,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,]),'SEMI':([16,21,26,27,28,29,30,35,41,45,46,48,49,50,55,56,57,58,63,81,82,85,86,95,96,98,101,102,103,104,105,106,107,108,109,110,111,116,129,131,132,146,149,],[37,51,-28,-29,-30,-31,-32,61,70,-59,-67,-66,-68,-69,90,-65,91,92,-40,-60,-63,-62,-64,120,-39,122,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,130,140,141,142,-61,153,]),'NUMBER':([20,32,33,36,38,39,40,42,43,44,60,71,72,73,74,75,76,77,78,79,80,84,94,97,116,117,118,125,143,],[45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,]),'MINUS':([20,26,27,28,29,30,32,33,36,38,39,40,41,42,43,44,45,46,48,49,50,56,57,58,59,60,63,65,66,67,68,69,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,94,95,96,97,101,102,103,104,105,106,107,108,109,110,111,112,116,117,118,119,125,129,131,132,136,143,146,149,],[42,-28,-29,-30,-31,-32,42,42,42,42,42,42,72,42,42,42,-59,-67,-66,-68,-69,-65,72,-68,72,42,-40,72,-68,72,72,72,42,42,42,42,42,42,42,42,42,42,-60,-63,72,42,-62,-64,42,72,-39,42,-48,-49,-50,-51,72,72,72,72,72,72,-58,72,42,42,42,72,42,72,72,72,72,42,-61,72,]),'MUL':([20,26,27,28,29,30,32,33,36,38,39,40,41,42,43,44,45,46,48,49,50,56,57,58,59,60,63,65,66,67,68,69,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,94,95,96,97,101,102,103,104,105,106,107,108,109,110,111,112,116,117,118,119,125,129,131,132,136,143,146,149,],[43,-28,-29,-30,-31,-32,43,43,43,43,43,43,73,43,43,43,-59,-67,-66,-68,-69,-65,73,-68,73,43,-40,73,-68,73,73,73,43,43,43,43,43,43,43,43,43,43,-60,-63,73,43,-62,-64,43,73,-39,43,73,73,-50,-51,73,73,73,73,73,73,-58,73,43,43,43,73,43,73,73,73,73,43,-61,73,]),'QUESTION_MARK':([20,32,33,36,38,39,40,42,43,44,60,71,72,73,74,75,76,77,78,79,80,84,94,97,116,117,118,125,143,],[47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,]),'STRING':([20,32,33,36,38,39,40,42,43,44,60,71,72,73,74,75,76,77,78,79,80,84,94,97,116,117,118,125,143,],[48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,]),'INTEGER_TYPE':([23,24,],[53,54,]),'PLUS':([26,27,28,29,30,41,45,46,48,49,50,56,57,58,59,63,65,66,67,68,69,81,82,83,85,86,95,96,101,102,103,104,105,106,107,108,109,110,111,112,119,129,131,132,136,146,149,],[-28,-29,-30,-31,-32,71,-59,-67,-66,-68,-69,-65,71,-68,71,-40,71,-68,71,71,71,-60,-63,71,-62,-64,71,-39,-48,-49,-50,-51,71,71,71,71,71,71,-58,71,71,71,71,71,71,-61,71,]),'DIV':([26,27,28,29,30,41,45,46,48,49,50,56,57,58,59,63,65,66,67,68,69,81,82,83,85,86,95,96,101,102,103,104,105,106,107,108,109,110,111,112,119,129,131,132,136,146,149,],[-28,-29,-30,-31,-32,74,-59,-67,-66,-68,-69,-65,74,-68,74,-40,74,-68,74,74,74,-60,-63,74,-62,-64,74,-39,74,74,-50,-51,74,74,74,74,74,74,-58,74,74,74,74,74,74,-61,74,]),'EQ':([26,27,28,29,30,41,45,46,48,49,50,56,57,58,59,63,65,66,67,68,69,81,82,83,85,86,95,96,101,102,103,104,105,106,107,108,109,110,111,112,119,129,131,132,136,146,149,],[-28,-29,-30,-31,-32,75,-59,-67,-66,-68,-69,-65,75,-68,75,-40,75,-68,75,75,75,-60,-63,75,-62,-64,75,-39,-48,-49,-50,-51,75,75,75,75,75,75,-58,75,75,75,75,75,75,-61,75,]),'NE':([26,27,28,29,30,41,45,46,48,49,50,56,57,58,59,63,65,66,67,68,69,81,82,83,85,86,95,96,101,102,103,104,105,106,107,108,109,110,111,112,119,129,131,132,136,146,149,],[-28,-29,-30,-31,-32,76,-59,-67,-66,-68,-69,-65,76,-68,76,-40,76,-68,76,76,76,-60,-63,76,-62,-64,76,-39,-48,-49,-50,-51,76,76,76,76,76,76,-58,76,76,76,76,76,76,-61,76,]),'LT':([26,27,28,29,30,41,45,46,48,49,50,56,57,58,59,63,65,66,67,68,69,81,82,83,85,86,95,96,101,102,103,104,105,106,107,108,109,110,111,112,119,129,131,132,136,146,149,],[-28,-29,-30,-31,-32,77,-59,-67,-66,-68,-69,-65,77,-68,77,-40,77,-68,77,77,77,-60,-63,77,-62,-64,77,-39,-48,-49,-50,-51,77,77,77,77,77,77,-58,77,77,77,77,77,77,-61,77,]),'GT':([26,27,28,29,30,41,45,46,48,49,50,56,57,58,59,63,65,66,67,68,69,81,82,83,85,86,95,96,101,102,103,104,105,106,107,108,109,110,111,112,119,129,131,132,136,146,149,],[-28,-29,-30,-31,-32,78,-59,-67,-66,-68,-69,-65,78,-68,78,-40,78,-68,78,78,78,-60,-63,78,-62,-64,78,-39,-48,-49,-50,-51,78,78,78,78,78,78,-58,78,78,78,78,78,78,-61,78,]),'LE':([26,27,28,29,30,41,45,46,48,49,50,56,57,58,59,63,65,66,67,68,69,81,82,83,85,86,95,96,101,102,103,104,105,106,107,108,109,110,111,112,119,129,131,132,136,146,149,],[-28,-29,-30,-31,-32,79,-59,-67,-66,-68,-69,-65,79,-68,79,-40,79,-68,79,79,79,-60,-63,79,-62,-64,79,-39,-48,-49,-50,-51,79,79,79,79,79,79,-58,79,79,79,79,79,79,-61,79,]),'GE':([26,27,28,29,30,41,45,46,48,49,50,56,57,58,59,63,65,66,67,68,69,81,82,83,85,86,95,96,101,102,103,104,105,106,107,108,109,110,111,112,119,129,131,132,136,146,149,],[-28,-29,-30,-31,-32,80,-59,-67,-66,-68,-69,-65,80,-68,80,-40,80,-68,80,80,80,-60,-63,80,-62,-64,80,-39,-48,-49,-50,-51,80,80,80,80,80,80,-58,80,80,80,80,80,80,-61,80,]),'RSQUARE':([26,27,28,29,30,45,46,48,49,50,56,59,63,81,82,85,86,96,101,102,103,104,105,106,107,108,109,110,111,119,136,146,],[-28,-29,-30,-31,-32,-59,-67,-66,-68,-69,-65,93,-40,-60,-63,-62,-64,-39,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,133,146,-61,]),'COLON':([26,27,28,29,30,45,46,48,49,50,56,59,63,81,82,85,86,96,101,102,103,104,105,106,107,108,109,110,111,112,146,],[-28,-29,-30,-31,-32,-59,-67,-66,-68,-69,-65,94,-40,-60,-63,-62,-64,-39,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,125,-61,]),'COMMA':([26,27,28,29,30,45,46,48,49,50,56,63,64,65,66,81,82,85,86,96,101,102,103,104,105,106,107,108,109,110,111,113,146,],[-28,-29,-30,-31,-32,-59,-67,-66,-68,-69,-65,-40,97,-35,-36,-60,-63,-62,-64,-39,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,126,-61,]),'RPAREN':([26,27,28,29,30,36,45,46,48,49,50,56,62,63,64,65,66,67,68,69,81,82,83,85,86,87,96,101,102,103,104,105,106,107,108,109,110,111,113,114,121,137,146,],[-28,-29,-30,-31,-32,63,-59,-67,-66,-68,-69,-65,96,-40,-37,-35,-36,98,99,100,-60,-63,111,-62,-64,115,-39,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-42,127,-38,-43,-61,]),'OF':([53,],[88,]),'LBRACE':([99,100,115,127,150,151,],[123,124,128,138,154,155,]),'ELSE':([144,],[150,]),'INSTEAD':([145,],[151,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -17,7 +17,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'program':([0,],[1,]),'statement_list':([0,112,113,116,124,136,137,],[2,121,122,125,131,138,139,]),'statement':([0,2,112,113,116,121,122,124,125,131,136,137,138,139,],[3,31,3,3,3,31,31,3,31,31,3,3,31,31,]),'assignment':([0,2,112,113,116,121,122,124,125,131,136,137,138,139,],[4,4,4,4,4,4,4,4,4,4,4,4,4,4,]),'print_statement':([0,2,112,113,116,121,122,124,125,131,136,137,138,139,],[5,5,5,5,5,5,5,5,5,5,5,5,5,5,]),'if_statement':([0,2,112,113,116,121,122,124,125,131,136,137,138,139,],[6,6,6,6,6,6,6,6,6,6,6,6,6,6,]),'while_statement':([0,2,112,113,116,121,122,124,125,131,136,137,138,139,],[7,7,7,7,7,7,7,7,7,7,7,7,7,7,]),'return_statement':([0,2,112,113,116,121,122,124,125,131,136,137,138,139,],[8,8,8,8,8,8,8,8,8,8,8,8,8,8,]),'move_statement':([0,2,112,113,116,121,122,124,125,131,136,137,138,139,],[9,9,9,9,9,9,9,9,9,9,9,9,9,9,]),'function_decl':([0,2,112,113,116,121,122,124,125,131,136,137,138,139,],[10,10,10,10,10,10,10,10,10,10,10,10,10,10,]),'array_decl':([0,2,112,113,116,121,122,124,125,131,136,137,138,139,],[11,11,11,11,11,11,11,11,11,11,11,11,11,11,]),'pointer_decl':([0,2,112,113,116,121,122,124,125,131,136,137,138,139,],[12,12,12,12,12,12,12,12,12,12,12,12,12,12,]),'address_of':([0,2,20,32,33,34,36,37,38,40,41,42,67,68,69,70,71,72,73,74,75,76,89,107,108,109,112,113,116,121,122,124,125,131,136,137,138,139,],[13,13,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,13,13,13,13,13,13,13,13,13,13,13,13,]),'function_call_stmt':([0,2,112,113,116,121,122,124,125,131,136,137,138,139,],[14,14,14,14,14,14,14,14,14,14,14,14,14,14,]),'function_call':([0,2,20,32,33,34,36,37,38,40,41,42,67,68,69,70,71,72,73,74,75,76,89,107,108,109,112,113,116,121,122,124,125,131,136,137,138,139,],[16,16,47,56,47,62,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,62,47,47,47,16,16,16,16,16,16,16,16,16,16,16,16,]),'direction':([0,2,112,113,116,121,122,124,125,131,136,137,138,139,],[21,21,21,21,21,21,21,21,21,21,21,21,21,21,]),'expr':([20,32,33,34,36,37,38,40,41,42,67,68,69,70,71,72,73,74,75,76,89,107,108,109,],[39,55,57,61,63,64,65,77,78,79,93,94,95,96,97,98,99,100,101,102,61,117,119,120,]),'function_args_list':([34,89,],[58,110,]),'function_args':([34,89,],[60,60,]),'params':([81,114,],[105,123,]),}
+_lr_goto_items = {'program':([0,],[1,]),'statement_list':([0,123,124,128,138,154,155,],[2,134,135,139,147,156,157,]),'statement':([0,2,123,124,128,134,135,138,139,147,154,155,156,157,],[3,31,3,3,3,31,31,3,31,31,3,3,31,31,]),'assignment':([0,2,123,124,128,134,135,138,139,147,154,155,156,157,],[4,4,4,4,4,4,4,4,4,4,4,4,4,4,]),'print_statement':([0,2,123,124,128,134,135,138,139,147,154,155,156,157,],[5,5,5,5,5,5,5,5,5,5,5,5,5,5,]),'if_statement':([0,2,123,124,128,134,135,138,139,147,154,155,156,157,],[6,6,6,6,6,6,6,6,6,6,6,6,6,6,]),'while_statement':([0,2,123,124,128,134,135,138,139,147,154,155,156,157,],[7,7,7,7,7,7,7,7,7,7,7,7,7,7,]),'return_statement':([0,2,123,124,128,134,135,138,139,147,154,155,156,157,],[8,8,8,8,8,8,8,8,8,8,8,8,8,8,]),'move_statement':([0,2,123,124,128,134,135,138,139,147,154,155,156,157,],[9,9,9,9,9,9,9,9,9,9,9,9,9,9,]),'function_decl':([0,2,123,124,128,134,135,138,139,147,154,155,156,157,],[10,10,10,10,10,10,10,10,10,10,10,10,10,10,]),'array_decl':([0,2,123,124,128,134,135,138,139,147,154,155,156,157,],[11,11,11,11,11,11,11,11,11,11,11,11,11,11,]),'pointer_decl':([0,2,123,124,128,134,135,138,139,147,154,155,156,157,],[12,12,12,12,12,12,12,12,12,12,12,12,12,12,]),'address_of':([0,2,20,32,33,36,38,39,40,42,43,44,60,71,72,73,74,75,76,77,78,79,80,84,94,97,116,117,118,123,124,125,128,134,135,138,139,143,147,154,155,156,157,],[13,13,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,13,13,50,13,13,13,13,13,50,13,13,13,13,13,]),'function_call_stmt':([0,2,123,124,128,134,135,138,139,147,154,155,156,157,],[14,14,14,14,14,14,14,14,14,14,14,14,14,14,]),'function_call':([0,2,20,32,33,36,38,39,40,42,43,44,60,71,72,73,74,75,76,77,78,79,80,84,94,97,116,117,118,123,124,125,128,134,135,138,139,143,147,154,155,156,157,],[16,16,49,58,49,66,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,66,49,49,49,16,16,49,16,16,16,16,16,49,16,16,16,16,16,]),'direction':([0,2,15,46,123,124,128,134,135,138,139,147,154,155,156,157,],[21,21,35,85,21,21,21,21,21,21,21,21,21,21,21,21,]),'expr':([20,32,33,36,38,39,40,42,43,44,60,71,72,73,74,75,76,77,78,79,80,84,94,97,116,117,118,125,143,],[41,57,59,65,67,68,69,81,82,83,95,101,102,103,104,105,106,107,108,109,110,112,119,65,129,131,132,136,149,]),'function_args_list':([36,97,],[62,121,]),'function_args':([36,97,],[64,64,]),'params':([87,126,],[114,137,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -27,68 +27,73 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> program","S'",1,None,None,None),
-  ('program -> statement_list','program',1,'p_program','parser.py',17),
-  ('statement_list -> statement','statement_list',1,'p_statement_list','parser.py',22),
-  ('statement_list -> statement_list statement','statement_list',2,'p_statement_list','parser.py',23),
-  ('statement -> assignment','statement',1,'p_statement','parser.py',31),
-  ('statement -> print_statement','statement',1,'p_statement','parser.py',32),
-  ('statement -> if_statement','statement',1,'p_statement','parser.py',33),
-  ('statement -> while_statement','statement',1,'p_statement','parser.py',34),
-  ('statement -> return_statement','statement',1,'p_statement','parser.py',35),
-  ('statement -> move_statement','statement',1,'p_statement','parser.py',36),
-  ('statement -> function_decl','statement',1,'p_statement','parser.py',37),
-  ('statement -> array_decl','statement',1,'p_statement','parser.py',38),
-  ('statement -> pointer_decl','statement',1,'p_statement','parser.py',39),
-  ('statement -> address_of','statement',1,'p_statement','parser.py',40),
-  ('statement -> function_call_stmt','statement',1,'p_statement','parser.py',41),
-  ('assignment -> IDENTIFIER ASSIGN expr SEMI','assignment',4,'p_assignment','parser.py',46),
-  ('assignment -> IDENTIFIER LSQUARE expr RSQUARE ASSIGN expr SEMI','assignment',7,'p_assignment','parser.py',47),
-  ('assignment -> IDENTIFIER ASSIGN function_call SEMI','assignment',4,'p_assignment','parser.py',48),
-  ('print_statement -> PRINT LPAREN expr RPAREN SEMI','print_statement',5,'p_print_statement','parser.py',56),
-  ('if_statement -> IF LPAREN expr RPAREN LBRACE statement_list RBRACE ELSE LBRACE statement_list RBRACE','if_statement',11,'p_if_statement','parser.py',61),
-  ('if_statement -> IF LPAREN expr RPAREN LBRACE statement_list RBRACE','if_statement',7,'p_if_statement','parser.py',62),
-  ('while_statement -> WHILE LPAREN expr RPAREN LBRACE statement_list RBRACE','while_statement',7,'p_while_statement','parser.py',70),
-  ('while_statement -> WHILE LPAREN expr RPAREN LBRACE statement_list RBRACE INSTEAD LBRACE statement_list RBRACE','while_statement',11,'p_while_statement','parser.py',71),
-  ('return_statement -> RETURN expr SEMI','return_statement',3,'p_return_statement','parser.py',80),
-  ('move_statement -> direction SEMI','move_statement',2,'p_move_statement','parser.py',85),
-  ('direction -> TOP','direction',1,'p_direction','parser.py',90),
-  ('direction -> BOTTOM','direction',1,'p_direction','parser.py',91),
-  ('direction -> LEFT','direction',1,'p_direction','parser.py',92),
-  ('direction -> RIGHT','direction',1,'p_direction','parser.py',93),
-  ('direction -> TIMESHIFT','direction',1,'p_direction','parser.py',94),
-  ('function_decl -> FUNCTION IDENTIFIER LPAREN params RPAREN LBRACE statement_list RBRACE','function_decl',8,'p_function_decl','parser.py',99),
-  ('function_decl -> FUNCTION IDENTIFIER LPAREN RPAREN LBRACE statement_list RBRACE','function_decl',7,'p_function_decl','parser.py',100),
-  ('function_args -> expr','function_args',1,'p_function_args_expr','parser.py',108),
-  ('function_args -> function_call','function_args',1,'p_function_args_expr','parser.py',109),
-  ('function_args_list -> function_args','function_args_list',1,'p_function_args_list','parser.py',114),
-  ('function_args_list -> function_args COMMA function_args_list','function_args_list',3,'p_function_args_list','parser.py',115),
-  ('function_call -> IDENTIFIER LPAREN function_args_list RPAREN','function_call',4,'p_function_call','parser.py',123),
-  ('function_call -> IDENTIFIER LPAREN RPAREN','function_call',3,'p_function_call','parser.py',124),
-  ('function_call_stmt -> function_call SEMI','function_call_stmt',2,'p_function_call_stmt','parser.py',132),
-  ('params -> IDENTIFIER','params',1,'p_params','parser.py',137),
-  ('params -> IDENTIFIER COMMA params','params',3,'p_params','parser.py',138),
-  ('array_decl -> ARRAY_TYPE INTEGER_TYPE OF IDENTIFIER expr SEMI','array_decl',6,'p_array_decl1','parser.py',146),
-  ('array_decl -> ARRAY_TYPE INTEGER_TYPE OF IDENTIFIER SEMI','array_decl',5,'p_array_decl1','parser.py',147),
-  ('pointer_decl -> POINTER_TYPE INTEGER_TYPE IDENTIFIER ASSIGN expr SEMI','pointer_decl',6,'p_pointer_decl','parser.py',155),
-  ('pointer_decl -> POINTER_TYPE IDENTIFIER SEMI','pointer_decl',3,'p_pointer_decl','parser.py',156),
-  ('expr -> expr PLUS expr','expr',3,'p_expr_binop','parser.py',164),
-  ('expr -> expr MINUS expr','expr',3,'p_expr_binop','parser.py',165),
-  ('expr -> expr MUL expr','expr',3,'p_expr_binop','parser.py',166),
-  ('expr -> expr DIV expr','expr',3,'p_expr_binop','parser.py',167),
-  ('expr -> expr EQ expr','expr',3,'p_expr_binop','parser.py',168),
-  ('expr -> expr NE expr','expr',3,'p_expr_binop','parser.py',169),
-  ('expr -> expr LT expr','expr',3,'p_expr_binop','parser.py',170),
-  ('expr -> expr GT expr','expr',3,'p_expr_binop','parser.py',171),
-  ('expr -> expr LE expr','expr',3,'p_expr_binop','parser.py',172),
-  ('expr -> expr GE expr','expr',3,'p_expr_binop','parser.py',173),
-  ('expr -> LPAREN expr RPAREN','expr',3,'p_expr_group','parser.py',178),
-  ('expr -> NUMBER','expr',1,'p_expr_num','parser.py',183),
-  ('expr -> MINUS expr','expr',2,'p_expr_uminus','parser.py',188),
-  ('expr -> MUL expr','expr',2,'p_expr_umul','parser.py',196),
-  ('expr -> QUESTION_MARK IDENTIFIER','expr',2,'p_expr_questionmark','parser.py',201),
-  ('address_of -> AMPERSAND IDENTIFIER','address_of',2,'p_address_of','parser.py',206),
-  ('expr -> STRING','expr',1,'p_expr_str','parser.py',211),
-  ('expr -> IDENTIFIER','expr',1,'p_expr_var','parser.py',216),
-  ('expr -> function_call','expr',1,'p_expr_var','parser.py',217),
-  ('expr -> address_of','expr',1,'p_expr_var','parser.py',218),
+  ('program -> statement_list','program',1,'p_program','parser.py',20),
+  ('statement_list -> statement','statement_list',1,'p_statement_list','parser.py',25),
+  ('statement_list -> statement_list statement','statement_list',2,'p_statement_list','parser.py',26),
+  ('statement -> assignment','statement',1,'p_statement','parser.py',36),
+  ('statement -> print_statement','statement',1,'p_statement','parser.py',37),
+  ('statement -> if_statement','statement',1,'p_statement','parser.py',38),
+  ('statement -> while_statement','statement',1,'p_statement','parser.py',39),
+  ('statement -> return_statement','statement',1,'p_statement','parser.py',40),
+  ('statement -> move_statement','statement',1,'p_statement','parser.py',41),
+  ('statement -> function_decl','statement',1,'p_statement','parser.py',42),
+  ('statement -> array_decl','statement',1,'p_statement','parser.py',43),
+  ('statement -> pointer_decl','statement',1,'p_statement','parser.py',44),
+  ('statement -> address_of','statement',1,'p_statement','parser.py',45),
+  ('statement -> function_call_stmt','statement',1,'p_statement','parser.py',46),
+  ('assignment -> IDENTIFIER ASSIGN expr SEMI','assignment',4,'p_assignment','parser.py',58),
+  ('assignment -> IDENTIFIER LSQUARE expr RSQUARE ASSIGN expr SEMI','assignment',7,'p_assignment','parser.py',59),
+  ('assignment -> IDENTIFIER ASSIGN function_call SEMI','assignment',4,'p_assignment','parser.py',60),
+  ('assignment -> IDENTIFIER EMPTY_ARRAY ASSIGN expr SEMI','assignment',5,'p_slice_assignment','parser.py',69),
+  ('assignment -> IDENTIFIER LSQUARE expr COLON expr RSQUARE ASSIGN expr SEMI','assignment',9,'p_slice_assignment','parser.py',70),
+  ('print_statement -> PRINT LPAREN expr RPAREN SEMI','print_statement',5,'p_print_statement','parser.py',79),
+  ('if_statement -> IF LPAREN expr RPAREN LBRACE statement_list RBRACE ELSE LBRACE statement_list RBRACE','if_statement',11,'p_if_statement','parser.py',85),
+  ('if_statement -> IF LPAREN expr RPAREN LBRACE statement_list RBRACE','if_statement',7,'p_if_statement','parser.py',86),
+  ('while_statement -> WHILE LPAREN expr RPAREN LBRACE statement_list RBRACE','while_statement',7,'p_while_statement','parser.py',95),
+  ('while_statement -> WHILE LPAREN expr RPAREN LBRACE statement_list RBRACE INSTEAD LBRACE statement_list RBRACE','while_statement',11,'p_while_statement','parser.py',96),
+  ('return_statement -> RETURN expr SEMI','return_statement',3,'p_return_statement','parser.py',106),
+  ('move_statement -> direction SEMI','move_statement',2,'p_move_statement','parser.py',112),
+  ('move_statement -> IDENTIFIER direction SEMI','move_statement',3,'p_slide_statement','parser.py',118),
+  ('direction -> TOP','direction',1,'p_direction','parser.py',131),
+  ('direction -> BOTTOM','direction',1,'p_direction','parser.py',132),
+  ('direction -> LEFT','direction',1,'p_direction','parser.py',133),
+  ('direction -> RIGHT','direction',1,'p_direction','parser.py',134),
+  ('direction -> TIMESHIFT','direction',1,'p_direction','parser.py',135),
+  ('function_decl -> FUNCTION IDENTIFIER LPAREN params RPAREN LBRACE statement_list RBRACE','function_decl',8,'p_function_decl','parser.py',141),
+  ('function_decl -> FUNCTION IDENTIFIER LPAREN RPAREN LBRACE statement_list RBRACE','function_decl',7,'p_function_decl','parser.py',142),
+  ('function_args -> expr','function_args',1,'p_function_args_expr','parser.py',151),
+  ('function_args -> function_call','function_args',1,'p_function_args_expr','parser.py',152),
+  ('function_args_list -> function_args','function_args_list',1,'p_function_args_list','parser.py',157),
+  ('function_args_list -> function_args COMMA function_args_list','function_args_list',3,'p_function_args_list','parser.py',158),
+  ('function_call -> IDENTIFIER LPAREN function_args_list RPAREN','function_call',4,'p_function_call','parser.py',166),
+  ('function_call -> IDENTIFIER LPAREN RPAREN','function_call',3,'p_function_call','parser.py',167),
+  ('function_call_stmt -> function_call SEMI','function_call_stmt',2,'p_function_call_stmt','parser.py',176),
+  ('params -> IDENTIFIER','params',1,'p_params','parser.py',182),
+  ('params -> IDENTIFIER COMMA params','params',3,'p_params','parser.py',183),
+  ('array_decl -> ARRAY_TYPE INTEGER_TYPE OF IDENTIFIER expr SEMI','array_decl',6,'p_array_decl1','parser.py',191),
+  ('array_decl -> ARRAY_TYPE INTEGER_TYPE OF IDENTIFIER SEMI','array_decl',5,'p_array_decl1','parser.py',192),
+  ('pointer_decl -> POINTER_TYPE INTEGER_TYPE IDENTIFIER ASSIGN expr SEMI','pointer_decl',6,'p_pointer_decl','parser.py',201),
+  ('pointer_decl -> POINTER_TYPE IDENTIFIER SEMI','pointer_decl',3,'p_pointer_decl','parser.py',202),
+  ('expr -> expr PLUS expr','expr',3,'p_expr_binop','parser.py',211),
+  ('expr -> expr MINUS expr','expr',3,'p_expr_binop','parser.py',212),
+  ('expr -> expr MUL expr','expr',3,'p_expr_binop','parser.py',213),
+  ('expr -> expr DIV expr','expr',3,'p_expr_binop','parser.py',214),
+  ('expr -> expr EQ expr','expr',3,'p_expr_binop','parser.py',215),
+  ('expr -> expr NE expr','expr',3,'p_expr_binop','parser.py',216),
+  ('expr -> expr LT expr','expr',3,'p_expr_binop','parser.py',217),
+  ('expr -> expr GT expr','expr',3,'p_expr_binop','parser.py',218),
+  ('expr -> expr LE expr','expr',3,'p_expr_binop','parser.py',219),
+  ('expr -> expr GE expr','expr',3,'p_expr_binop','parser.py',220),
+  ('expr -> LPAREN expr RPAREN','expr',3,'p_expr_group','parser.py',225),
+  ('expr -> NUMBER','expr',1,'p_expr_num','parser.py',230),
+  ('expr -> MINUS expr','expr',2,'p_expr_uminus','parser.py',235),
+  ('expr -> IDENTIFIER LSQUARE expr COLON expr RSQUARE','expr',6,'p_expr_slice','parser.py',240),
+  ('expr -> IDENTIFIER direction','expr',2,'p_expr_slide','parser.py',245),
+  ('expr -> MUL expr','expr',2,'p_expr_umul','parser.py',250),
+  ('expr -> QUESTION_MARK IDENTIFIER','expr',2,'p_expr_questionmark','parser.py',255),
+  ('address_of -> AMPERSAND IDENTIFIER','address_of',2,'p_address_of','parser.py',260),
+  ('expr -> STRING','expr',1,'p_expr_str','parser.py',266),
+  ('expr -> IDENTIFIER','expr',1,'p_expr_var','parser.py',271),
+  ('expr -> function_call','expr',1,'p_expr_var','parser.py',272),
+  ('expr -> address_of','expr',1,'p_expr_var','parser.py',273),
 ]
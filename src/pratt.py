@@ -0,0 +1,461 @@
+import re
+import sys
+
+from src.lexer import TYPES, tokens
+from src.logic import *
+
+__all__ = ["tokenize", "StreamTokenizer", "PrattParser"]
+
+_TOKEN_RE = re.compile(
+    r"(?P<WS>[ \t]+)"
+    r"|(?P<NEWLINE>\n+)"
+    r"|(?P<NUMBER>\d+(\.\d*)?)"
+    r"|(?P<IDENTIFIER>[a-zA-Z_][a-zA-Z_0-9]*)"
+    r'|(?P<STRING>"[^"]*")'
+    r"|(?P<OP>\[\]|!=|<=|>=|:=|[-+*/=<>()\[\]{};,&?:])"
+)
+
+# Те же литералы, что и t_* в src/lexer.py
+OPERATORS = {
+    "+": "PLUS",
+    "-": "MINUS",
+    "*": "MUL",
+    "/": "DIV",
+    "=": "EQ",
+    "!=": "NE",
+    "<": "LT",
+    ">": "GT",
+    "<=": "LE",
+    ">=": "GE",
+    "(": "LPAREN",
+    ")": "RPAREN",
+    "[": "LSQUARE",
+    "]": "RSQUARE",
+    "{": "LBRACE",
+    "}": "RBRACE",
+    ";": "SEMI",
+    ",": "COMMA",
+    ":=": "ASSIGN",
+    ":": "COLON",
+    "&": "AMPERSAND",
+    "?": "QUESTION_MARK",
+    "[]": "EMPTY_ARRAY",
+}
+assert set(OPERATORS.values()) | set(TYPES.values()) | {
+    "NUMBER",
+    "STRING",
+    "IDENTIFIER",
+} == set(tokens)
+
+# Маркеры конца ввода, ошибки лексера и конца прочитанной части потока
+EOF = "$end"
+ILLEGAL = "$illegal"
+MORE = "$more"
+
+# Сравнения в грамматике PLY не имеют приоритета: они связывают слабее
+# всех и, как при разрешении конфликтов сдвигом, правоассоциативны
+BINARY_PRECEDENCE = {
+    "EQ": 1,
+    "NE": 1,
+    "LT": 1,
+    "GT": 1,
+    "LE": 1,
+    "GE": 1,
+    "PLUS": 2,
+    "MINUS": 2,
+    "MUL": 3,
+    "DIV": 3,
+}
+RIGHT_ASSOC = {"EQ", "NE", "LT", "GT", "LE", "GE"}
+
+DIRECTIONS = {"TOP", "BOTTOM", "LEFT", "RIGHT", "TIMESHIFT"}
+
+
+def _scan(text: str, out: tuple, lineno: int, base: int, final: bool):
+    """Дописывает токены text в списки out = (types, values, linenos,
+    positions). Возвращает (позиция остановки, lineno).
+
+    Если final=False, токен, упирающийся в конец text, не разбирается:
+    продолжение может прийти со следующей порцией потока.
+    Недопустимый символ превращается в токен ILLEGAL: ошибка возникает,
+    только когда парсер до него дойдёт, как у ленивого лексера PLY.
+    """
+    types, values, linenos, positions = out
+    match = _TOKEN_RE.match
+    pos, end = 0, len(text)
+    while pos < end:
+        m = match(text, pos)
+        if m is None:
+            if not final and (
+                text[pos] == '"' or (pos == end - 1 and text[pos] == "!")
+            ):
+                break  # начало "!=" или строки, ждём продолжения
+            types.append(ILLEGAL)
+            values.append(text[pos])
+            linenos.append(lineno)
+            positions.append(base + pos)
+            return end, lineno
+        if not final and m.end() == end:
+            break
+        kind = m.lastgroup
+        value = m.group(kind)
+        if kind == "WS":
+            pass
+        elif kind == "NEWLINE":
+            lineno += len(value)
+        else:
+            if kind == "OP":
+                kind = OPERATORS[value]
+                value = sys.intern(value)
+            elif kind == "IDENTIFIER":
+                value = sys.intern(value)
+                kind = TYPES.get(value, "IDENTIFIER")
+            elif kind == "NUMBER":
+                value = int(value) if "." not in value else float(value)
+            else:
+                value = sys.intern(value[1:-1])
+            types.append(kind)
+            values.append(value)
+            linenos.append(lineno)
+            positions.append(base + pos)
+        pos = m.end()
+    return pos, lineno
+
+
+def tokenize(text: str):
+    """Один проход по тексту: возвращает параллельные списки
+    типов, значений, номеров строк и позиций токенов."""
+    out = [], [], [], []
+    _, lineno = _scan(text, out, 1, 0, final=True)
+    types, values, linenos, positions = out
+    types.append(EOF)
+    values.append(None)
+    linenos.append(lineno)
+    positions.append(len(text))
+    return out
+
+
+class StreamTokenizer:
+    """Читает поток порциями по chunk_size символов и отдаёт токены
+    пачками. Пачка заканчивается MORE, EOF или ILLEGAL."""
+
+    def __init__(self, stream, chunk_size: int = 1 << 16):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.base = 0  # позиция начала buffer в потоке
+        self.lineno = 1
+        self.done = False
+
+    def next_batch(self):
+        out = types, values, linenos, positions = [], [], [], []
+        while True:
+            chunk = "" if self.done else self.stream.read(self.chunk_size)
+            if not chunk:
+                self.done = True
+            text = self.buffer + chunk
+            pos, self.lineno = _scan(
+                text, out, self.lineno, self.base, final=self.done
+            )
+            self.buffer = text[pos:]
+            self.base += pos
+            if types or self.done:
+                break
+        if not types or types[-1] != ILLEGAL:
+            types.append(EOF if self.done else MORE)
+            values.append(None)
+            linenos.append(self.lineno)
+            positions.append(self.base)
+        return out
+
+
+class PrattParser:
+    """Рекурсивный спуск с разбором выражений по приоритетам.
+
+    Строит те же узлы src/logic.py, что и грамматика src/parser.py,
+    и бросает те же синтаксические ошибки. Интерфейс совпадает с
+    yacc.LRParser: parse(code, lexer=None); аргумент lexer игнорируется,
+    токены строит tokenize.
+    """
+
+    def parse(self, code: str, lexer=None, **kwargs) -> list[AST]:
+        (
+            self.types,
+            self.values,
+            self.linenos,
+            self.positions,
+        ) = tokenize(code)
+        self.pos = 0
+        try:
+            statements = [self.statement()]
+            while self.peek() != EOF:
+                statements.append(self.statement())
+        finally:
+            # Токены не должны жить дольше разбора вместе с парсером
+            self.types = self.values = self.linenos = self.positions = None
+        return statements
+
+    def iter_statements(self, stream, chunk_size: int = 1 << 16):
+        """Потоковый разбор: отдаёт операторы верхнего уровня по мере
+        чтения stream. В памяти держатся только токены текущего
+        оператора, а не вся программа."""
+        self.source = StreamTokenizer(stream, chunk_size)
+        self.types, self.values = [MORE], [None]
+        self.linenos, self.positions = [1], [0]
+        self.pos = self.stmt_start = 0
+        yield self.statement()
+        while self.peek() != EOF:
+            self.stmt_start = self.pos
+            yield self.statement()
+
+    # --- токены ---
+
+    def peek(self) -> str:
+        kind = self.types[self.pos]
+        while kind == MORE:
+            self.refill()
+            kind = self.types[self.pos]
+        if kind == ILLEGAL:
+            raise Exception(f"Illegal character '{self.values[self.pos]}'")
+        return kind
+
+    def refill(self):
+        # Токены уже разобранных операторов больше не нужны
+        start = self.stmt_start
+        del self.types[:start]
+        del self.values[:start]
+        del self.linenos[:start]
+        del self.positions[:start]
+        self.pos -= start
+        self.stmt_start = 0
+
+        types, values, linenos, positions = self.source.next_batch()
+        pos = self.pos
+        self.types[pos:] = types
+        self.values[pos:] = values
+        self.linenos[pos:] = linenos
+        self.positions[pos:] = positions
+
+    def error(self):
+        if self.peek() == EOF:
+            raise Exception("Syntax error at 'EOF'")
+        raise Exception(f"Syntax error at '{self.values[self.pos]}'")
+
+    def advance(self):
+        value = self.values[self.pos]
+        self.pos += 1
+        return value
+
+    def expect(self, kind: str):
+        if self.peek() != kind:
+            self.error()
+        return self.advance()
+
+    # --- операторы ---
+
+    def block(self) -> list[AST]:
+        self.expect("LBRACE")
+        statements = [self.statement()]
+        while self.peek() != "RBRACE":
+            statements.append(self.statement())
+        self.advance()
+        return statements
+
+    def statement(self) -> AST:
+        self.peek()
+        lineno = self.linenos[self.pos]
+        node = self._statement()
+        node.lineno = lineno  # как p_statement
+        return node
+
+    def _statement(self) -> AST:
+        kind = self.peek()
+        if kind == "IDENTIFIER":
+            return self.identifier_statement()
+        elif kind == "PRINT":
+            self.advance()
+            self.expect("LPAREN")
+            expr = self.expr()
+            self.expect("RPAREN")
+            self.expect("SEMI")
+            return Print(expr)
+        elif kind == "IF":
+            condition = self.condition()
+            true_branch = self.block()
+            if self.peek() == "ELSE":
+                self.advance()
+                return If(condition, true_branch, self.block())
+            return If(condition, true_branch)
+        elif kind == "WHILE":
+            condition = self.condition()
+            body = self.block()
+            if self.peek() == "INSTEAD":
+                self.advance()
+                return While(condition, body, self.block())
+            return While(condition, body)
+        elif kind == "RETURN":
+            self.advance()
+            expr = self.expr()
+            self.expect("SEMI")
+            return Return(expr)
+        elif kind in DIRECTIONS:
+            direction = self.advance()
+            self.expect("SEMI")
+            return Move(direction)
+        elif kind == "FUNCTION":
+            return self.function_decl()
+        elif kind == "ARRAY_TYPE":
+            self.advance()
+            self.expect("INTEGER_TYPE")
+            self.expect("OF")
+            name = self.expect("IDENTIFIER")
+            if self.peek() == "SEMI":
+                self.advance()
+                return ArrayDecl(name, Num(10))
+            size = self.expr()
+            self.expect("SEMI")
+            return ArrayDecl(name, size)
+        elif kind == "POINTER_TYPE":
+            var_type = self.advance()
+            if self.peek() == "IDENTIFIER":
+                name = self.advance()
+                self.expect("SEMI")
+                return PointerDecl(var_type, name)
+            self.expect("INTEGER_TYPE")
+            name = self.expect("IDENTIFIER")
+            self.expect("ASSIGN")
+            init_value = self.expr()
+            self.expect("SEMI")
+            return PointerDecl(var_type, name, init_value)
+        elif kind == "AMPERSAND":
+            self.advance()
+            return AddressOf(self.expect("IDENTIFIER"))
+        self.error()
+
+    def identifier_statement(self) -> AST:
+        name = self.advance()
+        kind = self.peek()
+        if kind == "ASSIGN":
+            op = self.advance()
+            right = self.expr()
+            self.expect("SEMI")
+            return Assign(Var(name), op, right)
+        elif kind == "EMPTY_ARRAY":
+            self.advance()
+            self.expect("ASSIGN")
+            value = self.expr()
+            self.expect("SEMI")
+            return SliceAssignment(name, None, None, value)
+        elif kind == "LSQUARE":
+            self.advance()
+            index = self.expr()
+            if self.peek() == "COLON":
+                self.advance()
+                end = self.expr()
+                self.expect("RSQUARE")
+                self.expect("ASSIGN")
+                value = self.expr()
+                self.expect("SEMI")
+                return SliceAssignment(name, index, end, value)
+            self.expect("RSQUARE")
+            self.expect("ASSIGN")
+            value = self.expr()
+            self.expect("SEMI")
+            return ArrayAssignment(name, index, value)
+        elif kind == "LPAREN":
+            call = self.function_call(name)
+            self.expect("SEMI")
+            return call
+        elif kind in DIRECTIONS and name == "slide":
+            node = Slide(self.advance())
+            self.expect("SEMI")
+            return node
+        self.error()
+
+    def condition(self) -> AST:
+        self.advance()
+        self.expect("LPAREN")
+        expr = self.expr()
+        self.expect("RPAREN")
+        return expr
+
+    def function_decl(self) -> FunctionDecl:
+        self.advance()
+        name = self.expect("IDENTIFIER")
+        self.expect("LPAREN")
+        params = []
+        if self.peek() != "RPAREN":
+            params.append(self.expect("IDENTIFIER"))
+            while self.peek() == "COMMA":
+                self.advance()
+                params.append(self.expect("IDENTIFIER"))
+        self.expect("RPAREN")
+        return FunctionDecl(name, params, self.block())
+
+    def function_call(self, name: str) -> FunctionCall:
+        self.advance()
+        arguments = []
+        if self.peek() != "RPAREN":
+            arguments.append(self.expr())
+            while self.peek() == "COMMA":
+                self.advance()
+                arguments.append(self.expr())
+        self.expect("RPAREN")
+        return FunctionCall(name, arguments)
+
+    # --- выражения ---
+
+    def expr(self, min_prec: int = 1) -> AST:
+        left = self.unary()
+        while True:
+            kind = self.peek()
+            prec = BINARY_PRECEDENCE.get(kind)
+            if prec is None or prec < min_prec:
+                return left
+            self.advance()
+            right = self.expr(prec if kind in RIGHT_ASSOC else prec + 1)
+            left = BinOp(left, Op[kind], right)
+
+    def unary(self) -> AST:
+        kind = self.peek()
+        if kind == "MINUS":
+            self.advance()
+            # Как в p_expr_uminus
+            return BinOp(Num(-1), Op.MUL, self.unary())
+        elif kind == "MUL":
+            self.advance()
+            return Unarop(self.unary())
+        return self.primary()
+
+    def primary(self) -> AST:
+        kind = self.peek()
+        if kind == "NUMBER":
+            return Num(self.advance())
+        elif kind == "IDENTIFIER":
+            name = self.advance()
+            if self.peek() == "LPAREN":
+                return self.function_call(name)
+            if self.peek() == "LSQUARE":
+                self.advance()
+                start = self.expr()
+                self.expect("COLON")
+                end = self.expr()
+                self.expect("RSQUARE")
+                return ArraySlice(name, start, end)
+            if name == "slide" and self.peek() in DIRECTIONS:
+                return Slide(self.advance())
+            return Var(name)
+        elif kind == "LPAREN":
+            self.advance()
+            expr = self.expr()
+            self.expect("RPAREN")
+            return expr
+        elif kind == "STRING":
+            return Str(self.advance())
+        elif kind == "QUESTION_MARK":
+            self.advance()
+            return LenOf(Var(self.expect("IDENTIFIER")))
+        elif kind == "AMPERSAND":
+            self.advance()
+            return AddressOf(self.expect("IDENTIFIER"))
+        self.error()
@@ -0,0 +1,178 @@
+"""Профилировщик исполнения для движка tree.
+
+    python -m src.profiler program.test [--top N] [--collapsed out.folded]
+
+Interpreter(robot, profiler=Profiler()) на время interpret подменяет
+visit экземпляра обёрткой, которая считает для каждого узла:
+тип узла, функцию пользователя, в которой он исполняется, и строку
+оператора (Statement.lineno). Без профилировщика visit не меняется,
+так что обычный запуск ничего не платит.
+"""
+import argparse
+import time
+from collections import defaultdict
+
+from src.logic import FunctionCall, FunctionDecl
+
+# Кадр верхнего уровня в стеках вызовов
+TOP_LEVEL = "<program>"
+
+
+class Stats:
+    """Число исполнений и время: inclusive - с вложенными узлами или
+    вызовами (у рекурсии считается только внешний), exclusive - без."""
+
+    __slots__ = ("count", "inclusive", "exclusive", "active")
+
+    def __init__(self):
+        self.count = 0
+        self.inclusive = 0.0
+        self.exclusive = 0.0
+        self.active = 0  # сколько раз сейчас на стеке
+
+
+class Profiler:
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self.nodes: dict[str, Stats] = defaultdict(Stats)
+        self.functions: dict[str, Stats] = defaultdict(Stats)
+        self.lines: dict[int, Stats] = defaultdict(Stats)
+        # "f;g;h" -> время, проведённое в h при таком стеке вызовов
+        self.stacks: dict[str, float] = defaultdict(float)
+        self.total = 0.0
+        self._started = None
+
+    def start(self, interp):
+        interp.visit = self.wrap(interp, type(interp).visit.__get__(interp))
+        self._started = self.clock()
+
+    def stop(self, interp):
+        self.total += self.clock() - self._started
+        interp.__dict__.pop("visit", None)
+
+    def wrap(self, interp, visit):
+        clock = self.clock
+        nodes, functions, lines = self.nodes, self.functions, self.lines
+        stacks = self.stacks
+        global_env = interp.global_env
+        # Время вложенных узлов и вложенных вызовов текущего узла/функции
+        node_children = [0.0]
+        call_children = [0.0]
+        paths = [TOP_LEVEL]
+        statements = [0]
+
+        def enter(stats: Stats):
+            stats.count += 1
+            stats.active += 1
+
+        def leave(stats: Stats, elapsed: float, own: float):
+            stats.active -= 1
+            if not stats.active:
+                stats.inclusive += elapsed
+            stats.exclusive += own
+
+        def profiled(node):
+            kind = nodes[type(node).__name__]
+            lineno = getattr(node, "lineno", 0)
+            line = lines[lineno or statements[-1]]
+            if lineno:
+                statements.append(lineno)
+                enter(line)
+            call = None
+            if type(node) is FunctionCall:
+                decl = global_env.get(node.name)
+                if isinstance(decl, FunctionDecl):
+                    label = f"{node.name}:{getattr(decl, 'lineno', 0)}"
+                else:
+                    label = node.name
+                call = functions[label]
+                enter(call)
+                paths.append(paths[-1] + ";" + label)
+                call_children.append(0.0)
+            enter(kind)
+            node_children.append(0.0)
+            start = clock()
+            try:
+                return visit(node)
+            finally:
+                elapsed = clock() - start
+                own = elapsed - node_children.pop()
+                node_children[-1] += elapsed
+                leave(kind, elapsed, own)
+                stacks[paths[-1]] += own
+                if lineno:
+                    statements.pop()
+                    leave(line, elapsed, own)
+                else:
+                    line.exclusive += own
+                if call is not None:
+                    paths.pop()
+                    call_own = elapsed - call_children.pop()
+                    call_children[-1] += elapsed
+                    leave(call, elapsed, call_own)
+
+        return profiled
+
+    def report(self, top: int = 20) -> str:
+        """Таблицы по типам узлов, функциям и строкам, самые долгие
+        (по exclusive) сверху."""
+        out = [f"total {self.total * 1000:.3f} ms"]
+        for title, table in (
+            ("node", self.nodes),
+            ("function", self.functions),
+            ("line", self.lines),
+        ):
+            out.append("")
+            out.append(
+                f"{title:<24} {'count':>10} {'incl ms':>10} {'excl ms':>10}"
+                f" {'excl %':>7}"
+            )
+            rows = sorted(
+                table.items(),
+                key=lambda item: item[1].exclusive,
+                reverse=True,
+            )
+            total = self.total or 1.0
+            for key, stats in rows[:top]:
+                share = stats.exclusive / total * 100
+                out.append(
+                    f"{str(key):<24} {stats.count:>10}"
+                    f" {stats.inclusive * 1000:>10.3f}"
+                    f" {stats.exclusive * 1000:>10.3f} {share:>6.1f}%"
+                )
+        return "\n".join(out)
+
+    def collapsed(self) -> str:
+        """Стеки в формате collapsed (flamegraph.pl, speedscope):
+        "кадр;кадр;кадр микросекунды" на строку."""
+        return "".join(
+            f"{path} {round(seconds * 1e6)}\n"
+            for path, seconds in sorted(self.stacks.items())
+            if round(seconds * 1e6)
+        )
+
+
+def main():
+    from src.interpreter import Interpreter, Robot
+    from src.lexer import get_lexer
+    from src.parser import get_parser
+
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("program")
+    arg_parser.add_argument("--top", type=int, default=20)
+    arg_parser.add_argument("--collapsed", help="куда записать стеки")
+    args = arg_parser.parse_args()
+
+    with open(args.program) as inp:
+        tree = get_parser().parse(inp.read(), lexer=get_lexer())
+    profiler = Profiler()
+    robot = Robot([[0] * 5 for _ in range(5)])
+    Interpreter(robot, profiler=profiler).interpret(tree)
+    print(profiler.report(args.top))
+    if args.collapsed:
+        with open(args.collapsed, "w") as out:
+            out.write(profiler.collapsed())
+
+
+if __name__ == "__main__":
+    main()
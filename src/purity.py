@@ -0,0 +1,175 @@
+from collections import OrderedDict
+
+from src.builtins import BUILTINS
+from src.logic import *
+from src.resolver import GLOBAL
+from src.tailcalls import FreeReads, collect_functions
+
+# Результата нет в кэше
+MISS = object()
+
+# Типы аргументов, по которым можно строить ключ кэша
+KEY_TYPES = frozenset((int, float, str, bool))
+
+
+class Effects(FreeReads):
+    """Побочные эффекты и внешние зависимости тела функции.
+
+    impure - тело печатает, двигает робота, пишет в global_env,
+    объявляет функции или читает что-то кроме своих параметров и
+    локальных переменных (глобальные имена, массивы, адреса).
+    """
+
+    IMPURE_NODES = (
+        Print,
+        Move,
+        Slide,
+        PointerDecl,
+        ArrayDecl,
+        ArrayAssignment,
+        SliceAssignment,
+        ArrayAccess,
+        ArraySlice,
+        SizeOf,
+        AddressOf,
+        FunctionDecl,
+    )
+
+    def __init__(self, func: FunctionDecl):
+        self.impure = False
+        super().__init__(func)
+
+    def visit(self, node):
+        if isinstance(node, self.IMPURE_NODES):
+            self.impure = True
+            return
+        return super().visit(node)
+
+    def visit_Var(self, node: Var):
+        if node.slot == GLOBAL:
+            self.impure = True
+        super().visit_Var(node)
+
+    def visit_VarDecl(self, node: VarDecl):
+        if node.slot < 0:
+            self.impure = True
+        super().visit_VarDecl(node)
+
+
+class Purity:
+    """Находит функции без побочных эффектов: множество pure.
+
+    Функция чистая, если её тело не имеет Effects, не читает имён из
+    кадров вызывающих и вызывает только чистые функции (по всем
+    объявлениям с этим именем). Рекурсия допустима: считаем всё чистым
+    и убираем функции, пока множество не перестанет меняться.
+    Как и TailCalls, помнит функции всех разобранных программ.
+    Вердикт хранится здесь, а не в узле: узлы общие у веток (fork),
+    а функции веток - свои.
+    """
+
+    def __init__(self):
+        self.functions: dict[str, list[FunctionDecl]] = {}
+        self.pure: set[FunctionDecl] = set()
+
+    def copy(self) -> "Purity":
+        other = Purity()
+        other.functions = {
+            name: list(decls) for name, decls in self.functions.items()
+        }
+        other.pure = set(self.pure)
+        return other
+
+    def mark(self, tree: list[AST]) -> bool:
+        """Возвращает True, если появились новые функции."""
+        decls = collect_functions(tree)
+        if not decls:
+            return False
+        for decl in decls:
+            self.functions.setdefault(decl.name, []).append(decl)
+
+        local = {}
+        for decls in self.functions.values():
+            for decl in decls:
+                effects = Effects(decl)
+                pure = not (effects.impure or effects.any or effects.reads)
+                local[decl] = pure, effects.calls
+
+        # Встроенные чистые функции, если имя не занято объявлением
+        pure_names = set(self.functions) | {
+            name
+            for name, builtin in BUILTINS.items()
+            if builtin.pure and name not in self.functions
+        }
+        changed = True
+        while changed:
+            changed = False
+            for name in list(pure_names & self.functions.keys()):
+                for decl in self.functions[name]:
+                    pure, calls = local[decl]
+                    if not pure or not calls <= pure_names:
+                        pure_names.discard(name)
+                        changed = True
+                        break
+
+        # На месте: на это множество ссылается MemoCache
+        self.pure.clear()
+        self.pure.update(
+            decl
+            for decl, (pure, calls) in local.items()
+            if pure and calls <= pure_names
+        )
+        return True
+
+
+class MemoCache:
+    """LRU-кэш результатов чистых функций одного интерпретатора.
+
+    Ключ - объявление функции и аргументы вместе с их типами (чтобы
+    1, 1.0 и True не совпадали). maxsize=0 отключает кэш.
+    pure - множество чистых функций (Purity.pure).
+    """
+
+    def __init__(self, maxsize: int = 1024, pure: set = None):
+        self.maxsize = maxsize
+        self.pure: set[FunctionDecl] = pure if pure is not None else set()
+        self.entries: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, func: FunctionDecl, args: list):
+        if not self.maxsize or func not in self.pure:
+            return None
+        count = len(func.params)
+        if len(args) < count:
+            return None  # недостающий параметр ищется у вызывающего
+        args = tuple(args[:count])
+        types = tuple(map(type, args))
+        if not KEY_TYPES.issuperset(types):
+            return None
+        return func, args, types
+
+    def lookup(self, key):
+        result = self.entries.get(key, MISS)
+        if result is MISS:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.entries.move_to_end(key)
+        return result
+
+    def store(self, key, result):
+        self.entries[key] = result
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self.entries),
+            "maxsize": self.maxsize,
+        }
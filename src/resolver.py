@@ -0,0 +1,172 @@
+from src.logic import *
+from src.visitor import NodeVisitor
+
+# Адреса переменных вне кадра функции
+GLOBAL = -1  # имя нигде не локально: только global_env
+DYNAMIC = -2  # имя локально в какой-то функции: ищем по цепочке вызовов
+
+
+class _Unset:
+    def __repr__(self):
+        return "<unset>"
+
+
+# Значение слота, которому ещё ничего не присвоили
+UNSET = _Unset()
+
+
+class Scope:
+    """Раскладка кадра функции: параметры, затем присваиваемые имена."""
+
+    __slots__ = ("names", "index", "param_slots")
+
+    def __init__(self, params: list[str]):
+        self.names: list[str] = []
+        self.index: dict[str, int] = {}
+        self.param_slots = [self.add(param) for param in params]
+
+    def add(self, name: str) -> int:
+        slot = self.index.get(name)
+        if slot is None:
+            slot = self.index[name] = len(self.names)
+            self.names.append(name)
+        return slot
+
+    def new_frame(self, args: list) -> "Frame":
+        values = [UNSET] * len(self.names)
+        for slot, value in zip(self.param_slots, args):
+            values[slot] = value
+        return Frame(self, values)
+
+
+class Frame:
+    __slots__ = ("scope", "values")
+
+    def __init__(self, scope: Scope, values: list):
+        self.scope = scope
+        self.values = values
+
+    def get(self, name: str):
+        slot = self.scope.index.get(name)
+        if slot is None:
+            return UNSET
+        return self.values[slot]
+
+
+class Resolver(NodeVisitor):
+    """Назначает переменным адреса до исполнения.
+
+    Var и VarDecl получают атрибут slot: индекс в кадре текущей функции,
+    GLOBAL или DYNAMIC. FunctionDecl получает scope с раскладкой кадра.
+    Вызов функции тогда создаёт список фиксированной длины, а не копию
+    окружения вызывающего.
+
+    Один Resolver может разбирать программы одну за другой (interpret
+    того же Interpreter). Имя, прочитанное в функции как GLOBAL, станет
+    DYNAMIC, когда следующая программа объявит функцию с таким локальным
+    именем: старую функцию могут вызвать из новой.
+    """
+
+    def __init__(self, streaming: bool = False):
+        self.scope: Scope = None
+        # Имена, локальные хотя бы в одной функции
+        self.local_names: set[str] = set()
+        # При потоковом исполнении следующие функции ещё не разобраны,
+        # и нелокальное имя внутри функции может оказаться чужим локальным
+        self.streaming = streaming
+        # Var и VarDecl внутри функций, получившие GLOBAL, по имени
+        self.global_reads: dict[str, set[AST]] = {}
+
+    def copy(self) -> "Resolver":
+        other = Resolver(self.streaming)
+        other.local_names = set(self.local_names)
+        other.global_reads = {
+            name: set(nodes) for name, nodes in self.global_reads.items()
+        }
+        return other
+
+    def resolve(self, tree: list[AST]) -> list[AST]:
+        if tree is None:
+            return None
+        # Первый проход собирает раскладки всех функций, второй
+        # проставляет адреса, уже зная все локальные имена программы
+        self._declare_block(tree)
+        for name in self.local_names & self.global_reads.keys():
+            for node in self.global_reads.pop(name):
+                node.slot = DYNAMIC
+        self.visit_block(tree)
+        return tree
+
+    def _declare_block(self, statements: list[AST]):
+        for stmt in statements or []:
+            self._declare(stmt)
+
+    def _declare(self, node):
+        if isinstance(node, FunctionDecl):
+            outer, self.scope = self.scope, Scope(node.params)
+            self.local_names.update(node.params)
+            self._declare_block(node.body)
+            node.scope, self.scope = self.scope, outer
+            return
+        if self.scope is not None:
+            name = None
+            if isinstance(node, Assign):
+                name = node.left.value
+            elif isinstance(node, VarDecl):
+                name = node.var_name
+            if name is not None:
+                self.scope.add(name)
+                self.local_names.add(name)
+        for child in self.node_to_dict(node).values():
+            if isinstance(child, list):
+                self._declare_block(child)
+            elif isinstance(child, AST):
+                self._declare(child)
+
+    def visit(self, node):
+        if isinstance(node, AST):
+            return super().visit(node)
+
+    def visit_block(self, statements: list[AST]):
+        for stmt in statements or []:
+            self.visit(stmt)
+
+    def generic_visit(self, node):
+        for child in self.node_to_dict(node).values():
+            if isinstance(child, list):
+                self.visit_block(child)
+            else:
+                self.visit(child)
+
+    def address(self, name: str) -> int:
+        if self.scope is not None and name in self.scope.index:
+            return self.scope.index[name]
+        if self.scope is not None and (
+            self.streaming or name in self.local_names
+        ):
+            return DYNAMIC
+        return GLOBAL
+
+    def bind(self, node, name: str):
+        slot = self.address(name)
+        if slot == GLOBAL and self.scope is not None:
+            if getattr(node, "slot", None) == DYNAMIC:
+                # Узел уже разобран другим Resolver, который знал
+                # локальное имя: DYNAMIC верен всегда, GLOBAL - нет
+                return
+            self.global_reads.setdefault(name, set()).add(node)
+        node.slot = slot
+
+    def visit_Var(self, node: Var):
+        self.bind(node, node.value)
+
+    def visit_VarDecl(self, node: VarDecl):
+        self.bind(node, node.var_name)
+        self.visit(node.init_value)
+
+    def visit_FunctionDecl(self, node: FunctionDecl):
+        outer, self.scope = self.scope, node.scope
+        try:
+            self.visit_block(node.body)
+        finally:
+            self.scope = outer
@@ -0,0 +1,336 @@
+"""Долгоживущий сервис исполнения программ на локальном сокете.
+
+    python -m src.server [--unix PATH | --port N] [--workers N]
+        [--engine E] [--grid N] [--time S] [--steps N] ...
+
+Протокол - JSON по строке в обе стороны. Запросы:
+    {"id": 1, "code": "...", "engine": "vm", "frontend": "ply",
+     "grid": 5 или [[0, 1], ...], "limits": {"steps": 10000}}
+    {"id": 2, "op": "stats"}
+    {"id": 3, "op": "health"}
+Ответ на программу - поля BatchResult (src/batch.py) и id запроса.
+По одному соединению можно слать запросы не дожидаясь ответов: они
+исполняются параллельно и отвечаются по готовности, с тем же id.
+
+Программы исполняются на пуле процессов (Worker из src/batch.py: парсер
+прогрет), каждая - с новыми Interpreter и Robot. Лимиты запроса не
+могут превышать лимитов сервера (--time и т.д.). Клиент - src/client.py.
+"""
+import argparse
+import asyncio
+import json
+import os
+import signal
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from src.batch import Worker
+from src.grid import Grid
+from src.interpreter import ENGINE_HELP, ENGINES
+from src.limits import Limits
+from src.parser import FRONTENDS
+
+DEFAULT_SOCKET = os.path.join(tempfile.gettempdir(), "robot-lang.sock")
+DEFAULT_HOST = "127.0.0.1"
+# Самая длинная строка запроса (исходник целиком)
+MAX_REQUEST = 16 << 20
+# Сторона карты, заданной числом
+MAX_GRID = 4096
+# Сколько запросов одного соединения может исполняться одновременно
+MAX_PENDING = 64
+
+_worker: Worker = None
+
+
+def _init_worker(engine: str, frontend: str, grid_size: int):
+    global _worker
+    _worker = Worker(engine, frontend, grid_size)
+
+
+def _execute(code: str, grid, engine: str, frontend: str, limits: Limits):
+    if isinstance(grid, int):
+        grid = Grid(grid, grid)
+    return _worker.execute("<request>", code, grid, engine, frontend, limits)
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+class BadRequest(Exception):
+    pass
+
+
+class Stats:
+    """Счётчики сервиса для {"op": "stats"}."""
+
+    def __init__(self, window: int = 1000):
+        self.started = time.monotonic()
+        self.connections = 0  # открытые сейчас
+        self.requests = 0
+        self.completed = 0
+        self.failed = 0  # исполнены с ошибкой
+        self.rejected = 0  # неверный запрос
+        self.in_flight = 0
+        # Время ответа последних window программ
+        self.latencies = deque(maxlen=window)
+
+    def to_dict(self) -> dict:
+        latencies = sorted(self.latencies)
+
+        def percentile(share: float) -> float:
+            if not latencies:
+                return 0.0
+            index = min(len(latencies) - 1, int(len(latencies) * share))
+            return latencies[index]
+
+        return {
+            "uptime": round(time.monotonic() - self.started, 3),
+            "connections": self.connections,
+            "requests": self.requests,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "in_flight": self.in_flight,
+            "latency_p50": round(percentile(0.5), 6),
+            "latency_p99": round(percentile(0.99), 6),
+        }
+
+
+class Server:
+    def __init__(
+        self,
+        workers: int = None,
+        engine: str = "tree",
+        frontend: str = "ply",
+        grid_size: int = 5,
+        max_limits: Limits = None,
+        max_pending: int = MAX_PENDING,
+    ):
+        self.workers = workers or os.cpu_count() or 1
+        self.engine = engine
+        self.frontend = frontend
+        self.grid_size = grid_size
+        self.max_limits = max_limits or Limits()
+        self.max_pending = max_pending
+        self.stats = Stats()
+        self.pool: ProcessPoolExecutor = None
+
+    def start_pool(self):
+        self.pool = ProcessPoolExecutor(
+            self.workers,
+            initializer=_init_worker,
+            initargs=(self.engine, self.frontend, self.grid_size),
+        )
+
+    async def warm_up(self):
+        """Запускает все процессы пула заранее, а не на первых запросах."""
+        if self.pool is None:
+            self.start_pool()
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *(
+                loop.run_in_executor(self.pool, _ping)
+                for _ in range(self.workers)
+            )
+        )
+
+    def close(self, wait: bool = True):
+        """Останавливает пул; wait - дождаться исполняемых программ
+        (их время ограничено лимитами сервера)."""
+        if self.pool is not None:
+            self.pool.shutdown(wait=wait, cancel_futures=True)
+            self.pool = None
+
+    async def handle(self, reader, writer):
+        """Одно соединение: запросы читаются, пока предыдущие ещё
+        исполняются, ответы пишутся по готовности."""
+        self.stats.connections += 1
+        slots = asyncio.Semaphore(self.max_pending)
+        lock = asyncio.Lock()
+        pending = set()
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # Строка длиннее MAX_REQUEST: дальше поток не разобрать
+                    self.stats.rejected += 1
+                    await self.send(
+                        writer, lock, self.error(None, "Request is too long")
+                    )
+                    break
+                if not line:
+                    break
+                await slots.acquire()
+                task = asyncio.create_task(
+                    self.respond(line, writer, lock, slots)
+                )
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+            if pending:
+                await asyncio.wait(pending)
+        except ConnectionError:
+            pass
+        finally:
+            self.stats.connections -= 1
+            writer.close()
+
+    async def respond(self, line: bytes, writer, lock, slots):
+        try:
+            response = await self.dispatch(line)
+            await self.send(writer, lock, response)
+        except ConnectionError:
+            pass
+        finally:
+            slots.release()
+
+    async def send(self, writer, lock, response: dict):
+        async with lock:
+            writer.write(json.dumps(response).encode() + b"\n")
+            await writer.drain()
+
+    @staticmethod
+    def error(request_id, message: str) -> dict:
+        return {"id": request_id, "ok": False, "error": message}
+
+    async def dispatch(self, line: bytes) -> dict:
+        self.stats.requests += 1
+        request_id = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise BadRequest("Request must be a JSON object")
+            request_id = request.get("id")
+            op = request.get("op", "run")
+            if op == "health":
+                return {"id": request_id, "ok": True, "status": "ok"}
+            if op == "stats":
+                stats = self.stats.to_dict()
+                stats["workers"] = self.workers
+                stats["limits"] = self.max_limits.to_dict()
+                return {"id": request_id, "ok": True, "stats": stats}
+            if op != "run":
+                raise BadRequest(f"Unknown op: {op}")
+            job = self.job(request)
+        except (BadRequest, ValueError, TypeError) as e:
+            self.stats.rejected += 1
+            return self.error(request_id, f"Bad request: {e}")
+        return {"id": request_id, **await self.run(job)}
+
+    def job(self, request: dict) -> tuple:
+        """Аргументы _execute из запроса; BadRequest - если он неверен."""
+        code = request.get("code")
+        if not isinstance(code, str):
+            raise BadRequest("`code` must be a string")
+        engine = request.get("engine", self.engine)
+        if engine not in ENGINES:
+            raise BadRequest(f"Unknown engine: {engine}")
+        frontend = request.get("frontend", self.frontend)
+        if frontend not in FRONTENDS:
+            raise BadRequest(f"Unknown frontend: {frontend}")
+        grid = request.get("grid", self.grid_size)
+        if isinstance(grid, int):
+            if not 0 < grid <= MAX_GRID:
+                raise BadRequest(f"Grid size must be in 1..{MAX_GRID}")
+        elif not (
+            isinstance(grid, list)
+            and grid
+            and all(isinstance(row, list) for row in grid)
+        ):
+            raise BadRequest("`grid` must be a size or a list of rows")
+        limits = request.get("limits") or {}
+        if not isinstance(limits, dict):
+            raise BadRequest("`limits` must be an object")
+        limits = Limits(**limits).within(self.max_limits)
+        return code, grid, engine, frontend, limits
+
+    async def run(self, job: tuple) -> dict:
+        loop = asyncio.get_running_loop()
+        stats = self.stats
+        pool = self.pool
+        stats.in_flight += 1
+        t0 = time.perf_counter()
+        try:
+            result = await loop.run_in_executor(pool, _execute, *job)
+            response = result.to_dict()
+            stats.completed += 1
+            stats.failed += not result.ok
+        except BrokenProcessPool:
+            # Процесс пула упал (например, переполнение стека C): ответ -
+            # ошибка, пул создаётся заново (один раз на все его запросы)
+            if self.pool is pool:
+                self.close(wait=False)
+                self.start_pool()
+            stats.failed += 1
+            response = {"ok": False, "error": "Worker process died"}
+        finally:
+            stats.in_flight -= 1
+            stats.latencies.append(time.perf_counter() - t0)
+        return response
+
+    async def serve(
+        self, unix: str = None, host: str = None, port: int = None
+    ):
+        await self.warm_up()
+        if unix is not None:
+            if os.path.exists(unix):
+                os.unlink(unix)
+            server = await asyncio.start_unix_server(
+                self.handle, path=unix, limit=MAX_REQUEST
+            )
+        else:
+            server = await asyncio.start_server(
+                self.handle, host or DEFAULT_HOST, port, limit=MAX_REQUEST
+            )
+        where = unix or "%s:%d" % server.sockets[0].getsockname()[:2]
+        print(f"serving on {where} with {self.workers} workers", flush=True)
+        # SIGINT и SIGTERM: перестать принимать соединения и выйти,
+        # пул закрывает main
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, stop.set)
+        async with server:
+            await stop.wait()
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--unix", help=f"сокет, иначе {DEFAULT_SOCKET}")
+    arg_parser.add_argument("--host", default=DEFAULT_HOST)
+    arg_parser.add_argument("--port", type=int, help="TCP вместо сокета")
+    arg_parser.add_argument("--workers", type=int)
+    arg_parser.add_argument(
+        "--engine", default="tree", choices=ENGINES, help=ENGINE_HELP
+    )
+    arg_parser.add_argument("--frontend", default="ply", choices=FRONTENDS)
+    arg_parser.add_argument("--grid", type=int, default=5)
+    # Лимиты сервера: запрос может их только уменьшить
+    arg_parser.add_argument("--steps", type=int)
+    arg_parser.add_argument("--time", type=float, default=10.0)
+    arg_parser.add_argument("--array-elements", type=int)
+    arg_parser.add_argument("--depth", type=int)
+    args = arg_parser.parse_args()
+
+    server = Server(
+        args.workers,
+        args.engine,
+        args.frontend,
+        args.grid,
+        Limits(args.steps, args.time, args.array_elements, args.depth),
+    )
+    unix = None if args.port is not None else args.unix or DEFAULT_SOCKET
+    try:
+        asyncio.run(server.serve(unix, args.host, args.port))
+    finally:
+        server.close()
+        if unix is not None and os.path.exists(unix):
+            os.unlink(unix)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+from src.arrays import is_array
+from src.exception import InterpError
+
+
+class Snapshot:
+    """Состояние Interpreter между запусками interpret.
+
+    Хранит копии таблиц имён (global_env и адреса Variables) и позицию
+    робота. Значения не копируются: числа и строки неизменяемы, а
+    массивы становятся общими - Interpreter копирует общий массив при
+    первой записи в него (own_array), так что снимок не меняется.
+    Карта робота тоже общая: язык её не меняет. Снимок держит массивы,
+    пока жив; отпущенный снимок их больше не держит, и
+    Interpreter.shared_arrays забывает их вместе с массивами.
+    Снимок и restore стоят O(n) по числу имён.
+    """
+
+    __slots__ = ("global_env", "variables", "position", "arrays")
+
+    def __init__(self, interp):
+        if interp.call_stack:
+            raise InterpError("Cannot snapshot while a function is running")
+        self.global_env = dict(interp.global_env)
+        self.variables = interp.variables.copy()
+        self.position = interp.robot.position
+        self.arrays = tuple(
+            value for value in self.global_env.values() if is_array(value)
+        )
+        interp.share_arrays(self.arrays)
+
+    def apply(self, interp):
+        """Возвращает interp в состояние снимка; снимок можно применять
+        сколько угодно раз и к разным интерпретаторам."""
+        if interp.call_stack:
+            raise InterpError("Cannot restore while a function is running")
+        # global_env меняется на месте: на словарь могут ссылаться
+        interp.global_env.clear()
+        interp.global_env.update(self.global_env)
+        interp.variables = self.variables.copy()
+        interp.robot.position = self.position
+        interp.share_arrays(self.arrays)
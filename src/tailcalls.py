@@ -0,0 +1,199 @@
+from src.builtins import BUILTINS
+from src.logic import *
+from src.resolver import DYNAMIC
+from src.visitor import NodeVisitor
+
+# Функция может прочитать любое имя по цепочке вызовов (разыменование)
+ANY = None
+
+
+def collect_functions(node, decls: list = None) -> list[FunctionDecl]:
+    """Все FunctionDecl дерева, включая вложенные."""
+    if decls is None:
+        decls = []
+    if isinstance(node, list):
+        for child in node:
+            collect_functions(child, decls)
+    elif isinstance(node, AST):
+        if isinstance(node, FunctionDecl):
+            decls.append(node)
+        for child in NodeVisitor().node_to_dict(node).values():
+            if isinstance(child, (AST, list)):
+                collect_functions(child, decls)
+    return decls
+
+
+class FreeReads(NodeVisitor):
+    """Имена, которые тело функции может искать в кадрах вызывающих.
+
+    Это DYNAMIC-переменные и локальные, прочитанные до того, как им
+    наверняка что-то присвоено (пустой слот ищется у вызывающих).
+    Разыменование *p ищет имя по всей цепочке, тогда результат - ANY.
+    """
+
+    def __init__(self, func: FunctionDecl):
+        self.reads: set[str] = set()
+        self.calls: set[str] = set()
+        self.any = False
+        self.assigned = set(func.params)
+        self.visit_block(func.body)
+
+    def visit(self, node):
+        if isinstance(node, AST):
+            return super().visit(node)
+
+    def visit_block(self, statements: list[AST]):
+        for stmt in statements or []:
+            self.visit(stmt)
+
+    def generic_visit(self, node):
+        for child in self.node_to_dict(node).values():
+            if isinstance(child, list):
+                self.visit_block(child)
+            else:
+                self.visit(child)
+
+    def visit_Var(self, node: Var):
+        if node.slot == DYNAMIC or (
+            node.slot >= 0 and node.value not in self.assigned
+        ):
+            self.reads.add(node.value)
+
+    def visit_Assign(self, node: Assign):
+        self.visit(node.right)
+        self.assigned.add(node.left.value)
+
+    def visit_VarDecl(self, node: VarDecl):
+        self.visit(node.init_value)
+        self.assigned.add(node.var_name)
+
+    def visit_Unarop(self, node: Unarop):
+        self.any = True
+        self.visit(node.expr)
+
+    def visit_FunctionCall(self, node: FunctionCall):
+        self.calls.add(node.name)
+        self.visit_block(node.arguments)
+
+    def visit_FunctionDecl(self, node: FunctionDecl):
+        pass  # тело разбирается, когда функцию вызовут
+
+    def visit_If(self, node: If):
+        self.visit(node.condition)
+        before = self.assigned
+        self.assigned = set(before)
+        self.visit_block(node.true_branch)
+        true_assigned = self.assigned
+        self.assigned = set(before)
+        self.visit_block(node.false_branch)
+        self.assigned &= true_assigned
+
+    def visit_While(self, node: While):
+        self.visit(node.condition)
+        before = self.assigned
+        self.assigned = set(before)
+        self.visit_block(node.body)
+        self.assigned = set(before)
+        self.visit_block(node.instead_body)
+        self.assigned = before
+
+
+class TailCalls(NodeVisitor):
+    """Находит хвостовые вызовы для VM: множество tail.
+
+    Хвостовой вызов - `return f(...)` или просто `f(...)` последним
+    оператором функции (в том числе в последнем операторе ветки If).
+    Его результат и так становится результатом функции, поэтому VM
+    заменяет кадр вызывающего вместо того, чтобы класть новый.
+
+    Из-за динамической области видимости это допустимо, только если
+    f и все функции, которые она может вызвать, не читают из кадров
+    вызывающих ни одного имени, локального для снимаемого кадра.
+    Функции собираются со всех разобранных программ: имя в global_env
+    могло остаться от прошлого interpret. Новая функция может сделать
+    небезопасным уже найденный вызов, поэтому mark пересматривает все
+    функции, а вызов ещё не объявленной функции не хвостовой: она
+    может прочитать что угодно. Как и у Purity, результат хранится
+    здесь, а не в узлах, общих у веток.
+    """
+
+    def __init__(self):
+        self.functions: dict[str, list[FunctionDecl]] = {}
+        self._reads: dict[str, set[str]] = None
+        self.tail: set[FunctionCall] = set()
+
+    def copy(self) -> "TailCalls":
+        other = TailCalls()
+        other.functions = {
+            name: list(decls) for name, decls in self.functions.items()
+        }
+        other._reads = self._reads
+        other.tail = set(self.tail)
+        return other
+
+    def mark(self, tree: list[AST]):
+        decls = collect_functions(tree)
+        if not decls:
+            return
+        for decl in decls:
+            self.functions.setdefault(decl.name, []).append(decl)
+        self._reads = self._transitive_reads()
+        # На месте: на это множество ссылается Compiler
+        self.tail.clear()
+        for decls in self.functions.values():
+            for decl in decls:
+                self._mark_tail(decl, decl.body)
+
+    def _transitive_reads(self) -> dict:
+        own = {}
+        for name, decls in self.functions.items():
+            reads, calls = set(), set()
+            for decl in decls:
+                free = FreeReads(decl)
+                if free.any:
+                    reads = ANY
+                    break
+                reads |= free.reads
+                calls |= free.calls
+            own[name] = reads, calls
+
+        # Неподвижная точка по графу вызовов
+        result = {name: reads for name, (reads, _) in own.items()}
+        # Встроенные функции не читают переменных вызывающего
+        for name in BUILTINS.keys() - result.keys():
+            result[name] = frozenset()
+        changed = True
+        while changed:
+            changed = False
+            for name, (_, calls) in own.items():
+                reads = result[name]
+                if reads is ANY:
+                    continue
+                for callee in calls:
+                    extra = result.get(callee, ANY)
+                    if extra is ANY:
+                        reads = ANY
+                        break
+                    if not extra <= reads:
+                        reads = reads | extra
+                if reads is ANY or reads != result[name]:
+                    result[name] = reads
+                    changed = True
+        return result
+
+    def _mark_tail(self, func: FunctionDecl, body: list[AST]):
+        if not body:
+            return
+        last = body[-1]
+        if isinstance(last, If):
+            self._mark_tail(func, last.true_branch)
+            self._mark_tail(func, last.false_branch)
+            return
+        call = last.expr if isinstance(last, Return) else last
+        if not isinstance(call, FunctionCall):
+            return
+        if call.name not in self._reads:
+            return  # функция не объявлена ни в одной программе
+        reads = self._reads[call.name]
+        if reads is not ANY and reads.isdisjoint(func.scope.names):
+            self.tail.add(call)
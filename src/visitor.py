@@ -0,0 +1,39 @@
+from src.logic import AST
+
+
+class NodeVisitor:
+    def visit(self, node):
+        if isinstance(node, str):
+            print(node)
+        method_name = "visit_" + type(node).__name__
+        visitor = getattr(self, method_name, self.generic_visit)
+        return visitor(node)
+
+    def generic_visit(self, node):
+        raise Exception(f"No visit_{type(node).__name__} method")
+
+    def print_ast(self, node, indent=""):
+        if isinstance(node, list):
+            for n in node:
+                self.print_ast(n, indent)
+        else:
+            print(f"{indent}{type(node).__name__}: {self.node_to_dict(node)}")
+            indent += "  "
+            for child in self.node_to_dict(node).values():
+                if isinstance(child, (AST, list)):
+                    self.print_ast(child, indent)
+
+    def node_to_dict(self, node):
+        if hasattr(node, "__dict__"):
+            return vars(node)
+        elif hasattr(node, "__slots__"):
+            # Как vars(): только заполненные поля, включая слоты базовых
+            # классов
+            return {
+                slot: getattr(node, slot)
+                for cls in reversed(type(node).__mro__)
+                for slot in getattr(cls, "__slots__", ())
+                if hasattr(node, slot)
+            }
+        else:
+            return {}
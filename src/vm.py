@@ -0,0 +1,299 @@
+from src.builtins import resolve_function
+from src.compiler import *
+from src.exception import InterpError
+from src.logic import AST, FunctionDecl
+from src.purity import MISS
+from src.resolver import UNSET
+
+# Глубина стека вызовов по умолчанию (Interpreter.push_frame, все
+# движки). У vm кадры лежат в куче, так что предел задаёт только
+# память; tree и closure вызывают функции на стеке Python и раньше
+# упираются в sys.getrecursionlimit() - порядка сотни вложенных вызовов
+MAX_CALL_DEPTH = 2_000_000
+
+
+class VM:
+    """Стековая машина для байткода из src/compiler.py.
+
+    Состояние (global_env, call_stack, variables, robot)
+    берётся у Interpreter, поэтому вызовы функций и указатели ведут себя
+    так же, как в tree-walking режиме. Кадры вызовов хранятся в списке,
+    а не на стеке Python: глубина рекурсии ограничена только
+    interp.max_depth (проверяет Interpreter.push_frame). Хвостовые
+    вызовы (TAIL_CALL) заменяют кадр вызывающего.
+    """
+
+    def __init__(self, interp):
+        self.interp = interp
+        self.compiler = Compiler(interp.tail_calls.tail)
+        self.codes: dict[FunctionDecl, CodeObject] = {}
+        # Результат последнего выполненного оператора верхнего уровня
+        self.result = None
+
+    def code_for(self, func: FunctionDecl) -> CodeObject:
+        co = self.codes.get(func)
+        if co is None:
+            co = self.codes[func] = self.compiler.compile_function(func)
+        return co
+
+    def interpret(self, tree: list[AST]):
+        return self.run(self.compiler.compile(tree))
+
+    def run(self, co: CodeObject):
+        interp = self.interp
+        genv = interp.global_env
+        frame = interp.current_frame
+        fast = frame.values if frame is not None else None
+        call_stack = interp.call_stack
+        variables = interp.variables
+        code_for = self.code_for
+        # Лимиты (src/limits.py): шаг - обратный переход цикла или вызов
+        budget = interp.budget
+
+        frames = []
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        code, consts, names = co.code, co.consts, co.names
+        pc = 0
+        result = None
+        # Проверить результат на None при выходе из кадра: кадр заменил
+        # вызывающего в `return f(...)`
+        check = False
+        memo = interp.memo
+        # Ключ, под которым сохранить результат текущего кадра
+        memo_key = None
+
+        while True:
+            op = code[pc]
+            arg = code[pc + 1]
+            pc += 2
+
+            if op == LOAD_FAST:
+                value = fast[arg]
+                if value is UNSET:
+                    value = interp.lookup(frame.scope.names[arg])
+                push(value)
+            elif op == LOAD_GLOBAL:
+                name = names[arg]
+                if name in genv:
+                    push(genv[name])
+                else:
+                    raise Exception(f"Undefined variable: {name}")
+            elif op == LOAD_CONST:
+                push(consts[arg])
+            elif op == POP_RESULT:
+                result = pop()
+                if not frames:
+                    self.result = result
+            elif op >= BINARY_ADD_CONST:
+                # Правая часть - целая константа: без LOAD_CONST и
+                # проверки правого операнда на None
+                left = stack[-1]
+                right = consts[arg]
+                if left is None:
+                    raise Exception(
+                        f"Unexpected None value: left={left}, right={right}"
+                    )
+                if op == COMPARE_LT_CONST:
+                    stack[-1] = left < right
+                elif op == BINARY_ADD_CONST:
+                    stack[-1] = left + right
+                elif op == BINARY_SUB_CONST:
+                    stack[-1] = left - right
+                elif op == COMPARE_GT_CONST:
+                    stack[-1] = left > right
+                elif op == COMPARE_EQ_CONST:
+                    stack[-1] = left == right
+                elif op == BINARY_MUL_CONST:
+                    stack[-1] = left * right
+                elif op == COMPARE_NE_CONST:
+                    stack[-1] = left != right
+                elif op == COMPARE_LE_CONST:
+                    stack[-1] = left <= right
+                else:
+                    stack[-1] = left >= right
+            elif op <= COMPARE_GE and op >= BINARY_ADD:
+                right = pop()
+                left = stack[-1]
+                if left is None or right is None:
+                    raise Exception(
+                        f"Unexpected None value: left={left}, right={right}"
+                    )
+                if op == BINARY_ADD:
+                    stack[-1] = left + right
+                elif op == BINARY_SUB:
+                    stack[-1] = left - right
+                elif op == BINARY_MUL:
+                    stack[-1] = left * right
+                elif op == COMPARE_LT:
+                    stack[-1] = left < right
+                elif op == COMPARE_GT:
+                    stack[-1] = left > right
+                elif op == COMPARE_EQ:
+                    stack[-1] = left == right
+                elif op == BINARY_DIV:
+                    stack[-1] = left / right
+                elif op == COMPARE_NE:
+                    stack[-1] = left != right
+                elif op == COMPARE_LE:
+                    stack[-1] = left <= right
+                else:
+                    stack[-1] = left >= right
+            elif op == JUMP_IF_TRUE:
+                if pop():
+                    pc = arg
+                    if budget is not None:
+                        budget.tick()
+            elif op == JUMP_IF_FALSE:
+                if not pop():
+                    pc = arg
+            elif op == JUMP:
+                pc = arg
+            elif op == STORE_FAST:
+                fast[arg] = stack[-1]
+                variables.init_var(frame.scope.names[arg], len(call_stack))
+            elif op == STORE_NAME:
+                name = names[arg]
+                genv[name] = stack[-1]
+                variables.init_var(name, len(call_stack))
+            elif op == CLEAR_RESULT:
+                result = None
+            elif op == LOAD_FUNC:
+                func = genv.get(names[arg])
+                if type(func) is not FunctionDecl:
+                    func = resolve_function(genv, names[arg])
+                push(func)
+            elif op == CALL:
+                if arg:
+                    args = stack[-arg:]
+                    del stack[-arg:]
+                else:
+                    args = []
+                func = pop()
+                if type(func) is not FunctionDecl:
+                    push(func(interp, args))  # встроенная (src/builtins.py)
+                    continue
+                key = memo.key(func, args)
+                if key is not None:
+                    value = memo.lookup(key)
+                    if value is not MISS:
+                        push(value)
+                        continue
+                frames.append(
+                    (code, consts, names, pc, result, check, memo_key)
+                )
+                check = False
+                memo_key = key
+                frame = func.scope.new_frame(args)
+                fast = frame.values
+                interp.push_frame(frame)
+                callee = code_for(func)
+                code, consts, names = callee.code, callee.consts, callee.names
+                pc = 0
+                result = None
+            elif op == TAIL_CALL:
+                argc = arg >> 1
+                if argc:
+                    args = stack[-argc:]
+                    del stack[-argc:]
+                else:
+                    args = []
+                func = pop()
+                if type(func) is not FunctionDecl:
+                    # Встроенная: кадра нет, как возврат из обычного вызова
+                    push(func(interp, args))
+                    continue
+                key = memo.key(func, args)
+                if key is not None:
+                    value = memo.lookup(key)
+                    if value is not MISS:
+                        # Как возврат из обычного вызова
+                        push(value)
+                        continue
+                if frames and len(args) >= len(func.params):
+                    # Результат заменяемого кадра больше не сохраняем
+                    interp.pop_frame()
+                    check = check or arg & 1
+                else:
+                    # Недостающие параметры ищутся в кадре вызывающего,
+                    # его нельзя снимать: обычный вызов
+                    frames.append(
+                        (code, consts, names, pc, result, check, memo_key)
+                    )
+                    check = False
+                memo_key = key
+                frame = func.scope.new_frame(args)
+                fast = frame.values
+                interp.push_frame(frame)
+                callee = code_for(func)
+                code, consts, names = callee.code, callee.consts, callee.names
+                pc = 0
+                result = None
+            elif op == END:
+                if check and result is None:
+                    raise Exception("Return value is None")
+                if not frames:
+                    return result
+                if memo_key is not None:
+                    memo.store(memo_key, result)
+                push(result)
+                code, consts, names, pc, result, check, memo_key = (
+                    frames.pop()
+                )
+                interp.pop_frame()
+                frame = interp.current_frame
+                fast = frame.values if frame is not None else None
+            elif op == RETURN_VALUE:
+                if stack[-1] is None:
+                    raise Exception("Return value is None")
+            elif op == PRINT:
+                interp.output.print(stack[-1])
+            elif op == UNARY_NEG:
+                value = stack[-1]
+                if value is None:
+                    raise Exception(
+                        f"Unexpected None value: left=-1, right={value}"
+                    )
+                stack[-1] = -1 * value
+            elif op == LOAD_INDEX:
+                array = genv.get(names[arg])
+                if array is None:
+                    raise Exception(f"Array {names[arg]} not found.")
+                stack[-1] = interp.load_index(array, stack[-1])
+            elif op == STORE_INDEX:
+                value = pop()
+                stack[-1] = interp.store_index(names[arg], stack[-1], value)
+            elif op == SLICE:
+                end = pop()
+                stack[-1] = interp.slice_of(names[arg], stack[-1], end)
+            elif op == STORE_SLICE:
+                value = pop()
+                end = pop()
+                stack[-1] = interp.store_slice(
+                    names[arg], stack[-1], end, value
+                )
+            elif op == MOVE:
+                push(interp.move(consts[arg]))
+            elif op == SLIDE:
+                push(interp.slide(consts[arg]))
+            elif op == MAKE_FUNCTION:
+                interp.define_function(names[arg], stack[-1])
+            elif op == STORE_GLOBAL:
+                genv[names[arg]] = stack[-1]
+            elif op == LOAD_NAME:
+                push(interp.lookup(names[arg]))
+            elif op == SET_FAST:
+                fast[arg] = stack[-1]
+            elif op == MAKE_ARRAY:
+                stack[-1] = interp.declare_array(names[arg], stack[-1])
+            elif op == SIZE_OF:
+                push(interp.size_of(names[arg]))
+            elif op == LEN_OF:
+                stack[-1] = interp.len_of(stack[-1])
+            elif op == ADDRESS_OF:
+                push(interp.address_of(names[arg]))
+            elif op == DEREF:
+                stack[-1] = interp.deref(stack[-1])
+            else:
+                raise Exception(f"Unknown opcode {op}")
@@ -0,0 +1,256 @@
+"""Сверка движков tree, vm и closure на возможностях языка: хвостовые
+вызовы, кэш чистых функций, лимиты, снимки и ветки, кэш программ,
+срезы и встроенные функции.
+
+    python -m pytest test
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.cache import ProgramCache  # noqa: E402
+from src.exception import LimitExceeded  # noqa: E402
+from src.grid import BitGrid  # noqa: E402
+from src.interpreter import ENGINES, Interpreter, Robot  # noqa: E402
+from src.lexer import get_lexer  # noqa: E402
+from src.limits import Limits  # noqa: E402
+from src.output import CollectorSink  # noqa: E402
+from src.parser import FRONTENDS, get_parser  # noqa: E402
+
+LOOP = """
+function loop(n, acc) {
+    if (n = 0) {
+        return acc;
+    } else {
+        return loop(n - 1, acc + n);
+    }
+}
+"""
+
+# Не хвостовая рекурсия: кадр на каждый уровень на всех движках
+DEPTH = """
+function depth(n) {
+    if (n = 0) {
+        return 0;
+    } else {
+        return 1 + depth(n - 1);
+    }
+}
+"""
+
+
+def parse(code: str, frontend: str = "ply"):
+    return get_parser(frontend).parse(code, lexer=get_lexer())
+
+
+def new_interpreter(grid: int = 5, **kwargs) -> Interpreter:
+    robot = Robot([[0] * grid for _ in range(grid)])
+    return Interpreter(robot, output=CollectorSink(), **kwargs)
+
+
+def run(code: str, engine: str, frontend: str = "ply", **kwargs):
+    """Строки вывода программы и интерпретатор после неё."""
+    interp = new_interpreter(**kwargs)
+    interp.interpret(parse(code, frontend), engine=engine)
+    return interp.output.lines, interp
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_tail_recursion(engine):
+    lines, _ = run(LOOP + "print(loop(100, 0));", engine)
+    assert lines == ["5050"]
+
+
+def test_tail_recursion_reuses_frames_on_vm():
+    lines, _ = run(LOOP + "print(loop(10000, 0));", "vm", max_depth=50)
+    assert lines == ["50005000"]
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_tail_calls_rechecked_across_programs(engine):
+    # h читает параметр a функции f: кадр f нельзя снимать, хотя при
+    # разборе первой программы h ещё не была объявлена
+    interp = new_interpreter()
+    interp.interpret(
+        parse("function g() { return h(); } function f(a) { return g(); }"),
+        engine=engine,
+    )
+    interp.interpret(
+        parse("function h() { return a; } print(f(5));"), engine=engine
+    )
+    assert interp.output.lines == ["5"]
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_memo_caches_pure_functions_only(engine):
+    code = """
+function sq(n) { return n * n; }
+function loud(n) { print(n); return n; }
+print(sq(7) + sq(7));
+print(loud(1) + loud(1));
+"""
+    lines, interp = run(code, engine)
+    assert lines == ["98", "1", "1", "2"]
+    assert interp.memo.hits == 1
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_memo_sees_redefined_function(engine):
+    interp = new_interpreter()
+    interp.interpret(
+        parse("function f(n) { return n + 1; } print(f(1));"), engine=engine
+    )
+    interp.interpret(
+        parse("function f(n) { return n + 2; } print(f(1));"), engine=engine
+    )
+    assert interp.output.lines == ["2", "3"]
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+@pytest.mark.parametrize(
+    "code, limits, resource",
+    [
+        ("i := 0;\nwhile (1 < 2) { i := i + 1; }", Limits(steps=500), "steps"),
+        (DEPTH + "print(depth(100));", Limits(depth=20), "depth"),
+        (
+            "array integer of a (100);\nb := a + 1;\nc := -b;",
+            Limits(array_elements=250),
+            "array_elements",
+        ),
+        (
+            "array integer of a (100);\ni := 0;\n"
+            "while (i < 50) { a[] := i; i := i + 1; }",
+            Limits(steps=1000),
+            "steps",
+        ),
+        ("i := 0;\nwhile (1 < 2) { i := i + 1; }", Limits(time=0.05), "time"),
+    ],
+)
+def test_limits(engine, code, limits, resource):
+    interp = new_interpreter(memo_size=0)
+    with pytest.raises(LimitExceeded) as exc:
+        interp.interpret(parse(code), engine=engine, limits=limits)
+    assert exc.value.resource == resource
+    assert interp.budget.usage()["exceeded"] == resource
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_fork_copies_arrays_on_write(engine):
+    parent = new_interpreter()
+    parent.interpret(
+        parse("array integer of a (3);\na[1] := 7;\nb := a;\nx := 1;"),
+        engine=engine,
+    )
+    snapshot = parent.snapshot()
+    child = parent.fork(CollectorSink())
+    child.interpret(
+        parse("a[0] := 5;\na[1:3] := 9;\nx := 2;\nprint(b);"), engine=engine
+    )
+    # В ветке b - тот же массив, что и a; у родителя ничего не менялось
+    assert child.output.lines == ["[5, 9, 9]"]
+    assert parent.global_env["a"] == [0, 7, 0]
+    assert parent.global_env["x"] == 1
+
+    parent.interpret(parse("a[2] := 4;\nx := 3;"), engine=engine)
+    parent.restore(snapshot)
+    assert parent.global_env["a"] == [0, 7, 0]
+    assert parent.global_env["a"] is parent.global_env["b"]
+    assert parent.global_env["x"] == 1
+
+
+def test_shared_arrays_are_released():
+    interp = new_interpreter()
+    interp.interpret(parse("array integer of a (3);\nb := a + 1;"))
+    snapshot = interp.snapshot()
+    assert len(interp.shared_arrays) == 2
+    interp.interpret(parse("a := 0;\nb := 0;"))
+    del snapshot
+    assert not interp.shared_arrays
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_program_cache(engine, tmp_path):
+    code = LOOP + "array integer of a (4);\na[] := 2;\nprint(loop(sum(a), 0));"
+    cache = ProgramCache(tmp_path)
+    results = []
+    for _ in range(2):
+        interp = new_interpreter()
+        interp.interpret(cache.load(code), engine=engine, optimize=False)
+        results.append(interp.output.lines)
+    assert cache.misses == 1 and cache.hits == 1
+    assert results == [["36"], ["36"]]
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+@pytest.mark.parametrize("frontend", FRONTENDS)
+def test_slices_and_reductions(engine, frontend):
+    code = """
+array integer of a (5);
+a[] := 1;
+a[1:3] := 7;
+b := a[1:4];
+print(b);
+print(sum(a));
+print(min(b));
+print(max(a[3:5]));
+print(b * 2 - 1);
+print(a != b);
+print(3 <= 3);
+print(2 >= 3);
+"""
+    lines, _ = run(code, engine, frontend)
+    assert lines == [
+        "[7, 7, 1]",
+        "17",
+        "1",
+        "1",
+        "[13, 13, 1]",
+        "True",
+        "True",
+        "False",
+    ]
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+@pytest.mark.parametrize("frontend", FRONTENDS)
+def test_builtin_names_stay_usable(engine, frontend):
+    code = """
+array integer of a (3);
+a[2] := 4;
+sum := 10;
+slide := 1;
+function max(x, y) { if (x > y) { return x; } else { return y; } }
+function least(v) { return min(v); }
+print(sum + sum(a));
+print(max(2, 9));
+print(least(a));
+print(goto(1, 1));
+slide right;
+print(slide);
+"""
+    _, interp = run(code, engine, frontend)
+    assert interp.output.values == [14, 9, 0, 2, 1]
+    assert interp.robot.position == (4, 1)
+
+
+@pytest.mark.parametrize("engine", ("tree", "closure"))
+def test_deep_recursion_reports_error(engine, capsys):
+    lines, _ = run(DEPTH + "print(depth(5000));", engine)
+    assert lines == []
+    assert "use the vm engine" in capsys.readouterr().err
+
+
+def test_grid_rows():
+    robot = Robot([[0, 1, 0], [0, 0, 1]])
+    grid = robot.grid
+    assert grid[0][1] == 1 and grid[-1][-1] == 1
+    assert [list(row) for row in grid] == [[0, 1, 0], [0, 0, 1]]
+    grid[1][0] = 1
+    assert not grid.free(0, 1)
+    bits = BitGrid(4, 2)
+    bits[1][3] = 1
+    assert bits.to_rows() == [[0, 0, 0, 0], [0, 0, 0, 1]]